@@ -0,0 +1,31 @@
+"""ingest job mirror message
+
+Revision ID: 0b5e9d3a7c12
+Revises: f2c8a5d1b736
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0b5e9d3a7c12"
+down_revision: str | Sequence[str] | None = "f2c8a5d1b736"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("ingest_jobs", sa.Column("mirror_chat_id", sa.BigInteger(), nullable=True))
+    op.add_column("ingest_jobs", sa.Column("mirror_message_id", sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("ingest_jobs", "mirror_message_id")
+    op.drop_column("ingest_jobs", "mirror_chat_id")
@@ -0,0 +1,110 @@
+"""skill and specialization bitmasks
+
+Revision ID: 5e8f1a3c7b92
+Revises: d2b7c9e4a815
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e8f1a3c7b92"
+down_revision: str | Sequence[str] | None = "d2b7c9e4a815"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Frozen copies of SPECIALIZATION_BIT_ORDER and SKILL_BIT_ORDER as of this revision;
+# the app may only ever append to them, but this migration must not follow along.
+SPECIALIZATION_BIT_ORDER = (
+    "Backend",
+    "Frontend",
+    "Data Science / ML",
+    "Mobile",
+    "GameDev",
+    "QA",
+    "Infrastructure & DevOps",
+    "Analytics",
+)
+SKILL_BIT_ORDER = (
+    "Python",
+    "Java/Scala",
+    "C#",
+    "C++",
+    "Go",
+    "C",
+    "Ruby",
+    "PHP",
+    "Node.js",
+    "TypeScript",
+    "Kotlin",
+    "React",
+    "Vue",
+    "Angular",
+    "Machine Learning",
+    "NLP",
+    "Computer Vision",
+    "Recommender Systems",
+    "iOS",
+    "Android",
+    "Flutter",
+    "React Native",
+    "Unity",
+    "Unreal Engine",
+    "Gameplay Programming",
+    "Graphics",
+    "Manual QA",
+    "QA Automation",
+    "Performance Testing",
+    "DevOps",
+    "SRE",
+    "DBA",
+    "System Administration",
+    "SQL",
+    "Data Analysis",
+)
+
+# (table, JSONB source column, mask column, mask type, bit order)
+_MASK_COLUMNS = (
+    ("vacancies", "specializations", "specializations_mask", sa.Integer, SPECIALIZATION_BIT_ORDER),
+    ("vacancies", "skills", "skills_mask", sa.BigInteger, SKILL_BIT_ORDER),
+    (
+        "users",
+        "cv_specializations",
+        "cv_specializations_mask",
+        sa.Integer,
+        SPECIALIZATION_BIT_ORDER,
+    ),
+    ("users", "cv_skills", "cv_skills_mask", sa.BigInteger, SKILL_BIT_ORDER),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    for table, source, target, column_type, order in _MASK_COLUMNS:
+        op.add_column(
+            table,
+            sa.Column(target, column_type(), nullable=False, server_default="0"),
+        )
+        # Unknown names map to NULL in the lookup and are ignored by bit_or.
+        bind.execute(
+            sa.text(
+                f"UPDATE {table} SET {target} = COALESCE(("
+                f"SELECT bit_or((:bits ->> item.name)::bigint) "
+                f"FROM jsonb_array_elements_text({table}.{source}) AS item(name)"
+                f"), 0)"
+            ).bindparams(sa.bindparam("bits", type_=postgresql.JSONB)),
+            {"bits": {name: 1 << index for index, name in enumerate(order)}},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, _source, target, _column_type, _order in reversed(_MASK_COLUMNS):
+        op.drop_column(table, target)
@@ -0,0 +1,48 @@
+"""channel cursors for backfill
+
+Revision ID: 7c1e5b9a2f30
+Revises: 3f9c2a7d1b64
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1e5b9a2f30"
+down_revision: str | Sequence[str] | None = "3f9c2a7d1b64"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "channel_cursors",
+        sa.Column("chat_id", sa.BigInteger(), nullable=False),
+        sa.Column("last_message_id", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("chat_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO channel_cursors (chat_id, last_message_id)
+        SELECT chat_id, MAX(message_id)
+        FROM ingest_jobs
+        GROUP BY chat_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("channel_cursors")
@@ -0,0 +1,54 @@
+"""delivery queue
+
+Revision ID: 8d4b2f7a6e19
+Revises: 3a9e6c1d7f24
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d4b2f7a6e19"
+down_revision: str | Sequence[str] | None = "3a9e6c1d7f24"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "deliveries",
+        sa.Column("priority", sa.SmallInteger(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "deliveries",
+        sa.Column(
+            "next_attempt_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "deliveries",
+        sa.Column("leased_until", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_deliveries_open_priority_created_at",
+        "deliveries",
+        ["priority", sa.text("created_at DESC")],
+        postgresql_where=sa.text("status IN ('PENDING', 'SENDING')"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_deliveries_open_priority_created_at", table_name="deliveries")
+    op.drop_column("deliveries", "leased_until")
+    op.drop_column("deliveries", "next_attempt_at")
+    op.drop_column("deliveries", "priority")
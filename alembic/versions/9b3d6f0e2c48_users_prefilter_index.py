@@ -0,0 +1,34 @@
+"""users prefilter index
+
+Revision ID: 9b3d6f0e2c48
+Revises: 5e8f1a3c7b92
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b3d6f0e2c48"
+down_revision: str | Sequence[str] | None = "5e8f1a3c7b92"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_users_active_match_masks",
+        "users",
+        ["cv_specializations_mask", "cv_skills_mask"],
+        postgresql_where=sa.text("is_active IS true"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_active_match_masks", table_name="users")
@@ -0,0 +1,94 @@
+"""vacancy simhash fingerprint
+
+Revision ID: a4d8e2f61c07
+Revises: 7c1e5b9a2f30
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+import hashlib
+import re
+from collections import Counter
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d8e2f61c07"
+down_revision: str | Sequence[str] | None = "7c1e5b9a2f30"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_BACKFILL_BATCH_SIZE = 1000
+
+# Frozen copy of Vacancy.compute_simhash and simhash_to_db as of this revision,
+# so later changes to the app cannot alter what this migration writes.
+_SIMHASH_BITS = 64
+_SHINGLE_SIZE = 3
+_URL_RE = re.compile(r"(?:https?://|www\.|t\.me/)\S+", re.IGNORECASE)
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _simhash(raw_text: str) -> int:
+    words = _WORD_RE.findall(_URL_RE.sub(" ", raw_text.lower()))
+    if len(words) >= _SHINGLE_SIZE:
+        shingles = Counter(
+            " ".join(words[index : index + _SHINGLE_SIZE])
+            for index in range(len(words) - _SHINGLE_SIZE + 1)
+        )
+    else:
+        shingles = Counter([" ".join(words)])
+
+    weights = [0] * _SIMHASH_BITS
+    for shingle, count in shingles.items():
+        digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+        feature = int.from_bytes(digest, "big")
+        for bit in range(_SIMHASH_BITS):
+            weights[bit] += count if feature >> bit & 1 else -count
+
+    value = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            value |= 1 << bit
+    # Stored as a signed BIGINT.
+    return value - (1 << 64) if value > (1 << 63) - 1 else value
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("vacancies", sa.Column("simhash", sa.BigInteger(), nullable=True))
+
+    vacancies = sa.table(
+        "vacancies",
+        sa.column("id", sa.UUID()),
+        sa.column("text", sa.Text()),
+        sa.column("simhash", sa.BigInteger()),
+    )
+    bind = op.get_bind()
+    while True:
+        rows = bind.execute(
+            sa.select(vacancies.c.id, vacancies.c.text)
+            .where(vacancies.c.simhash.is_(None))
+            .limit(_BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            sa.update(vacancies)
+            .where(vacancies.c.id == sa.bindparam("vacancy_id"))
+            .values(simhash=sa.bindparam("fingerprint")),
+            [
+                {
+                    "vacancy_id": row.id,
+                    "fingerprint": _simhash(row.text or ""),
+                }
+                for row in rows
+            ],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("vacancies", "simhash")
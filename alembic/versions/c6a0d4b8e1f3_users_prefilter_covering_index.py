@@ -0,0 +1,55 @@
+"""users prefilter covering index
+
+Revision ID: c6a0d4b8e1f3
+Revises: 9b3d6f0e2c48
+Create Date: 2026-10-18 16:00:00.000000
+
+A btree cannot seek on the prefilter's `mask & :wanted != 0` tests, so this
+index does not narrow the rows read: at best the planner swaps the
+sequential scan of `users` for an index-only scan over active users, which
+skips the wide `cv_text` heap. Whether that wins at a given table size is
+what `python -m app.benchmark_prefilter` reports; no measurement is recorded
+with this revision.
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c6a0d4b8e1f3"
+down_revision: str | Sequence[str] | None = "9b3d6f0e2c48"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_INDEX_NAME = "ix_users_active_match_masks"
+_INDEX_COLUMNS = ["cv_specializations_mask", "cv_skills_mask"]
+_ACTIVE_ONLY = sa.text("is_active IS true")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index(_INDEX_NAME, table_name="users")
+    op.create_index(
+        _INDEX_NAME,
+        "users",
+        _INDEX_COLUMNS,
+        postgresql_include=[
+            "tg_id",
+            "cv_salary_amount",
+            "cv_salary_currency",
+            "filter_salary_mode",
+            "cv_work_format",
+            "filter_work_format_mode",
+        ],
+        postgresql_where=_ACTIVE_ONLY,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(_INDEX_NAME, table_name="users")
+    op.create_index(_INDEX_NAME, "users", _INDEX_COLUMNS, postgresql_where=_ACTIVE_ONLY)
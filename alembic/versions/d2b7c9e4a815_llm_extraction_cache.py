@@ -0,0 +1,58 @@
+"""llm extraction cache
+
+Revision ID: d2b7c9e4a815
+Revises: a4d8e2f61c07
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2b7c9e4a815"
+down_revision: str | Sequence[str] | None = "a4d8e2f61c07"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "llm_extraction_cache",
+        sa.Column("text_hash", sa.String(), nullable=False),
+        sa.Column("extractor_version", sa.String(), nullable=False),
+        sa.Column("result", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("is_vacancy", sa.Boolean(), nullable=False),
+        sa.Column("hits", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "last_used_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("text_hash", "extractor_version", name="pk_llm_extraction_cache"),
+    )
+    op.create_index(
+        "ix_llm_extraction_cache_expires_at",
+        "llm_extraction_cache",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_llm_extraction_cache_expires_at", table_name="llm_extraction_cache")
+    op.drop_table("llm_extraction_cache")
@@ -0,0 +1,35 @@
+"""vacancies recent index
+
+Revision ID: e1f7a2c9d053
+Revises: c6a0d4b8e1f3
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f7a2c9d053"
+down_revision: str | Sequence[str] | None = "c6a0d4b8e1f3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_vacancies_active_created_at",
+        "vacancies",
+        ["created_at"],
+        postgresql_include=["specializations_mask", "skills_mask"],
+        postgresql_where=sa.text("is_active IS true"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_vacancies_active_created_at", table_name="vacancies")
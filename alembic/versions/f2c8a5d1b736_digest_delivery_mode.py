@@ -0,0 +1,37 @@
+"""digest delivery mode
+
+Revision ID: f2c8a5d1b736
+Revises: 8d4b2f7a6e19
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c8a5d1b736"
+down_revision: str | Sequence[str] | None = "8d4b2f7a6e19"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column("delivery_mode", sa.String(), server_default="INSTANT", nullable=False),
+    )
+    op.add_column(
+        "deliveries",
+        sa.Column("digest", sa.Boolean(), server_default=sa.text("false"), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("deliveries", "digest")
+    op.drop_column("users", "delivery_mode")
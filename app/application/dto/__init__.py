@@ -1,8 +1,15 @@
 from .resume_dto import OutResumeParse, OutResumeSalaryParse
-from .vacancy_dto import InfoRawVacancy, OutVacancyParse
+from .vacancy_dto import (
+    InfoRawVacancy,
+    OutVacancyBatchItem,
+    OutVacancyBatchParse,
+    OutVacancyParse,
+)
 
 __all__ = [
     "OutVacancyParse",
+    "OutVacancyBatchItem",
+    "OutVacancyBatchParse",
     "InfoRawVacancy",
     "OutResumeParse",
     "OutResumeSalaryParse",
@@ -1,5 +1,7 @@
 from app.application.dto.miniapp.models import (
     ChoiceOptionDto,
+    DeliveryReadResponse,
+    DeliverySaveRequest,
     FormatReadResponse,
     FormatSaveRequest,
     MiniAppPayload,
@@ -15,6 +17,8 @@ from app.application.dto.miniapp.models import (
 
 __all__ = [
     "ChoiceOptionDto",
+    "DeliveryReadResponse",
+    "DeliverySaveRequest",
     "FormatReadResponse",
     "FormatSaveRequest",
     "MiniAppPayload",
@@ -5,6 +5,7 @@ from enum import StrEnum
 from pydantic import BaseModel
 
 from app.domain.shared.value_objects import SkillType, SpecializationType
+from app.domain.user.value_objects import DeliveryMode
 
 
 class WorkFormatChoice(StrEnum):
@@ -42,6 +43,11 @@ class SalarySaveRequest(BaseModel):
     salary_amount_rub: int | None = None
 
 
+class DeliverySaveRequest(BaseModel):
+    init_data: str
+    delivery_mode: DeliveryMode = DeliveryMode.INSTANT
+
+
 class SpecialtyReadResponse(BaseModel):
     specializations: list[str]
     skills: list[str]
@@ -56,6 +62,10 @@ class SalaryReadResponse(BaseModel):
     salary_amount_rub: int | None
 
 
+class DeliveryReadResponse(BaseModel):
+    delivery_mode: str
+
+
 class SaveResponse(BaseModel):
     status: str = "ok"
     message: str
@@ -35,3 +35,14 @@ class OutVacancyParse(BaseModel):
         default=WorkFormat.UNDEFINED,
         description="Формат работы: REMOTE, HYBRID, ONSITE или UNDEFINED.",
     )
+
+
+class OutVacancyBatchItem(OutVacancyParse):
+    id: int = Field(..., description="id сообщения из запроса, к которому относится разбор.")
+
+
+class OutVacancyBatchParse(BaseModel):
+    items: list[OutVacancyBatchItem] = Field(
+        default_factory=list,
+        description="Ровно один разбор на каждое сообщение запроса.",
+    )
@@ -1,8 +1,10 @@
-from .llm_port import IVacancyLLMExtractor
+from .llm_port import IVacancyBatchLLMExtractor, IVacancyBatchPrefetcher, IVacancyLLMExtractor
 from .notification_port import INotificationService
 from .observability_port import IObservabilityService
 
 __all__ = [
+    "IVacancyBatchLLMExtractor",
+    "IVacancyBatchPrefetcher",
     "IVacancyLLMExtractor",
     "INotificationService",
     "IObservabilityService",
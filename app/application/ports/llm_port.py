@@ -1,7 +1,17 @@
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 from app.application.dto.vacancy_dto import OutVacancyParse
 
 
 class IVacancyLLMExtractor(Protocol):
     async def parse_vacancy(self, text: str) -> OutVacancyParse: ...
+
+
+@runtime_checkable
+class IVacancyBatchLLMExtractor(Protocol):
+    async def parse_vacancies(self, texts: list[str]) -> list[OutVacancyParse]: ...
+
+
+@runtime_checkable
+class IVacancyBatchPrefetcher(Protocol):
+    async def prefetch(self, texts: list[str]) -> None: ...
@@ -1,6 +1,8 @@
 from typing import Protocol, runtime_checkable
 from uuid import UUID
 
+from app.domain.delivery.entities import Delivery, DeliveryPriority, DeliveryReport
+
 
 @runtime_checkable
 class INotificationService(Protocol):
@@ -10,4 +12,12 @@ class INotificationService(Protocol):
         mirror_chat_id: int,
         mirror_message_id: int,
         user_ids: list[int],
+        priority: DeliveryPriority = DeliveryPriority.FRESH,
     ) -> None: ...
+
+
+@runtime_checkable
+class IDeliverySender(Protocol):
+    async def send(self, deliveries: list[Delivery]) -> DeliveryReport: ...
+
+    async def send_digests(self, deliveries: list[Delivery]) -> DeliveryReport: ...
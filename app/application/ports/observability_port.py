@@ -7,3 +7,31 @@ class IObservabilityService(Protocol):
     def observe_not_vacancy_detected(self, count: int = 1) -> None: ...
 
     def observe_skill_match(self, skill: str, count: int = 1) -> None: ...
+
+    def observe_ingest_queue_depth(self, depth: int) -> None: ...
+
+    def observe_ingest_queue_wait(self, seconds: float) -> None: ...
+
+    def observe_dedup_check(self, result: str) -> None: ...
+
+    def observe_llm_cache_lookup(self, result: str) -> None: ...
+
+    def observe_preclassifier_decision(self, verdict: str, reason: str, agreement: str) -> None: ...
+
+    def observe_llm_queue_wait(self, priority: str, seconds: float) -> None: ...
+
+    def observe_llm_rate_limited(self, operation: str) -> None: ...
+
+    def observe_circuit_state(self, name: str, state: str) -> None: ...
+
+    def observe_telegram_send(self, result: str) -> None: ...
+
+    def observe_telegram_send_backlog(self, depth: int) -> None: ...
+
+    def observe_dispatch_duration(self, seconds: float) -> None: ...
+
+    def observe_delivery_queue_depth(self, depth: int) -> None: ...
+
+    def observe_db_pool_usage(self, workload: str, checked_out: int, overflow: int) -> None: ...
+
+    def observe_db_pool_wait(self, workload: str, seconds: float) -> None: ...
@@ -1,5 +1,7 @@
 from typing import Protocol
 
+from app.domain.delivery.repository import IDeliveryRepository
+from app.domain.ingest.repository import IChannelCursorRepository, IIngestJobRepository
 from app.domain.user.repository import IUserRepository
 from app.domain.vacancy.repository import IVacancyRepository
 
@@ -27,3 +29,13 @@ class UserUnitOfWork(UnitOfWork, Protocol):
 class MatchingUnitOfWork(UnitOfWork, Protocol):
     users: IUserRepository
     vacancies: IVacancyRepository
+
+
+class IngestUnitOfWork(UnitOfWork, Protocol):
+    ingest_jobs: IIngestJobRepository
+    channel_cursors: IChannelCursorRepository
+
+
+class DeliveryUnitOfWork(UnitOfWork, Protocol):
+    deliveries: IDeliveryRepository
+    users: IUserRepository
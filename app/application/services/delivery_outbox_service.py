@@ -0,0 +1,155 @@
+from collections import defaultdict
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+import logfire
+
+from app.application.ports.notification_port import INotificationService
+from app.application.ports.unit_of_work import DeliveryUnitOfWork
+from app.application.services.user_profile_index import (
+    UserProfileIndex,
+    get_user_profile_index,
+)
+from app.core.logger import get_app_logger
+from app.domain.delivery.entities import Delivery, DeliveryPriority, DeliveryReport
+
+logger = get_app_logger(__name__)
+application_logfire = logfire.with_tags("application")
+
+RETRY_DELAYS_SECONDS: tuple[int, ...] = (30, 120, 600, 1800)
+
+
+class DeliveryOutboxService(INotificationService):
+    """Persistent delivery queue between matching and the delivery worker.
+
+    `dispatch_vacancy` only records the matched recipients; a `DeliveryWorker`
+    (in this or another process) leases due rows, sends them and reports back.
+    """
+
+    def __init__(
+        self,
+        uow: DeliveryUnitOfWork,
+        *,
+        lease_seconds: float,
+        max_attempts: int,
+        profile_index: UserProfileIndex | None = None,
+    ) -> None:
+        self._uow = uow
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+        self._profile_index = (
+            profile_index if profile_index is not None else get_user_profile_index()
+        )
+
+    async def dispatch_vacancy(
+        self,
+        vacancy_id: UUID,
+        mirror_chat_id: int,
+        mirror_message_id: int,
+        user_ids: list[int],
+        priority: DeliveryPriority = DeliveryPriority.FRESH,
+    ) -> None:
+        if not user_ids:
+            return
+        async with self._uow:
+            enqueued = await self._uow.deliveries.enqueue(
+                vacancy_id, list(dict.fromkeys(user_ids)), priority
+            )
+        logger.info(
+            "Queued vacancy %s for %s users (%s already delivered or queued, priority=%s)",
+            vacancy_id,
+            enqueued,
+            len(user_ids) - enqueued,
+            priority.name.lower(),
+        )
+
+    async def lease_due(self, limit: int) -> list[Delivery]:
+        async with self._uow:
+            deliveries = await self._uow.deliveries.lease_due(
+                limit=limit,
+                lease_seconds=self._lease_seconds,
+            )
+            return await self._drop_exhausted(deliveries)
+
+    async def lease_digests(self, limit: int) -> list[Delivery]:
+        async with self._uow:
+            deliveries = await self._uow.deliveries.lease_digests(
+                limit=limit,
+                lease_seconds=self._lease_seconds,
+            )
+            return await self._drop_exhausted(deliveries)
+
+    async def _drop_exhausted(self, deliveries: list[Delivery]) -> list[Delivery]:
+        """Dead-letter leased rows whose leases kept expiring; returns the rest."""
+        exhausted = [
+            delivery.id for delivery in deliveries if delivery.attempts >= self._max_attempts
+        ]
+        if not exhausted:
+            return deliveries
+        await self._uow.deliveries.mark_dead(exhausted, "lease expired")
+        application_logfire.warning(
+            "Deliveries dead-lettered",
+            count=len(exhausted),
+            attempts=self._max_attempts,
+            error="lease expired",
+        )
+        dead = set(exhausted)
+        return [delivery for delivery in deliveries if delivery.id not in dead]
+
+    async def count_open(self) -> int:
+        async with self._uow:
+            return await self._uow.deliveries.count_open()
+
+    async def record(self, deliveries: list[Delivery], report: DeliveryReport) -> None:
+        """Write a sent batch back: retries get a backoff, exhausted ones are dead-lettered.
+
+        Users who blocked the bot are deactivated in the same transaction and
+        their other queued deliveries are closed, so matching and the worker
+        stop spending sends on them.
+        """
+        attempts_by_id = {delivery.id: delivery.attempts + 1 for delivery in deliveries}
+        tg_ids_by_id = {delivery.id: delivery.tg_id for delivery in deliveries}
+        blocked = sorted({tg_ids_by_id[delivery_id] for delivery_id in report.forbidden})
+        retries: dict[tuple[str, int], list[int]] = defaultdict(list)
+        dead: dict[str, list[int]] = defaultdict(list)
+        for delivery_id, error in report.failed.items():
+            attempts = attempts_by_id[delivery_id]
+            if attempts >= self._max_attempts:
+                dead[error].append(delivery_id)
+            else:
+                retries[(error, retry_delay_seconds(attempts))].append(delivery_id)
+
+        now = datetime.now(UTC)
+        async with self._uow:
+            await self._uow.deliveries.mark_sent(report.sent)
+            await self._uow.deliveries.mark_forbidden(report.forbidden)
+            for (error, delay_seconds), delivery_ids in retries.items():
+                await self._uow.deliveries.mark_retry(
+                    delivery_ids, error, now + timedelta(seconds=delay_seconds)
+                )
+            for error, delivery_ids in dead.items():
+                await self._uow.deliveries.mark_dead(delivery_ids, error)
+            deactivated = await self._uow.users.deactivate_many(blocked)
+            cancelled = await self._uow.deliveries.cancel_for_users(blocked)
+
+        # Another process' index catches up on its next full reload.
+        for tg_id in deactivated:
+            self._profile_index.remove(tg_id)
+        if deactivated:
+            application_logfire.info(
+                "Users deactivated: bot blocked",
+                count=len(deactivated),
+                cancelled_deliveries=cancelled,
+            )
+        for error, delivery_ids in dead.items():
+            application_logfire.warning(
+                "Deliveries dead-lettered",
+                count=len(delivery_ids),
+                attempts=self._max_attempts,
+                error=error,
+            )
+
+
+def retry_delay_seconds(attempts: int) -> int:
+    index = min(max(attempts, 1), len(RETRY_DELAYS_SECONDS)) - 1
+    return RETRY_DELAYS_SECONDS[index]
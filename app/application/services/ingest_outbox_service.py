@@ -0,0 +1,158 @@
+from datetime import UTC, datetime, timedelta
+
+import logfire
+
+from app.application.ports.unit_of_work import IngestUnitOfWork
+from app.core.logger import get_app_logger
+from app.domain.ingest.entities import IngestJob
+
+logger = get_app_logger(__name__)
+application_logfire = logfire.with_tags("application")
+
+RETRY_DELAYS_SECONDS: tuple[int, ...] = (30, 120, 600, 1800, 3600)
+
+
+class IngestOutboxService:
+    def __init__(
+        self,
+        uow: IngestUnitOfWork,
+        *,
+        lease_seconds: float,
+        max_attempts: int,
+    ) -> None:
+        self._uow = uow
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+
+    async def record_message(
+        self,
+        chat_id: int,
+        message_id: int,
+        text: str,
+        *,
+        advance_cursor: bool = True,
+    ) -> IngestJob | None:
+        """Persist a received message and lease it to the caller for immediate processing.
+
+        Unless `advance_cursor` is off, also advances the channel high-water mark
+        backfill resumes from; callers must only advance it when every earlier
+        message of the channel has been recorded.
+        Returns None when the message was already recorded earlier.
+        """
+        async with self._uow:
+            job = await self._uow.ingest_jobs.add_leased(
+                chat_id=chat_id,
+                message_id=message_id,
+                text=text,
+                lease_seconds=self._lease_seconds,
+            )
+            if advance_cursor:
+                await self._uow.channel_cursors.advance(chat_id, message_id)
+            return job
+
+    async def get_channel_cursor(self, chat_id: int) -> int | None:
+        async with self._uow:
+            return await self._uow.channel_cursors.get_last_message_id(chat_id)
+
+    async def lease_due(self, limit: int) -> list[IngestJob]:
+        """Lease due jobs; ones whose leases kept expiring are dead-lettered instead."""
+        async with self._uow:
+            jobs = await self._uow.ingest_jobs.lease_due(
+                limit=limit,
+                lease_seconds=self._lease_seconds,
+            )
+            leased: list[IngestJob] = []
+            for job in jobs:
+                if job.attempts < self._max_attempts:
+                    leased.append(job)
+                    continue
+                await self._uow.ingest_jobs.mark_dead(job.id, job.attempts, "lease expired")
+                application_logfire.warning(
+                    "Ingest job dead-lettered",
+                    job_id=job.id,
+                    chat_id=job.chat_id,
+                    message_id=job.message_id,
+                    attempts=job.attempts,
+                    error="lease expired",
+                )
+            return leased
+
+    async def record_mirror(
+        self, job: IngestJob, mirror_chat_id: int, mirror_message_id: int
+    ) -> None:
+        """Remember the mirror post of a job so a retry reuses it instead of forwarding again."""
+        async with self._uow:
+            held = await self._uow.ingest_jobs.set_mirror(
+                job.id, job.attempts, mirror_chat_id, mirror_message_id
+            )
+        job.mirror_chat_id = mirror_chat_id
+        job.mirror_message_id = mirror_message_id
+        if not held:
+            _log_lease_lost(job)
+
+    async def complete(self, job: IngestJob) -> None:
+        async with self._uow:
+            held = await self._uow.ingest_jobs.mark_done(job.id, job.attempts)
+        if not held:
+            _log_lease_lost(job)
+
+    async def fail(self, job: IngestJob, error: str, *, permanent: bool = False) -> None:
+        attempts = job.attempts + 1
+        async with self._uow:
+            if permanent or attempts >= self._max_attempts:
+                held = await self._uow.ingest_jobs.mark_dead(job.id, job.attempts, error)
+                if not held:
+                    _log_lease_lost(job)
+                    return
+                application_logfire.warning(
+                    "Ingest job dead-lettered",
+                    job_id=job.id,
+                    chat_id=job.chat_id,
+                    message_id=job.message_id,
+                    attempts=attempts,
+                    error=error,
+                )
+                return
+
+            delay_seconds = retry_delay_seconds(attempts)
+            next_attempt_at = datetime.now(UTC) + timedelta(seconds=delay_seconds)
+            held = await self._uow.ingest_jobs.mark_retry(
+                job.id, job.attempts, error, next_attempt_at
+            )
+        if not held:
+            _log_lease_lost(job)
+            return
+        logger.info(
+            "Ingest job %s scheduled for retry in %ss (attempt %s/%s): %s",
+            job.id,
+            delay_seconds,
+            attempts,
+            self._max_attempts,
+            error,
+        )
+
+    async def defer(self, job: IngestJob, reason: str, delay_seconds: float) -> None:
+        """Put a job back without spending an attempt, e.g. while the LLM circuit is open."""
+        next_attempt_at = datetime.now(UTC) + timedelta(seconds=delay_seconds)
+        async with self._uow:
+            held = await self._uow.ingest_jobs.defer(job.id, job.attempts, reason, next_attempt_at)
+        if not held:
+            _log_lease_lost(job)
+            return
+        logger.info("Ingest job %s deferred for %.0fs: %s", job.id, delay_seconds, reason)
+
+    async def purge_done(self, retention: timedelta) -> int:
+        async with self._uow:
+            return await self._uow.ingest_jobs.purge_done(datetime.now(UTC) - retention)
+
+
+def retry_delay_seconds(attempts: int) -> int:
+    index = min(max(attempts, 1), len(RETRY_DELAYS_SECONDS)) - 1
+    return RETRY_DELAYS_SECONDS[index]
+
+
+def _log_lease_lost(job: IngestJob) -> None:
+    logger.warning(
+        "Ingest job %s lease expired before its result was written; left to the next holder",
+        job.id,
+    )
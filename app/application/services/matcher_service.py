@@ -1,3 +1,4 @@
+from collections import Counter
 from time import perf_counter
 
 import logfire
@@ -5,8 +6,15 @@ import logfire
 from app.application.ports.notification_port import INotificationService
 from app.application.ports.observability_port import IObservabilityService
 from app.application.ports.unit_of_work import MatchingUnitOfWork
+from app.application.services.user_profile_index import (
+    UserProfileIndex,
+    get_user_profile_index,
+)
 from app.core.logger import get_app_logger
-from app.domain.matching.policy import evaluate_match
+from app.domain.matching.entities import BulkMatchResult, MatchRejectionReason
+from app.domain.matching.policy import evaluate_profile_match
+from app.domain.matching.profile import MatchProfile
+from app.domain.shared.value_objects import Skills
 from app.domain.user.entities import User
 from app.domain.user.value_objects import UserId
 from app.domain.vacancy.entities import Vacancy
@@ -22,10 +30,14 @@ class MatcherService:
         uow: MatchingUnitOfWork,
         notification_service: INotificationService,
         observability: IObservabilityService,
+        profile_index: UserProfileIndex | None = None,
     ) -> None:
         self._uow = uow
         self._notification_service = notification_service
         self._observability = observability
+        self._profile_index = (
+            profile_index if profile_index is not None else get_user_profile_index()
+        )
 
     async def match_vacancy(self, vacancy_id: VacancyId) -> list[UserId]:
         start = perf_counter()
@@ -39,30 +51,22 @@ class MatcherService:
                     )
                     return []
 
-                prefiltered_candidates = await self._load_prefiltered_candidates(vacancy)
-                candidate_count = len(prefiltered_candidates)
-                logger.debug(
-                    "SQL prefilter for %s returned %s candidates",
-                    vacancy_id.value,
-                    candidate_count,
-                )
-
-                matched_user_ids: list[UserId] = []
-                rejected_count = 0
-
-                for candidate in prefiltered_candidates:
-                    decision = evaluate_match(vacancy=vacancy, user=candidate)
-                    if decision.accepted:
-                        matched_user_ids.append(candidate.tg_id)
-                        self._observe_skill_matches(vacancy=vacancy, user=candidate)
-                        continue
+                if self._profile_index.ready:
+                    result = self._profile_index.match(vacancy)
+                    self._observe_shared_skills(result)
+                else:
+                    # The index is not loaded yet (e.g. right after start): use the SQL prefilter.
+                    result = await self._match_prefiltered(vacancy)
 
-                    rejected_count += 1
-                    logger.debug(
-                        "User %s rejected by %s",
-                        candidate.tg_id.value,
-                        decision.reason.value if decision.reason else "unknown",
-                    )
+            candidate_count = result.candidate_count
+            matched_user_ids = [UserId(tg_id) for tg_id in result.accepted_ids]
+            rejected_count = sum(result.rejected.values())
+            logger.debug(
+                "Matching %s: %s candidates, rejected %s",
+                vacancy_id.value,
+                candidate_count,
+                {reason.value: count for reason, count in result.rejected.items()},
+            )
 
             await self._notification_service.dispatch_vacancy(
                 vacancy_id=vacancy_id.value,
@@ -91,17 +95,42 @@ class MatcherService:
 
             return matched_user_ids
 
-    async def _load_prefiltered_candidates(self, vacancy: Vacancy) -> list[User]:
-        specializations = {item.value for item in vacancy.specializations.items}
-        skills = {item.value for item in vacancy.skills.items}
-        return await self._uow.users.find_prefiltered_candidates(
-            specializations=specializations,
-            skills=skills,
+    async def _match_prefiltered(self, vacancy: Vacancy) -> BulkMatchResult:
+        candidates = await self._uow.users.find_prefiltered_profiles(
+            specializations_mask=vacancy.specializations.to_mask(),
+            skills_mask=vacancy.skills.to_mask(),
             is_active=True,
         )
+        accepted_ids: list[int] = []
+        rejected: Counter[MatchRejectionReason] = Counter()
+        for candidate in candidates:
+            decision = evaluate_profile_match(vacancy=vacancy, profile=candidate)
+            if decision.accepted:
+                accepted_ids.append(candidate.tg_id)
+                self._observe_skill_matches(vacancy=vacancy, user=candidate)
+                continue
 
-    def _observe_skill_matches(self, vacancy: Vacancy, user: User) -> None:
-        vacancy_skills = {skill.value.lower() for skill in vacancy.skills.items}
-        user_skills = {skill.value.lower() for skill in user.cv_skills.items}
-        for skill in sorted(vacancy_skills & user_skills):
+            if decision.reason is not None:
+                rejected[decision.reason] += 1
+            logger.debug(
+                "User %s rejected by %s",
+                candidate.tg_id,
+                decision.reason.value if decision.reason else "unknown",
+            )
+        return BulkMatchResult(
+            candidate_count=len(candidates),
+            accepted_ids=tuple(accepted_ids),
+            rejected=dict(rejected),
+        )
+
+    def _observe_shared_skills(self, result: BulkMatchResult) -> None:
+        for skill, count in sorted(result.shared_skill_counts.items()):
+            self._observability.observe_skill_match(skill=skill.value.lower(), count=count)
+
+    def _observe_skill_matches(self, vacancy: Vacancy, user: User | MatchProfile) -> None:
+        user_skills = (
+            Skills.from_mask(user.skills_mask) if isinstance(user, MatchProfile) else user.cv_skills
+        )
+        shared = vacancy.skills.items & user_skills.items
+        for skill in sorted(item.value.lower() for item in shared):
             self._observability.observe_skill_match(skill=skill, count=1)
@@ -0,0 +1,157 @@
+from collections.abc import Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from app.domain.matching.entities import BulkMatchResult, MatchRejectionReason
+from app.domain.matching.profile import MatchProfile
+from app.domain.shared.value_objects import SKILL_BIT_ORDER, WorkFormat
+from app.domain.vacancy.entities import Vacancy
+
+_ANY_FORMAT = 0
+_NO_MIN_SALARY = -1
+_FORMAT_CODES = {work_format: code for code, work_format in enumerate(WorkFormat, start=1)}
+_SKILL_BITS = {skill: 1 << index for index, skill in enumerate(SKILL_BIT_ORDER)}
+_INITIAL_CAPACITY = 1024
+
+
+class ProfileColumns:
+    """Match profiles stored column-wise so one vacancy is checked against all users at once.
+
+    Mirrors `evaluate_profile_match`: the prefilter (shared specialization and
+    skill bits), then the salary rule, then the format rule, with the same
+    rejection reasons. Rows are kept dense; removals move the last row into the
+    freed slot.
+    """
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY) -> None:
+        capacity = max(capacity, 1)
+        self._size = 0
+        self._rows: dict[int, int] = {}
+        self._tg_ids = np.zeros(capacity, dtype=np.int64)
+        self._specializations = np.zeros(capacity, dtype=np.int64)
+        self._skills = np.zeros(capacity, dtype=np.int64)
+        self._min_salary = np.zeros(capacity, dtype=np.int64)
+        self._work_format = np.zeros(capacity, dtype=np.int8)
+
+    @classmethod
+    def from_profiles(cls, profiles: Iterable[MatchProfile]) -> "ProfileColumns":
+        unique = list({profile.tg_id: profile for profile in profiles}.values())
+        size = len(unique)
+        columns = cls(capacity=max(size, _INITIAL_CAPACITY))
+        columns._tg_ids[:size] = [profile.tg_id for profile in unique]
+        columns._specializations[:size] = [profile.specializations_mask for profile in unique]
+        columns._skills[:size] = [profile.skills_mask for profile in unique]
+        columns._min_salary[:size] = [_salary_code(profile) for profile in unique]
+        columns._work_format[:size] = [_format_code(profile) for profile in unique]
+        columns._rows = {profile.tg_id: row for row, profile in enumerate(unique)}
+        columns._size = size
+        return columns
+
+    def __len__(self) -> int:
+        return self._size
+
+    def upsert(self, profile: MatchProfile) -> None:
+        row = self._rows.get(profile.tg_id)
+        if row is None:
+            if self._size == len(self._tg_ids):
+                self._grow()
+            row = self._size
+            self._size += 1
+            self._rows[profile.tg_id] = row
+
+        self._tg_ids[row] = profile.tg_id
+        self._specializations[row] = profile.specializations_mask
+        self._skills[row] = profile.skills_mask
+        self._min_salary[row] = _salary_code(profile)
+        self._work_format[row] = _format_code(profile)
+
+    def remove(self, tg_id: int) -> None:
+        row = self._rows.pop(tg_id, None)
+        if row is None:
+            return
+        last = self._size - 1
+        if row != last:
+            for column in self._columns():
+                column[row] = column[last]
+            self._rows[int(self._tg_ids[row])] = row
+        self._size = last
+
+    def prefilter(self, specializations_mask: int, skills_mask: int) -> npt.NDArray[np.int64]:
+        """tg_ids sharing at least one specialization and one skill (zero mask = no filter)."""
+        return self._tg_ids[: self._size][self._prefilter(specializations_mask, skills_mask)]
+
+    def match(self, vacancy: Vacancy) -> BulkMatchResult:
+        size = self._size
+        candidates = self._prefilter(vacancy.specializations.to_mask(), vacancy.skills.to_mask())
+
+        salary_rejected = np.zeros(size, dtype=bool)
+        if vacancy.salary.amount is not None:
+            salary_rejected = candidates & (self._min_salary[:size] > vacancy.salary.amount)
+
+        strict_format = self._work_format[:size] != _ANY_FORMAT
+        if vacancy.work_format == WorkFormat.UNDEFINED:
+            format_mismatch = strict_format
+        else:
+            format_mismatch = strict_format & (
+                self._work_format[:size] != _FORMAT_CODES[vacancy.work_format]
+            )
+        format_rejected = candidates & ~salary_rejected & format_mismatch
+
+        accepted = candidates & ~salary_rejected & ~format_rejected
+        accepted_skills = self._skills[:size][accepted]
+        return BulkMatchResult(
+            candidate_count=int(np.count_nonzero(candidates)),
+            accepted_ids=tuple(int(tg_id) for tg_id in self._tg_ids[:size][accepted]),
+            rejected={
+                MatchRejectionReason.SALARY: int(np.count_nonzero(salary_rejected)),
+                MatchRejectionReason.FORMAT: int(np.count_nonzero(format_rejected)),
+            },
+            shared_skill_counts={
+                skill: count
+                for skill in vacancy.skills.items
+                if (count := int(np.count_nonzero(accepted_skills & _SKILL_BITS[skill])))
+            },
+        )
+
+    def _prefilter(self, specializations_mask: int, skills_mask: int) -> npt.NDArray[np.bool_]:
+        size = self._size
+        selected = np.ones(size, dtype=bool)
+        if specializations_mask:
+            selected &= (self._specializations[:size] & specializations_mask) != 0
+        if skills_mask:
+            selected &= (self._skills[:size] & skills_mask) != 0
+        return selected
+
+    def _columns(self) -> tuple[npt.NDArray[np.generic], ...]:
+        return (
+            self._tg_ids,
+            self._specializations,
+            self._skills,
+            self._min_salary,
+            self._work_format,
+        )
+
+    def _grow(self) -> None:
+        capacity = len(self._tg_ids) * 2
+        self._tg_ids = _resized(self._tg_ids, capacity)
+        self._specializations = _resized(self._specializations, capacity)
+        self._skills = _resized(self._skills, capacity)
+        self._min_salary = _resized(self._min_salary, capacity)
+        self._work_format = _resized(self._work_format, capacity)
+
+
+def _salary_code(profile: MatchProfile) -> int:
+    return profile.min_salary if profile.min_salary is not None else _NO_MIN_SALARY
+
+
+def _format_code(profile: MatchProfile) -> int:
+    if profile.work_format is None:
+        return _ANY_FORMAT
+    return _FORMAT_CODES[profile.work_format]
+
+
+def _resized[T: np.generic](column: npt.NDArray[T], capacity: int) -> npt.NDArray[T]:
+    grown = np.zeros(capacity, dtype=column.dtype)
+    grown[: len(column)] = column
+    return grown
@@ -0,0 +1,141 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from time import monotonic
+
+import logfire
+
+from app.application.ports.notification_port import INotificationService
+from app.application.ports.unit_of_work import MatchingUnitOfWork
+from app.core.logger import get_app_logger
+from app.domain.delivery.entities import DeliveryPriority
+from app.domain.matching.policy import evaluate_profile_match
+from app.domain.matching.profile import MatchProfile
+from app.domain.vacancy.entities import Vacancy
+
+logger = get_app_logger(__name__)
+application_logfire = logfire.with_tags("application")
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileChange:
+    previous: MatchProfile | None
+    current: MatchProfile
+
+
+@dataclass(slots=True)
+class _PendingChange:
+    previous: MatchProfile | None
+    current: MatchProfile
+    changed_at: float
+
+
+class ProfileChangeQueue:
+    """Collects profile edits per user until they settle.
+
+    Edits cluster right after onboarding (resume upload, then a few tweaks in
+    the mini-app), so only the first `previous` and the latest `current` of a
+    burst are kept and handed out once the user has been quiet long enough.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = monotonic) -> None:
+        self._clock = clock
+        self._pending: dict[int, _PendingChange] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def notify(self, previous: MatchProfile | None, current: MatchProfile) -> None:
+        pending = self._pending.get(current.tg_id)
+        if pending is not None:
+            previous = pending.previous
+        if previous == current:
+            self._pending.pop(current.tg_id, None)
+            return
+        self._pending[current.tg_id] = _PendingChange(previous, current, self._clock())
+
+    def pop_settled(self, quiet_seconds: float) -> list[ProfileChange]:
+        threshold = self._clock() - quiet_seconds
+        settled = [
+            tg_id for tg_id, pending in self._pending.items() if pending.changed_at <= threshold
+        ]
+        changes: list[ProfileChange] = []
+        for tg_id in settled:
+            pending = self._pending.pop(tg_id)
+            changes.append(ProfileChange(pending.previous, pending.current))
+        return changes
+
+
+class ReverseMatcherService:
+    """Send recent vacancies that a freshly edited profile now matches.
+
+    Vacancies the previous profile already matched are skipped, since those
+    were delivered when they arrived.
+    """
+
+    def __init__(
+        self,
+        uow: MatchingUnitOfWork,
+        notification_service: INotificationService,
+        *,
+        window: timedelta,
+        max_vacancies: int,
+    ) -> None:
+        self._uow = uow
+        self._notification_service = notification_service
+        self._window = window
+        self._max_vacancies = max_vacancies
+
+    async def match_profile(self, change: ProfileChange) -> int:
+        current = change.current
+        if not current.specializations_mask or not current.skills_mask:
+            return 0
+        with application_logfire.span("matching.reverse_match", tg_id=current.tg_id):
+            async with self._uow:
+                recent = await self._uow.vacancies.find_recent_for_profile(
+                    specializations_mask=current.specializations_mask,
+                    skills_mask=current.skills_mask,
+                    since=datetime.now(UTC) - self._window,
+                    limit=self._max_vacancies,
+                )
+            fresh = [vacancy for vacancy in recent if self._is_new_match(vacancy, change)]
+
+            # Queued oldest first, in the order the vacancies were posted; the
+            # lower priority keeps this backfill behind fresh vacancies.
+            for vacancy in reversed(fresh):
+                await self._notification_service.dispatch_vacancy(
+                    vacancy_id=vacancy.id.value,
+                    mirror_chat_id=vacancy.mirror_chat_id,
+                    mirror_message_id=vacancy.mirror_message_id,
+                    user_ids=[current.tg_id],
+                    priority=DeliveryPriority.REVERSE_MATCH,
+                )
+
+            application_logfire.info(
+                "Reverse matching finished",
+                tg_id=current.tg_id,
+                scanned_count=len(recent),
+                matched_count=len(fresh),
+            )
+            return len(fresh)
+
+    @staticmethod
+    def _is_new_match(vacancy: Vacancy, change: ProfileChange) -> bool:
+        if not evaluate_profile_match(vacancy=vacancy, profile=change.current).accepted:
+            return False
+        previous = change.previous
+        if previous is None or not _shares_masks(vacancy, previous):
+            return True
+        return not evaluate_profile_match(vacancy=vacancy, profile=previous).accepted
+
+
+def _shares_masks(vacancy: Vacancy, profile: MatchProfile) -> bool:
+    return bool(vacancy.specializations.to_mask() & profile.specializations_mask) and bool(
+        vacancy.skills.to_mask() & profile.skills_mask
+    )
+
+
+@lru_cache(maxsize=1)
+def get_profile_change_queue() -> ProfileChangeQueue:
+    return ProfileChangeQueue()
@@ -0,0 +1,90 @@
+from collections.abc import AsyncIterable
+from functools import lru_cache
+
+from app.application.services.profile_columns import ProfileColumns
+from app.core.logger import get_app_logger
+from app.domain.matching.entities import BulkMatchResult
+from app.domain.matching.profile import MatchProfile
+from app.domain.user.entities import User
+from app.domain.vacancy.entities import Vacancy
+
+logger = get_app_logger(__name__)
+
+
+class UserProfileIndex:
+    """In-memory store of active users' match profiles.
+
+    Profiles are mirrored into `ProfileColumns`, so matching a vacancy is a
+    handful of vectorized mask/compare operations over all users instead of a
+    per-candidate Python loop or a scan over `users`. Until the first full load
+    it reports `ready = False` and callers fall back to the database.
+    """
+
+    def __init__(self) -> None:
+        self._profiles: dict[int, MatchProfile] = {}
+        self._columns = ProfileColumns()
+        self._ready = False
+        # Writes that land while a snapshot is loading; replayed on top of it.
+        self._changes_during_load: dict[int, MatchProfile | None] | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    async def load(self, profiles: AsyncIterable[MatchProfile]) -> int:
+        """Rebuild from a full snapshot and swap it in at once."""
+        snapshot: dict[int, MatchProfile] = {}
+        self._changes_during_load = {}
+        try:
+            async for profile in profiles:
+                snapshot[profile.tg_id] = profile
+            changes = self._changes_during_load
+        finally:
+            self._changes_during_load = None
+
+        for tg_id, changed in changes.items():
+            if changed is None:
+                snapshot.pop(tg_id, None)
+            else:
+                snapshot[tg_id] = changed
+        self._columns = ProfileColumns.from_profiles(snapshot.values())
+        self._profiles = snapshot
+        self._ready = True
+        logger.info("User profile index loaded with %s active users", len(self._profiles))
+        return len(self._profiles)
+
+    def sync_user(self, user: User) -> None:
+        if user.is_active:
+            self.upsert(MatchProfile.from_user(user))
+        else:
+            self.remove(user.tg_id.value)
+
+    def upsert(self, profile: MatchProfile) -> None:
+        if self._changes_during_load is not None:
+            self._changes_during_load[profile.tg_id] = profile
+        self._profiles[profile.tg_id] = profile
+        self._columns.upsert(profile)
+
+    def remove(self, tg_id: int) -> None:
+        if self._changes_during_load is not None:
+            self._changes_during_load[tg_id] = None
+        self._profiles.pop(tg_id, None)
+        self._columns.remove(tg_id)
+
+    def candidates(self, specializations_mask: int, skills_mask: int) -> list[MatchProfile]:
+        """Users sharing at least one specialization and one skill (zero mask = no filter)."""
+        return [
+            self._profiles[int(tg_id)]
+            for tg_id in self._columns.prefilter(specializations_mask, skills_mask)
+        ]
+
+    def match(self, vacancy: Vacancy) -> BulkMatchResult:
+        return self._columns.match(vacancy)
+
+
+@lru_cache(maxsize=1)
+def get_user_profile_index() -> UserProfileIndex:
+    return UserProfileIndex()
@@ -1,5 +1,14 @@
 from app.application.dto import OutResumeParse
 from app.application.ports.unit_of_work import UserUnitOfWork
+from app.application.services.reverse_matcher_service import (
+    ProfileChangeQueue,
+    get_profile_change_queue,
+)
+from app.application.services.user_profile_index import (
+    UserProfileIndex,
+    get_user_profile_index,
+)
+from app.domain.matching.profile import ProfileUpdate
 from app.domain.shared.value_objects import (
     CurrencyType,
     Salary,
@@ -8,58 +17,59 @@ from app.domain.shared.value_objects import (
     WorkFormat,
 )
 from app.domain.user.entities import User
-from app.domain.user.value_objects import FilterMode, UserId
+from app.domain.user.value_objects import DeliveryMode, FilterMode, UserId
 
 
 class UserService:
-    def __init__(self, uow: UserUnitOfWork) -> None:
+    def __init__(
+        self,
+        uow: UserUnitOfWork,
+        profile_index: UserProfileIndex | None = None,
+        profile_changes: ProfileChangeQueue | None = None,
+    ) -> None:
         self._uow = uow
+        # Both define __len__, so an empty one is falsy; compare with None.
+        self._profile_index = (
+            profile_index if profile_index is not None else get_user_profile_index()
+        )
+        self._profile_changes = (
+            profile_changes if profile_changes is not None else get_profile_change_queue()
+        )
 
     async def get_user_by_tg_id(self, tg_id: int) -> User | None:
         async with self._uow:
             return await self._uow.users.get_by_tg_id(UserId(tg_id))
 
-    async def get_or_create_user(self, tg_id: int, username: str | None) -> tuple[User, bool]:
-        async with self._uow:
-            user = await self._uow.users.get_by_tg_id(UserId(tg_id))
-            if user is None:
-                user = User.create(tg_id=tg_id, username=username)
-                await self._uow.users.add(user)
-                return user, True
+    async def register_user(self, tg_id: int, username: str | None) -> bool:
+        """Create the user or refresh an existing one; returns whether it is new.
 
-            if user.username != username:
-                user.username = username
-                await self._uow.users.update(user)
-            return user, False
+        Writing to the bot means it is no longer blocked, so an inactive user
+        is reactivated.
+        """
+        async with self._uow:
+            update = await self._uow.users.register(User.create(tg_id=tg_id, username=username))
+        created = update.previous is None
+        if created or not update.was_active:
+            self._profile_index.upsert(update.current)
+        return created
 
     async def update_resume(self, tg_id: int, dto: OutResumeParse) -> bool:
+        salary = dto.salary if dto.salary is not None and dto.salary.amount is not None else None
+        work_format = None if dto.work_format == WorkFormat.UNDEFINED else dto.work_format
         async with self._uow:
-            user = await self._uow.users.get_by_tg_id(UserId(tg_id))
-            if user is None:
-                return False
-
-            user.cv_text = dto.full_relevant_text_from_resume
-            user.cv_specializations = Specializations.from_strs(
-                [item.value for item in dto.specializations]
+            update = await self._uow.users.update_resume(
+                UserId(tg_id),
+                cv_text=dto.full_relevant_text_from_resume,
+                specializations=Specializations.from_strs(
+                    [item.value for item in dto.specializations]
+                ),
+                skills=Skills.from_strs([item.value for item in dto.skills]),
+                salary=salary,
+                salary_mode=FilterMode.STRICT if salary is not None else FilterMode.SOFT,
+                work_format=work_format,
+                work_format_mode=FilterMode.STRICT if work_format is not None else FilterMode.SOFT,
             )
-            user.cv_skills = Skills.from_strs([item.value for item in dto.skills])
-
-            user.cv_salary = dto.salary
-            if dto.salary is not None and dto.salary.amount is not None:
-                user.filter_salary_mode = FilterMode.STRICT
-            else:
-                user.cv_salary = None
-                user.filter_salary_mode = FilterMode.SOFT
-
-            work_format = dto.work_format
-            user.cv_work_format = None if work_format == WorkFormat.UNDEFINED else work_format
-            if user.cv_work_format is not None:
-                user.filter_work_format_mode = FilterMode.STRICT
-            else:
-                user.filter_work_format_mode = FilterMode.SOFT
-
-            await self._uow.users.update(user)
-        return True
+        return self._on_profile_saved(update)
 
     async def update_profile_specializations_and_skills(
         self,
@@ -68,14 +78,12 @@ class UserService:
         skills: list[str],
     ) -> bool:
         async with self._uow:
-            user = await self._uow.users.get_by_tg_id(UserId(tg_id))
-            if user is None:
-                return False
-
-            user.cv_specializations = Specializations.from_strs(specializations)
-            user.cv_skills = Skills.from_strs(skills)
-            await self._uow.users.update(user)
-        return True
+            update = await self._uow.users.update_specializations_and_skills(
+                UserId(tg_id),
+                Specializations.from_strs(specializations),
+                Skills.from_strs(skills),
+            )
+        return self._on_profile_saved(update)
 
     async def update_profile_work_format_filter(
         self,
@@ -83,18 +91,14 @@ class UserService:
         work_format: WorkFormat | None,
         work_format_mode: FilterMode,
     ) -> bool:
+        normalized_work_format = None if work_format == WorkFormat.UNDEFINED else work_format
         async with self._uow:
-            user = await self._uow.users.get_by_tg_id(UserId(tg_id))
-            if user is None:
-                return False
-
-            normalized_work_format = None if work_format == WorkFormat.UNDEFINED else work_format
-            user.cv_work_format = normalized_work_format
-            user.filter_work_format_mode = (
-                work_format_mode if normalized_work_format is not None else FilterMode.SOFT
+            update = await self._uow.users.update_work_format_filter(
+                UserId(tg_id),
+                normalized_work_format,
+                work_format_mode if normalized_work_format is not None else FilterMode.SOFT,
             )
-            await self._uow.users.update(user)
-        return True
+        return self._on_profile_saved(update)
 
     async def update_profile_salary_filter(
         self,
@@ -102,20 +106,24 @@ class UserService:
         salary_amount_rub: int | None,
         salary_mode: FilterMode,
     ) -> bool:
+        if salary_mode == FilterMode.STRICT and salary_amount_rub is not None:
+            salary = Salary.create(amount=salary_amount_rub, currency=CurrencyType.RUB.value)
+        else:
+            salary, salary_mode = None, FilterMode.SOFT
         async with self._uow:
-            user = await self._uow.users.get_by_tg_id(UserId(tg_id))
-            if user is None:
-                return False
+            update = await self._uow.users.update_salary_filter(UserId(tg_id), salary, salary_mode)
+        return self._on_profile_saved(update)
 
-            if salary_mode == FilterMode.STRICT and salary_amount_rub is not None:
-                user.cv_salary = Salary.create(
-                    amount=salary_amount_rub,
-                    currency=CurrencyType.RUB.value,
-                )
-                user.filter_salary_mode = FilterMode.STRICT
-            else:
-                user.cv_salary = None
-                user.filter_salary_mode = FilterMode.SOFT
-
-            await self._uow.users.update(user)
+    async def update_delivery_mode(self, tg_id: int, delivery_mode: DeliveryMode) -> bool:
+        async with self._uow:
+            return await self._uow.users.update_delivery_mode(UserId(tg_id), delivery_mode)
+
+    def _on_profile_saved(self, update: ProfileUpdate | None) -> bool:
+        if update is None:
+            return False
+        if update.is_active:
+            self._profile_index.upsert(update.current)
+            self._profile_changes.notify(update.previous, update.current)
+        else:
+            self._profile_index.remove(update.current.tg_id)
         return True
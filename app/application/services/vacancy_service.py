@@ -53,6 +53,15 @@ class VacancyService:
                 self._observability.observe_not_vacancy_detected(1)
                 return None
 
+            if not result.specializations or not result.skills:
+                # Vacancy.create would reject it anyway; bail out before it is mirrored.
+                application_logfire.info(
+                    "Vacancy skipped: no specializations or skills to match on",
+                    chat_id=raw_vacancy_info.chat_id,
+                    message_id=raw_vacancy_info.message_id,
+                )
+                return None
+
             application_logfire.info(
                 "Vacancy parsed",
                 chat_id=raw_vacancy_info.chat_id,
@@ -66,7 +75,8 @@ class VacancyService:
         self,
         raw_vacancy_info: InfoRawVacancy,
         parse_result: OutVacancyParse,
-    ) -> VacancyId:
+    ) -> VacancyId | None:
+        """Store the vacancy; returns None when one with the same content hash exists."""
         text = raw_vacancy_info.text.strip()
         if not text:
             raise ValueError("Vacancy text is empty")
@@ -96,7 +106,9 @@ class VacancyService:
                 ),
             )
             async with self._uow:
-                await self._uow.vacancies.upsert(vacancy)
+                vacancy_id = await self._uow.vacancies.insert_if_absent(vacancy)
+        if vacancy_id is None:
+            return None
         self._observability.observe_vacancy_collected(1)
 
-        return vacancy.id
+        return vacancy_id
@@ -0,0 +1,22 @@
+import asyncio
+
+from app.bootstrap.bootstrap import build_scraper
+from app.core.config import config
+from app.infrastructure.observability import init_logfire
+from app.infrastructure.sentry import init_sentry
+
+
+async def main() -> None:
+    config.validate_runtime()
+    init_sentry()
+    init_logfire()
+
+    scraper, provider = await build_scraper()
+    try:
+        await scraper.backfill()
+    finally:
+        await provider.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
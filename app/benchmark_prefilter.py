@@ -0,0 +1,151 @@
+"""Benchmark the matching prefilter query plan on synthetic users.
+
+For each size a scratch schema with a copy of `users` (indexes included) is
+filled with synthetic profiles, vacuumed and analyzed. The repository's
+prefilter query is then explained with and without index scans allowed, so
+the plan change and its cost are visible side by side. Needs a migrated
+database; the scratch schema is dropped afterwards.
+"""
+
+import argparse
+import asyncio
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.domain.shared.value_objects import Skills, Specializations
+from app.infrastructure.db import engine
+from app.infrastructure.db.repositories.user_repository import build_prefilter_query
+
+BENCH_SCHEMA = "prefilter_bench"
+_DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+_CV_TEXT_LENGTH = 1500
+_INACTIVE_SHARE = 0.1
+
+_SEED_USERS_SQL = """
+INSERT INTO users (
+    tg_id, cv_text, cv_specializations, cv_skills,
+    cv_specializations_mask, cv_skills_mask,
+    filter_salary_mode, filter_work_format_mode, is_active
+)
+SELECT
+    g,
+    repeat('x', :cv_text_length),
+    '[]'::jsonb,
+    '[]'::jsonb,
+    1 << floor(random() * 8)::int,
+    (1::bigint << floor(random() * 35)::int)
+        | (1::bigint << floor(random() * 35)::int)
+        | (1::bigint << floor(random() * 35)::int),
+    'SOFT',
+    'SOFT',
+    random() >= :inactive_share
+FROM generate_series(1, :size) AS g
+"""
+
+
+def prefilter_sql(specializations_mask: int, skills_mask: int) -> str:
+    query = build_prefilter_query(specializations_mask, skills_mask)
+    return str(query.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+
+
+async def explain_prefilter(
+    conn: AsyncConnection,
+    specializations_mask: int,
+    skills_mask: int,
+    *,
+    analyze: bool = False,
+) -> dict[str, Any]:
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+    sql = prefilter_sql(specializations_mask, skills_mask)
+    result = await conn.execute(text(f"EXPLAIN ({options}) {sql}"))
+    plans: list[dict[str, Any]] = result.scalar_one()
+    return plans[0]
+
+
+def plan_nodes(plan: dict[str, Any]) -> list[tuple[str, str | None]]:
+    """Flatten a JSON plan into (node type, index name) pairs, outermost first."""
+    node = plan.get("Plan", plan)
+    nodes = [(node["Node Type"], node.get("Index Name"))]
+    for child in node.get("Plans", []):
+        nodes.extend(plan_nodes(child))
+    return nodes
+
+
+async def seed_bench_users(conn: AsyncConnection, size: int) -> None:
+    """Fill a fresh scratch copy of `users` and point the connection's search_path at it.
+
+    Needs an autocommit connection for the VACUUM.
+    """
+    await conn.execute(text(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE"))
+    await conn.execute(text(f"CREATE SCHEMA {BENCH_SCHEMA}"))
+    await conn.execute(
+        text(
+            f"CREATE TABLE {BENCH_SCHEMA}.users "
+            "(LIKE public.users INCLUDING DEFAULTS INCLUDING INDEXES)"
+        )
+    )
+    await conn.execute(text(f"SET search_path TO {BENCH_SCHEMA}"))
+    await conn.execute(
+        text(_SEED_USERS_SQL),
+        {
+            "cv_text_length": _CV_TEXT_LENGTH,
+            "inactive_share": _INACTIVE_SHARE,
+            "size": size,
+        },
+    )
+    await conn.execute(text("VACUUM ANALYZE users"))
+
+
+async def _measure(conn: AsyncConnection, specializations_mask: int, skills_mask: int) -> str:
+    plan = await explain_prefilter(conn, specializations_mask, skills_mask, analyze=True)
+    nodes = ", ".join(
+        f"{node_type} ({index})" if index else node_type for node_type, index in plan_nodes(plan)
+    )
+    return f"{plan['Execution Time']:.1f} ms via {nodes}"
+
+
+async def run(sizes: list[int]) -> None:
+    specializations_mask = Specializations.from_strs(["Backend"]).to_mask()
+    skills_mask = Skills.from_strs(["Python", "SQL"]).to_mask()
+    async with engine.connect() as raw_conn:
+        conn = await raw_conn.execution_options(isolation_level="AUTOCOMMIT")
+        # Seeding a million rows and vacuuming them outlasts DB_STATEMENT_TIMEOUT_MS.
+        await conn.execute(text("SET statement_timeout = 0"))
+        try:
+            for size in sizes:
+                await seed_bench_users(conn, size)
+                indexed = await _measure(conn, specializations_mask, skills_mask)
+                await conn.execute(text("SET enable_indexscan = off"))
+                await conn.execute(text("SET enable_indexonlyscan = off"))
+                await conn.execute(text("SET enable_bitmapscan = off"))
+                sequential = await _measure(conn, specializations_mask, skills_mask)
+                await conn.execute(text("RESET ALL"))
+                print(f"{size:>9} users | index: {indexed}")
+                print(f"{'':>9}       | no index: {sequential}")
+        finally:
+            await drop_bench_schema(conn)
+    await engine.dispose()
+
+
+async def drop_bench_schema(conn: AsyncConnection) -> None:
+    await conn.execute(text("RESET search_path"))
+    await conn.execute(text(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE"))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(_DEFAULT_SIZES),
+        help="numbers of synthetic users to benchmark",
+    )
+    args = parser.parse_args()
+    await run(args.sizes)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,20 +1,35 @@
+from datetime import timedelta
+
 from aiogram import Bot, Dispatcher
 from aiogram.fsm.storage.memory import MemoryStorage
 
 from app.core.config import config
-from app.infrastructure.db import async_session_factory
-from app.infrastructure.extractors.vacancy_extractor import GoogleVacancyLLMExtractor
+from app.infrastructure.db import (
+    async_session_factory,
+    ingest_session_factory,
+    matching_session_factory,
+)
+from app.application.ports.llm_port import IVacancyLLMExtractor
+from app.application.ports.observability_port import IObservabilityService
+from app.infrastructure.extractors import (
+    CachedVacancyLLMExtractor,
+    GoogleVacancyLLMExtractor,
+    PreClassifiedVacancyLLMExtractor,
+)
+from app.infrastructure.notifications import TelegramDeliverySender, get_telegram_send_limiter
 from app.infrastructure.observability import (
     build_observability_service,
     init_logfire,
     init_metrics_server,
 )
+from app.infrastructure.preclassifier import HashedLogisticRegression, VacancyPreClassifier
 from app.infrastructure.sentry import init_sentry
 from app.infrastructure.telegram.miniapp_server import build_miniapp_server
 from app.infrastructure.telegram.telethon_client import TelethonClientProvider
 from app.telegram.bot import get_router as get_bot_router
 from app.telegram.bot.commands import setup_bot_commands
 from app.telegram.bot.middlewares import UserGuardMiddleware
+from app.telegram.notifier.worker import DeliveryWorker
 from app.telegram.scrapper.handlers import TelegramScraper
 
 from app.bootstrap.models import RuntimeComponents
@@ -35,25 +50,67 @@ def build_bot() -> tuple[Dispatcher, Bot]:
     return dp, bot
 
 
-async def build_scraper(bot: Bot) -> tuple[TelegramScraper, TelethonClientProvider]:
+def build_vacancy_extractor(observability: IObservabilityService) -> IVacancyLLMExtractor:
+    google_extractor = GoogleVacancyLLMExtractor()
+    extractor: IVacancyLLMExtractor = google_extractor
+    if config.LLM_CACHE_ENABLED:
+        extractor = CachedVacancyLLMExtractor(
+            extractor,
+            ingest_session_factory,
+            observability,
+            version=google_extractor.cache_version,
+            ttl=timedelta(hours=config.LLM_CACHE_TTL_HOURS),
+            max_entries=config.LLM_CACHE_MAX_ENTRIES,
+            batch_size=config.LLM_BATCH_SIZE,
+        )
+    if config.PRECLASSIFIER_MODE == "off":
+        return extractor
+
+    model = (
+        HashedLogisticRegression.load(config.PRECLASSIFIER_MODEL_PATH)
+        if config.PRECLASSIFIER_MODEL_PATH
+        else None
+    )
+    return PreClassifiedVacancyLLMExtractor(
+        extractor,
+        VacancyPreClassifier(model, reject_threshold=config.PRECLASSIFIER_REJECT_THRESHOLD),
+        observability,
+        mode=config.PRECLASSIFIER_MODE,
+    )
+
+
+async def build_scraper() -> tuple[TelegramScraper, TelethonClientProvider]:
     provider = TelethonClientProvider()
     client = await provider.start()
-    extractor = GoogleVacancyLLMExtractor()
     observability = build_observability_service()
+    extractor = build_vacancy_extractor(observability)
     scraper = TelegramScraper(
         client,
-        bot,
-        async_session_factory,
+        ingest_session_factory,
         extractor,
         observability,
+        matching_session_factory=matching_session_factory,
     )
     return scraper, provider
 
 
+def build_delivery_worker(bot: Bot) -> DeliveryWorker:
+    observability = build_observability_service()
+    sender = TelegramDeliverySender(
+        bot,
+        observability,
+        get_telegram_send_limiter(),
+        concurrency=config.TELEGRAM_SEND_CONCURRENCY,
+        max_flood_retries=config.TELEGRAM_FLOOD_MAX_RETRIES,
+        mirror_channel_username=config.MIRROR_CHANNEL_USERNAME,
+    )
+    return DeliveryWorker(matching_session_factory, sender, observability)
+
+
 async def build_runtime_components() -> RuntimeComponents:
     dp, bot = build_bot()
     await setup_bot_commands(bot)
-    scraper, provider = await build_scraper(bot)
+    scraper, provider = await build_scraper()
     miniapp_server = build_miniapp_server()
     return RuntimeComponents(
         dp=dp,
@@ -61,4 +118,5 @@ async def build_runtime_components() -> RuntimeComponents:
         scraper=scraper,
         provider=provider,
         miniapp_server=miniapp_server,
+        delivery_worker=build_delivery_worker(bot) if config.DELIVERY_WORKER_ENABLED else None,
     )
@@ -5,6 +5,7 @@ from aiogram import Bot, Dispatcher
 
 from app.infrastructure.telegram.miniapp_server import MiniAppServer
 from app.infrastructure.telegram.telethon_client import TelethonClientProvider
+from app.telegram.notifier.worker import DeliveryWorker
 from app.telegram.scrapper.handlers import TelegramScraper
 
 
@@ -15,6 +16,7 @@ class RuntimeComponents:
     scraper: TelegramScraper
     provider: TelethonClientProvider
     miniapp_server: MiniAppServer
+    delivery_worker: DeliveryWorker | None = None
 
 
 @dataclass(slots=True)
@@ -22,6 +24,7 @@ class RuntimeTasks:
     scraper_task: asyncio.Task[None] | None = None
     bot_task: asyncio.Task[None] | None = None
     miniapp_task: asyncio.Task[None] | None = None
+    delivery_task: asyncio.Task[None] | None = None
     stop_task: asyncio.Task[bool] | None = None
 
     def active(self) -> list[asyncio.Task[object]]:
@@ -31,6 +34,7 @@ class RuntimeTasks:
                 self.scraper_task,
                 self.bot_task,
                 self.miniapp_task,
+                self.delivery_task,
                 self.stop_task,
             )
             if task is not None and not task.done()
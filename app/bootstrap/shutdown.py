@@ -3,6 +3,8 @@ import signal
 from contextlib import suppress
 
 from app.core.logger import get_app_logger
+from app.infrastructure.db import dispose_engines
+from app.telegram.scrapper.handlers import TelegramScraper
 
 from app.bootstrap.models import RuntimeComponents, RuntimeTasks
 
@@ -28,9 +30,12 @@ def remove_shutdown_handlers(installed_signals: list[signal.Signals]) -> None:
 
 def request_component_shutdown(components: RuntimeComponents) -> None:
     components.miniapp_server.should_exit = True
+    if components.delivery_worker is not None:
+        components.delivery_worker.stop()
 
 
 async def stop_components(components: RuntimeComponents) -> None:
+    await _drain_scraper(components.scraper)
     await _stop_scraper(components.provider)
     await _stop_bot(components.dp)
     await _close_bot_session(components.bot)
@@ -60,8 +65,29 @@ async def graceful_shutdown(
 ) -> None:
     remove_shutdown_handlers(installed_signals)
     request_component_shutdown(components)
+    await _finish_delivery_batch(tasks)
     await stop_components(components)
     await await_task_shutdown(tasks)
+    await dispose_engines()
+
+
+async def _finish_delivery_batch(tasks: RuntimeTasks, timeout: float = 30) -> None:
+    # The worker still needs the bot session for the batch in flight.
+    if tasks.delivery_task is None or tasks.delivery_task.done():
+        return
+    try:
+        await asyncio.wait_for(asyncio.shield(tasks.delivery_task), timeout=timeout)
+    except TimeoutError:
+        logger.warning("Delivery worker did not finish its batch in %ss", timeout)
+    except Exception:
+        logger.exception("Delivery worker failed during shutdown")
+
+
+async def _drain_scraper(scraper: TelegramScraper) -> None:
+    try:
+        await scraper.stop()
+    except Exception:
+        logger.exception("Failed to drain scraper ingest queue during shutdown")
 
 
 async def _stop_scraper(provider) -> None:
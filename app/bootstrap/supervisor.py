@@ -23,6 +23,11 @@ def start_runtime_tasks(
             run_miniapp_server(components.miniapp_server),
             name="miniapp-server",
         ),
+        delivery_task=(
+            asyncio.create_task(components.delivery_worker.start(), name="delivery-worker")
+            if components.delivery_worker is not None
+            else None
+        ),
         stop_task=asyncio.create_task(stop_event.wait(), name="shutdown-signal"),
     )
 
@@ -34,6 +39,7 @@ async def wait_runtime(tasks: RuntimeTasks) -> None:
             tasks.scraper_task,
             tasks.bot_task,
             tasks.miniapp_task,
+            tasks.delivery_task,
             tasks.stop_task,
         )
         if task is not None
@@ -30,15 +30,77 @@ class BaseAppSettings(BaseSettings):
 
     CHANNELS_MAP_PATH: str = "channels_map.json"
     MIRROR_CHANNEL: int
+    MIRROR_CHANNEL_USERNAME: str = ""
+
+    INGEST_WORKERS: int = 4
+    INGEST_QUEUE_MAXSIZE: int = 200
+    INGEST_DRAIN_TIMEOUT_SECONDS: float = 30.0
+    INGEST_JOB_LEASE_SECONDS: float = 600.0
+    INGEST_JOB_MAX_ATTEMPTS: int = 8
+    INGEST_JOB_RETENTION_HOURS: int = 72
+    INGEST_REPLAY_INTERVAL_SECONDS: float = 15.0
+    INGEST_REPLAY_BATCH_SIZE: int = 50
+
+    DEDUP_BLOOM_CAPACITY: int = 200_000
+    DEDUP_BLOOM_ERROR_RATE: float = 0.001
+    DEDUP_RECENT_HASHES: int = 10_000
+    SIMHASH_MAX_DISTANCE: int = 3
+
+    USER_INDEX_REFRESH_SECONDS: float = 300.0
+    REVERSE_MATCH_ENABLED: bool = True
+    REVERSE_MATCH_WINDOW_HOURS: int = 72
+    REVERSE_MATCH_MAX_VACANCIES: int = 20
+    REVERSE_MATCH_QUIET_SECONDS: float = 60.0
+    REVERSE_MATCH_POLL_SECONDS: float = 5.0
+    DELIVERY_WORKER_ENABLED: bool = True
+    DELIVERY_BATCH_SIZE: int = 200
+    DELIVERY_POLL_SECONDS: float = 1.0
+    DELIVERY_LEASE_SECONDS: float = 300.0
+    DELIVERY_MAX_ATTEMPTS: int = 5
+    DIGEST_INTERVAL_MINUTES: int = 60
+    DIGEST_BATCH_SIZE: int = 1000
+    TELEGRAM_SEND_RATE_PER_SECOND: float = 25.0
+    TELEGRAM_PER_CHAT_RATE_PER_SECOND: float = 1.0
+    TELEGRAM_SEND_CONCURRENCY: int = 16
+    TELEGRAM_FLOOD_MAX_RETRIES: int = 3
+
+    BACKFILL_ON_STARTUP: bool = True
+    BACKFILL_BATCH_SIZE: int = 20
+    BACKFILL_BATCH_DELAY_SECONDS: float = 2.0
+    BACKFILL_MAX_MESSAGES_PER_CHANNEL: int = 500
 
     POSTGRES_SERVER: str
     POSTGRES_PORT: int
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = ""
+    DB_POOL_SIZE: int = 5
+    DB_INGEST_POOL_SIZE: int = 5
+    DB_MATCHING_POOL_SIZE: int = 5
+    DB_MINIAPP_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 30_000
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
 
     GOOGLE_API_KEY: str
     GOOGLE_MODEL: str = "gemini-2.5-flash"
+    LLM_MAX_CONCURRENCY: int = 4
+    LLM_REQUESTS_PER_MINUTE: float = 60
+    LLM_TOKENS_PER_MINUTE: float = 500_000
+    LLM_INTERACTIVE_DEADLINE_SECONDS: float = 90
+    LLM_BACKGROUND_DEADLINE_SECONDS: float = 300
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    LLM_CIRCUIT_RECOVERY_SECONDS: float = 30
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_TTL_HOURS: int = 720
+    LLM_CACHE_MAX_ENTRIES: int = 200_000
+    LLM_BATCH_SIZE: int = 10
+    PRECLASSIFIER_MODE: Literal["off", "shadow", "enforce"] = "shadow"
+    PRECLASSIFIER_MODEL_PATH: str | None = None
+    PRECLASSIFIER_REJECT_THRESHOLD: float = 0.1
 
     SENTRY_DSN: str | None = None
     SENTRY_ENV: str
@@ -116,6 +178,13 @@ class BaseAppSettings(BaseSettings):
         return flattened
 
     def validate_runtime(self) -> None:
+        # An ingest job still queued for the LLM when its lease expires is leased
+        # again by the outbox replay and processed twice.
+        if self.LLM_BACKGROUND_DEADLINE_SECONDS >= self.INGEST_JOB_LEASE_SECONDS:
+            raise ValueError(
+                "LLM_BACKGROUND_DEADLINE_SECONDS must be lower than INGEST_JOB_LEASE_SECONDS"
+            )
+
         if self.APP_ENV != "production":
             return
 
@@ -0,0 +1,10 @@
+from .entities import Delivery, DeliveryPriority, DeliveryReport, DeliveryStatus
+from .repository import IDeliveryRepository
+
+__all__ = [
+    "Delivery",
+    "DeliveryPriority",
+    "DeliveryReport",
+    "DeliveryStatus",
+    "IDeliveryRepository",
+]
@@ -0,0 +1,39 @@
+from dataclasses import dataclass, field
+from enum import IntEnum, StrEnum
+from uuid import UUID
+
+
+class DeliveryStatus(StrEnum):
+    PENDING = "PENDING"
+    SENDING = "SENDING"
+    SENT = "SENT"
+    FAILED = "FAILED"
+    FORBIDDEN = "FORBIDDEN"
+
+
+class DeliveryPriority(IntEnum):
+    """Lower value is delivered first."""
+
+    FRESH = 0
+    REVERSE_MATCH = 1
+
+
+@dataclass(slots=True)
+class Delivery:
+    id: int
+    vacancy_id: UUID
+    tg_id: int
+    mirror_chat_id: int
+    mirror_message_id: int
+    priority: DeliveryPriority
+    attempts: int
+    preview: str | None = None
+
+
+@dataclass(slots=True)
+class DeliveryReport:
+    """Outcome of sending a batch of deliveries, as delivery ids per result."""
+
+    sent: list[int] = field(default_factory=list)
+    forbidden: list[int] = field(default_factory=list)
+    failed: dict[int, str] = field(default_factory=dict)
@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Protocol, runtime_checkable
+from uuid import UUID
+
+from app.domain.delivery.entities import Delivery, DeliveryPriority
+
+
+@runtime_checkable
+class IDeliveryRepository(Protocol):
+    async def enqueue(
+        self,
+        vacancy_id: UUID,
+        tg_ids: list[int],
+        priority: DeliveryPriority,
+    ) -> int: ...
+
+    async def lease_due(self, limit: int, lease_seconds: float) -> list[Delivery]: ...
+
+    async def lease_digests(self, limit: int, lease_seconds: float) -> list[Delivery]: ...
+
+    async def count_open(self) -> int: ...
+
+    async def mark_sent(self, delivery_ids: list[int]) -> None: ...
+
+    async def mark_forbidden(self, delivery_ids: list[int]) -> None: ...
+
+    async def mark_retry(
+        self,
+        delivery_ids: list[int],
+        error: str,
+        next_attempt_at: datetime,
+    ) -> None: ...
+
+    async def mark_dead(self, delivery_ids: list[int], error: str) -> None: ...
+
+    async def cancel_for_users(self, tg_ids: list[int]) -> int: ...
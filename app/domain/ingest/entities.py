@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+
+
+class IngestJobStatus(StrEnum):
+    PENDING = "PENDING"
+    PROCESSING = "PROCESSING"
+    DONE = "DONE"
+    DEAD = "DEAD"
+
+
+@dataclass(slots=True)
+class IngestJob:
+    id: int
+    chat_id: int
+    message_id: int
+    text: str
+    status: IngestJobStatus
+    attempts: int
+    next_attempt_at: datetime
+    created_at: datetime
+    last_error: str | None = None
+    mirror_chat_id: int | None = None
+    mirror_message_id: int | None = None
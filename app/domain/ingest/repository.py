@@ -0,0 +1,57 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Protocol, runtime_checkable
+
+from app.domain.ingest.entities import IngestJob
+
+
+@runtime_checkable
+class IIngestJobRepository(Protocol):
+    async def add_leased(
+        self,
+        chat_id: int,
+        message_id: int,
+        text: str,
+        lease_seconds: float,
+    ) -> IngestJob | None: ...
+
+    async def lease_due(self, limit: int, lease_seconds: float) -> list[IngestJob]: ...
+
+    async def set_mirror(
+        self,
+        job_id: int,
+        leased_attempts: int,
+        mirror_chat_id: int,
+        mirror_message_id: int,
+    ) -> bool: ...
+
+    async def mark_done(self, job_id: int, leased_attempts: int) -> bool: ...
+
+    async def mark_retry(
+        self,
+        job_id: int,
+        leased_attempts: int,
+        error: str,
+        next_attempt_at: datetime,
+    ) -> bool: ...
+
+    async def mark_dead(self, job_id: int, leased_attempts: int, error: str) -> bool: ...
+
+    async def defer(
+        self,
+        job_id: int,
+        leased_attempts: int,
+        reason: str,
+        next_attempt_at: datetime,
+    ) -> bool: ...
+
+    async def purge_done(self, older_than: datetime) -> int: ...
+
+    def iter_texts(self, batch_size: int = 1000) -> AsyncIterator[str]: ...
+
+
+@runtime_checkable
+class IChannelCursorRepository(Protocol):
+    async def get_last_message_id(self, chat_id: int) -> int | None: ...
+
+    async def advance(self, chat_id: int, message_id: int) -> None: ...
@@ -1,4 +1,13 @@
-from .entities import MatchDecision, MatchRejectionReason
-from .policy import evaluate_match
+from .entities import BulkMatchResult, MatchDecision, MatchRejectionReason
+from .policy import evaluate_match, evaluate_profile_match
+from .profile import MatchProfile, ProfileUpdate
 
-__all__ = ["MatchDecision", "MatchRejectionReason", "evaluate_match"]
+__all__ = [
+    "BulkMatchResult",
+    "MatchDecision",
+    "MatchProfile",
+    "MatchRejectionReason",
+    "ProfileUpdate",
+    "evaluate_match",
+    "evaluate_profile_match",
+]
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
 
+from app.domain.shared.value_objects import SkillType
+
 
 class MatchRejectionReason(StrEnum):
     SALARY = "salary"
@@ -11,3 +13,13 @@ class MatchRejectionReason(StrEnum):
 class MatchDecision:
     accepted: bool
     reason: MatchRejectionReason | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BulkMatchResult:
+    """Outcome of matching one vacancy against many users at once."""
+
+    candidate_count: int
+    accepted_ids: tuple[int, ...]
+    rejected: dict[MatchRejectionReason, int] = field(default_factory=dict)
+    shared_skill_counts: dict[SkillType, int] = field(default_factory=dict)
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from app.domain.shared.value_objects import WorkFormat
+from app.domain.user.entities import User
+from app.domain.user.value_objects import FilterMode
+
+
+class MatchProfile(NamedTuple):
+    """The slice of a user that matching needs, with filter modes already applied.
+
+    `min_salary` and `work_format` are set only when the corresponding filter is
+    strict, so a `None` means "accept anything". Specializations and skills are
+    bitmasks (see `SPECIALIZATION_BIT_ORDER` / `SKILL_BIT_ORDER`).
+    """
+
+    tg_id: int
+    specializations_mask: int
+    skills_mask: int
+    min_salary: int | None
+    work_format: WorkFormat | None
+
+    @classmethod
+    def from_user(cls, user: User) -> "MatchProfile":
+        min_salary = None
+        if user.filter_salary_mode == FilterMode.STRICT and user.cv_salary is not None:
+            min_salary = user.cv_salary.amount
+
+        work_format = None
+        if user.filter_work_format_mode == FilterMode.STRICT:
+            work_format = user.cv_work_format
+
+        return cls(
+            tg_id=user.tg_id.value,
+            specializations_mask=user.cv_specializations.to_mask(),
+            skills_mask=user.cv_skills.to_mask(),
+            min_salary=min_salary,
+            work_format=work_format,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileUpdate:
+    """A user's match profile right before and after a write.
+
+    `previous` is None when the write created the user.
+    """
+
+    previous: MatchProfile | None
+    current: MatchProfile
+    was_active: bool
+    is_active: bool
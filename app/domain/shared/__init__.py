@@ -1,5 +1,7 @@
 from .domain_errors import DomainError
 from .value_objects import (
+    SKILL_BIT_ORDER,
+    SPECIALIZATION_BIT_ORDER,
     CurrencyType,
     Salary,
     Skills,
@@ -15,6 +17,8 @@ __all__ = [
     "CurrencyType",
     "SpecializationType",
     "SkillType",
+    "SPECIALIZATION_BIT_ORDER",
+    "SKILL_BIT_ORDER",
     "Specializations",
     "Skills",
     "Salary",
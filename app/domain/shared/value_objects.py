@@ -79,6 +79,71 @@ class SkillType(StrEnum):
     DATA_ANALYSIS = "Data Analysis"
 
 
+# Bit positions are persisted in the *_mask columns: append new members, never reorder.
+SPECIALIZATION_BIT_ORDER: tuple[SpecializationType, ...] = (
+    SpecializationType.BACKEND,
+    SpecializationType.FRONTEND,
+    SpecializationType.DATA_SCIENCE_ML,
+    SpecializationType.MOBILE,
+    SpecializationType.GAMEDEV,
+    SpecializationType.QA,
+    SpecializationType.INFRASTRUCTURE_DEVOPS,
+    SpecializationType.ANALYTICS,
+)
+
+SKILL_BIT_ORDER: tuple[SkillType, ...] = (
+    SkillType.PYTHON,
+    SkillType.JAVA_SCALA,
+    SkillType.C_SHARP,
+    SkillType.C_PLUSPLUS,
+    SkillType.GO,
+    SkillType.C,
+    SkillType.RUBY,
+    SkillType.PHP,
+    SkillType.NODE_JS,
+    SkillType.TYPESCRIPT,
+    SkillType.KOTLIN,
+    SkillType.REACT,
+    SkillType.VUE,
+    SkillType.ANGULAR,
+    SkillType.MACHINE_LEARNING,
+    SkillType.NLP,
+    SkillType.COMPUTER_VISION,
+    SkillType.RECOMMENDER_SYSTEMS,
+    SkillType.IOS,
+    SkillType.ANDROID,
+    SkillType.FLUTTER,
+    SkillType.REACT_NATIVE,
+    SkillType.UNITY,
+    SkillType.UNREAL_ENGINE,
+    SkillType.GAMEPLAY_PROGRAMMING,
+    SkillType.GRAPHICS,
+    SkillType.MANUAL_QA,
+    SkillType.QA_AUTOMATION,
+    SkillType.PERFORMANCE_TESTING,
+    SkillType.DEVOPS,
+    SkillType.SRE,
+    SkillType.DBA,
+    SkillType.SYSTEM_ADMINISTRATION,
+    SkillType.SQL,
+    SkillType.DATA_ANALYSIS,
+)
+
+_SPECIALIZATION_BITS = {item: 1 << index for index, item in enumerate(SPECIALIZATION_BIT_ORDER)}
+_SKILL_BITS = {item: 1 << index for index, item in enumerate(SKILL_BIT_ORDER)}
+
+
+def _to_mask[T](items: frozenset[T], bits: dict[T, int]) -> int:
+    mask = 0
+    for item in items:
+        mask |= bits[item]
+    return mask
+
+
+def _from_mask[T](mask: int, order: tuple[T, ...]) -> frozenset[T]:
+    return frozenset(item for index, item in enumerate(order) if mask >> index & 1)
+
+
 @dataclass(frozen=True, slots=True)
 class Specializations:
     items: frozenset[SpecializationType]
@@ -94,6 +159,13 @@ class Specializations:
 
         return cls(items=frozenset(valid_items))
 
+    @classmethod
+    def from_mask(cls, mask: int) -> "Specializations":
+        return cls(items=_from_mask(mask, SPECIALIZATION_BIT_ORDER))
+
+    def to_mask(self) -> int:
+        return _to_mask(self.items, _SPECIALIZATION_BITS)
+
 
 @dataclass(frozen=True, slots=True)
 class Skills:
@@ -113,6 +185,13 @@ class Skills:
 
         return cls(items=frozenset(valid_items))
 
+    @classmethod
+    def from_mask(cls, mask: int) -> "Skills":
+        return cls(items=_from_mask(mask, SKILL_BIT_ORDER))
+
+    def to_mask(self) -> int:
+        return _to_mask(self.items, _SKILL_BITS)
+
 
 @dataclass(frozen=True, slots=True)
 class Salary:
@@ -145,6 +224,8 @@ __all__ = [
     "CurrencyType",
     "SpecializationType",
     "SkillType",
+    "SPECIALIZATION_BIT_ORDER",
+    "SKILL_BIT_ORDER",
     "Specializations",
     "Skills",
     "Salary",
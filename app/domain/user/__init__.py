@@ -1,4 +1,4 @@
 from app.domain.user.entities import User
-from app.domain.user.value_objects import FilterMode, UserId
+from app.domain.user.value_objects import DeliveryMode, FilterMode, UserId
 
-__all__ = ["User", "FilterMode", "UserId"]
+__all__ = ["User", "DeliveryMode", "FilterMode", "UserId"]
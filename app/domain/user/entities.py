@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 from app.domain.shared.value_objects import Salary, Skills, Specializations, WorkFormat
-from app.domain.user.value_objects import FilterMode, UserId
+from app.domain.user.value_objects import DeliveryMode, FilterMode, UserId
 
 
 @dataclass(slots=True)
@@ -20,6 +20,7 @@ class User:
     filter_work_format_mode: FilterMode
 
     is_active: bool = True
+    delivery_mode: DeliveryMode = DeliveryMode.INSTANT
 
     @classmethod
     def create(
@@ -35,6 +36,7 @@ class User:
         cv_work_format: WorkFormat | str | None = None,
         filter_work_format_mode: FilterMode | str | None = None,
         is_active: bool = True,
+        delivery_mode: DeliveryMode | str | None = None,
     ) -> "User":
         specs = Specializations.from_strs(cv_specializations_raw or [])
         skills = Skills.from_strs(cv_skills_raw or [])
@@ -63,8 +65,15 @@ class User:
             cv_work_format=work_format,
             filter_work_format_mode=work_format_mode,
             is_active=is_active,
+            delivery_mode=DeliveryMode(delivery_mode) if delivery_mode else DeliveryMode.INSTANT,
         )
 
+    def activate(self) -> None:
+        self.is_active = True
+
+    def deactivate(self) -> None:
+        self.is_active = False
+
     @staticmethod
     def _normalize_mode(raw: FilterMode | str | None) -> FilterMode:
         if isinstance(raw, FilterMode):
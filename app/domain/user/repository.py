@@ -1,7 +1,10 @@
+from collections.abc import AsyncIterator
 from typing import Protocol, runtime_checkable
 
+from app.domain.matching.profile import MatchProfile, ProfileUpdate
+from app.domain.shared.value_objects import Salary, Skills, Specializations, WorkFormat
 from app.domain.user.entities import User
-from app.domain.user.value_objects import UserId
+from app.domain.user.value_objects import DeliveryMode, FilterMode, UserId
 
 
 @runtime_checkable
@@ -14,9 +17,51 @@ class IUserRepository(Protocol):
 
     async def upsert(self, user: User) -> None: ...
 
-    async def find_prefiltered_candidates(
+    async def register(self, user: User) -> ProfileUpdate: ...
+
+    async def update_resume(
+        self,
+        tg_id: UserId,
+        *,
+        cv_text: str | None,
+        specializations: Specializations,
+        skills: Skills,
+        salary: Salary | None,
+        salary_mode: FilterMode,
+        work_format: WorkFormat | None,
+        work_format_mode: FilterMode,
+    ) -> ProfileUpdate | None: ...
+
+    async def update_specializations_and_skills(
+        self,
+        tg_id: UserId,
+        specializations: Specializations,
+        skills: Skills,
+    ) -> ProfileUpdate | None: ...
+
+    async def update_work_format_filter(
+        self,
+        tg_id: UserId,
+        work_format: WorkFormat | None,
+        mode: FilterMode,
+    ) -> ProfileUpdate | None: ...
+
+    async def update_salary_filter(
+        self,
+        tg_id: UserId,
+        salary: Salary | None,
+        mode: FilterMode,
+    ) -> ProfileUpdate | None: ...
+
+    async def update_delivery_mode(self, tg_id: UserId, delivery_mode: DeliveryMode) -> bool: ...
+
+    async def find_prefiltered_profiles(
         self,
-        specializations: set[str],
-        skills: set[str],
+        specializations_mask: int,
+        skills_mask: int,
         is_active: bool = True,
-    ) -> list[User]: ...
+    ) -> list[MatchProfile]: ...
+
+    def iter_match_profiles(self, batch_size: int = 1000) -> AsyncIterator[MatchProfile]: ...
+
+    async def deactivate_many(self, tg_ids: list[int]) -> list[int]: ...
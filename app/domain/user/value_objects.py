@@ -10,3 +10,10 @@ class UserId:
 class FilterMode(StrEnum):
     STRICT = "STRICT"
     SOFT = "SOFT"
+
+
+class DeliveryMode(StrEnum):
+    """How matched vacancies reach the user: one forward each, or a periodic digest."""
+
+    INSTANT = "INSTANT"
+    DIGEST = "DIGEST"
@@ -1,11 +1,18 @@
 import hashlib
+import re
+from collections import Counter
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from uuid import UUID
 
 from app.domain.shared.value_objects import Salary, Skills, Specializations, WorkFormat
 from app.domain.vacancy.exceptions import ValidationError
-from app.domain.vacancy.value_objects import ContentHash, VacancyId
+from app.domain.vacancy.value_objects import ContentHash, SimHash, VacancyId
+
+SIMHASH_BITS = 64
+_SIMHASH_SHINGLE_SIZE = 3
+_URL_RE = re.compile(r"(?:https?://|www\.|t\.me/)\S+", re.IGNORECASE)
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
 
 
 @dataclass(slots=True)
@@ -24,6 +31,7 @@ class Vacancy:
 
     created_at: datetime
     is_active: bool = True
+    simhash: SimHash | None = None
 
     @classmethod
     def create(
@@ -64,6 +72,7 @@ class Vacancy:
             work_format=work_format,
             content_hash=cls.compute_content_hash(text),
             created_at=created_at or now,
+            simhash=cls.compute_simhash(text),
         )
 
     @staticmethod
@@ -74,5 +83,34 @@ class Vacancy:
         hash_val = hashlib.sha256(clean_text.encode("utf-8")).hexdigest()
         return ContentHash(hash_val)
 
+    @staticmethod
+    def compute_simhash(raw_text: str) -> SimHash:
+        """Fingerprint word shingles so reposts with edited links or emoji stay close.
+
+        Links are dropped and only word characters are kept, so such edits change
+        few shingles and flip few bits of the fingerprint.
+        """
+        words = _WORD_RE.findall(_URL_RE.sub(" ", raw_text.lower()))
+        if len(words) >= _SIMHASH_SHINGLE_SIZE:
+            shingles = Counter(
+                " ".join(words[index : index + _SIMHASH_SHINGLE_SIZE])
+                for index in range(len(words) - _SIMHASH_SHINGLE_SIZE + 1)
+            )
+        else:
+            shingles = Counter([" ".join(words)])
+
+        weights = [0] * SIMHASH_BITS
+        for shingle, count in shingles.items():
+            digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+            feature = int.from_bytes(digest, "big")
+            for bit in range(SIMHASH_BITS):
+                weights[bit] += count if feature >> bit & 1 else -count
+
+        value = 0
+        for bit, weight in enumerate(weights):
+            if weight > 0:
+                value |= 1 << bit
+        return SimHash(value)
+
     def deactivate(self) -> None:
         self.is_active = False
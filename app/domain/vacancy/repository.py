@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Protocol, runtime_checkable
 
 from app.domain.vacancy.entities import Vacancy
@@ -12,8 +14,24 @@ class IVacancyRepository(Protocol):
 
     async def exists_by_content_hash(self, content_hash: ContentHash) -> bool: ...
 
+    async def count(self) -> int: ...
+
+    def iter_content_hashes(self, batch_size: int = 10_000) -> AsyncIterator[str]: ...
+
+    def iter_simhashes(self, batch_size: int = 10_000) -> AsyncIterator[int]: ...
+
+    async def find_recent_for_profile(
+        self,
+        specializations_mask: int,
+        skills_mask: int,
+        since: datetime,
+        limit: int,
+    ) -> list[Vacancy]: ...
+
     async def add(self, vacancy: Vacancy) -> None: ...
 
     async def update(self, vacancy: Vacancy) -> None: ...
 
-    async def upsert(self, vacancy: Vacancy) -> None: ...
+    async def insert_if_absent(self, vacancy: Vacancy) -> VacancyId | None: ...
+
+    async def insert_many_if_absent(self, vacancies: list[Vacancy]) -> list[VacancyId]: ...
@@ -10,3 +10,13 @@ class VacancyId:
 @dataclass(frozen=True, slots=True)
 class ContentHash:
     value: str
+
+
+@dataclass(frozen=True, slots=True)
+class SimHash:
+    """64-bit locality-sensitive fingerprint of vacancy text."""
+
+    value: int
+
+    def distance(self, other: "SimHash") -> int:
+        return (self.value ^ other.value).bit_count()
@@ -0,0 +1,102 @@
+from collections.abc import Callable
+from enum import StrEnum
+from time import monotonic
+
+from app.application.ports.observability_port import IObservabilityService
+from app.core.logger import get_app_logger
+
+logger = get_app_logger(__name__)
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, name: str, retry_in: float) -> None:
+        super().__init__(f"Circuit {name} is open; retry in {retry_in:.1f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker for a flaky upstream.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls
+    fail fast for `recovery_timeout` seconds. Then up to `half_open_max_calls`
+    probes are let through: one success closes the circuit, one failure reopens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        observability: IObservabilityService,
+        *,
+        failure_threshold: int,
+        recovery_timeout: float,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.name = name
+        self._observability = observability
+        self._failure_threshold = max(failure_threshold, 1)
+        self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = max(half_open_max_calls, 1)
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._observability.observe_circuit_state(name, self._state.value)
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and self._retry_in() <= 0:
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call may go through right now."""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return
+        if state == CircuitState.HALF_OPEN and self._probes_in_flight < self._half_open_max_calls:
+            self._probes_in_flight += 1
+            return
+        raise CircuitOpenError(self.name, max(self._retry_in(), 0.0) or self._recovery_timeout)
+
+    def record_success(self) -> None:
+        self._failures = 0
+        if self._state != CircuitState.CLOSED:
+            self._probes_in_flight = 0
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        if self._state == CircuitState.HALF_OPEN:
+            self._open()
+            return
+        self._failures += 1
+        if self._state == CircuitState.CLOSED and self._failures >= self._failure_threshold:
+            self._open()
+
+    def record_ignored(self) -> None:
+        """Release a half-open probe whose outcome says nothing about upstream health."""
+        if self._state == CircuitState.HALF_OPEN and self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self._probes_in_flight = 0
+        self._transition(CircuitState.OPEN)
+
+    def _retry_in(self) -> float:
+        return self._opened_at + self._recovery_timeout - self._clock()
+
+    def _transition(self, state: CircuitState) -> None:
+        if state == self._state:
+            return
+        logger.warning("Circuit %s: %s -> %s", self.name, self._state.value, state.value)
+        self._state = state
+        self._observability.observe_circuit_state(self.name, state.value)
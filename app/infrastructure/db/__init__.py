@@ -1,11 +1,53 @@
-from .models import Base, User, Vacancy, init_db
+from .models import (
+    Base,
+    ChannelCursor,
+    Delivery,
+    IngestJob,
+    LLMExtractionCache,
+    User,
+    Vacancy,
+    init_db,
+)
+from .repositories.channel_cursor_repository import ChannelCursorRepository
+from .repositories.delivery_repository import DeliveryRepository
+from .repositories.ingest_job_repository import IngestJobRepository
+from .repositories.llm_extraction_cache_repository import LLMExtractionCacheRepository
 from .repositories.user_repository import UserRepository
 from .repositories.vacancy_repository import VacancyRepository
-from .session import async_session_factory, engine
-from .uow import MatchingUnitOfWork, SQLAlchemyUnitOfWork, UserUnitOfWork, VacancyUnitOfWork
+from .session import (
+    DatabaseWorkload,
+    async_session_factory,
+    dispose_engines,
+    engine,
+    engines,
+    ingest_session_factory,
+    matching_session_factory,
+    miniapp_session_factory,
+)
+from .uow import (
+    DeliveryUnitOfWork,
+    ExtractionCacheUnitOfWork,
+    IngestUnitOfWork,
+    MatchingUnitOfWork,
+    SQLAlchemyUnitOfWork,
+    UserUnitOfWork,
+    VacancyUnitOfWork,
+)
 
 __all__ = [
     "Base",
+    "DatabaseWorkload",
+    "ChannelCursor",
+    "ChannelCursorRepository",
+    "Delivery",
+    "DeliveryRepository",
+    "DeliveryUnitOfWork",
+    "ExtractionCacheUnitOfWork",
+    "IngestJob",
+    "IngestJobRepository",
+    "IngestUnitOfWork",
+    "LLMExtractionCache",
+    "LLMExtractionCacheRepository",
     "SQLAlchemyUnitOfWork",
     "MatchingUnitOfWork",
     "Vacancy",
@@ -15,6 +57,11 @@ __all__ = [
     "UserRepository",
     "UserUnitOfWork",
     "async_session_factory",
+    "dispose_engines",
     "engine",
+    "engines",
+    "ingest_session_factory",
     "init_db",
+    "matching_session_factory",
+    "miniapp_session_factory",
 ]
@@ -0,0 +1,18 @@
+from app.domain.ingest.entities import IngestJob, IngestJobStatus
+from app.infrastructure.db.models import IngestJob as IngestJobModel
+
+
+def ingest_job_from_model(model: IngestJobModel) -> IngestJob:
+    return IngestJob(
+        id=model.id,
+        chat_id=model.chat_id,
+        message_id=model.message_id,
+        text=model.text,
+        status=IngestJobStatus(model.status),
+        attempts=model.attempts,
+        next_attempt_at=model.next_attempt_at,
+        created_at=model.created_at,
+        last_error=model.last_error,
+        mirror_chat_id=model.mirror_chat_id,
+        mirror_message_id=model.mirror_message_id,
+    )
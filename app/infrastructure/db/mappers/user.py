@@ -1,43 +1,75 @@
+from typing import Any
+
+from sqlalchemy import Row
+
+from app.domain.matching.profile import MatchProfile
 from app.domain.shared.value_objects import Salary as UserSalary
 from app.domain.shared.value_objects import Skills as UserSkills
 from app.domain.shared.value_objects import Specializations as UserSpecializations
 from app.domain.shared.value_objects import WorkFormat as UserWorkFormat
 from app.domain.user.entities import User
-from app.domain.user.value_objects import FilterMode, UserId
+from app.domain.user.value_objects import DeliveryMode, FilterMode, UserId
 from app.infrastructure.db.models import User as UserModel
 
+MATCH_PROFILE_COLUMNS = (
+    UserModel.tg_id,
+    UserModel.cv_specializations_mask,
+    UserModel.cv_skills_mask,
+    UserModel.cv_salary_amount,
+    UserModel.cv_salary_currency,
+    UserModel.filter_salary_mode,
+    UserModel.cv_work_format,
+    UserModel.filter_work_format_mode,
+)
+
 
 def user_to_model(user: User) -> UserModel:
-    return UserModel(
-        tg_id=user.tg_id.value,
-        username=user.username,
-        cv_text=user.cv_text,
-        cv_specializations=[item.value for item in user.cv_specializations.items],
-        cv_skills=[item.value for item in user.cv_skills.items],
-        cv_salary_amount=user.cv_salary.amount if user.cv_salary else None,
-        cv_salary_currency=(
-            user.cv_salary.currency.value if user.cv_salary and user.cv_salary.currency else None
-        ),
-        filter_salary_mode=user.filter_salary_mode.value,
-        cv_work_format=user.cv_work_format.value if user.cv_work_format else None,
-        filter_work_format_mode=user.filter_work_format_mode.value,
-        is_active=user.is_active,
-    )
+    return UserModel(tg_id=user.tg_id.value, **user_columns(user))
 
 
 def apply_user(model: UserModel, user: User) -> None:
-    model.username = user.username
-    model.cv_text = user.cv_text
-    model.cv_specializations = [item.value for item in user.cv_specializations.items]
-    model.cv_skills = [item.value for item in user.cv_skills.items]
-    model.cv_salary_amount = user.cv_salary.amount if user.cv_salary else None
-    model.cv_salary_currency = (
-        user.cv_salary.currency.value if user.cv_salary and user.cv_salary.currency else None
-    )
-    model.filter_salary_mode = user.filter_salary_mode.value
-    model.cv_work_format = user.cv_work_format.value if user.cv_work_format else None
-    model.filter_work_format_mode = user.filter_work_format_mode.value
-    model.is_active = user.is_active
+    for key, value in user_columns(user).items():
+        setattr(model, key, value)
+
+
+def user_columns(user: User) -> dict[str, Any]:
+    """Every column of the user's row except the primary key."""
+    return {
+        "username": user.username,
+        "cv_text": user.cv_text,
+        **specialization_columns(user.cv_specializations, user.cv_skills),
+        **salary_columns(user.cv_salary, user.filter_salary_mode),
+        **work_format_columns(user.cv_work_format, user.filter_work_format_mode),
+        "is_active": user.is_active,
+        "delivery_mode": user.delivery_mode.value,
+    }
+
+
+def specialization_columns(
+    specializations: UserSpecializations,
+    skills: UserSkills,
+) -> dict[str, Any]:
+    return {
+        "cv_specializations": [item.value for item in specializations.items],
+        "cv_skills": [item.value for item in skills.items],
+        "cv_specializations_mask": specializations.to_mask(),
+        "cv_skills_mask": skills.to_mask(),
+    }
+
+
+def salary_columns(salary: UserSalary | None, mode: FilterMode) -> dict[str, Any]:
+    return {
+        "cv_salary_amount": salary.amount if salary else None,
+        "cv_salary_currency": salary.currency.value if salary and salary.currency else None,
+        "filter_salary_mode": mode.value,
+    }
+
+
+def work_format_columns(work_format: UserWorkFormat | None, mode: FilterMode) -> dict[str, Any]:
+    return {
+        "cv_work_format": work_format.value if work_format else None,
+        "filter_work_format_mode": mode.value,
+    }
 
 
 def user_from_model(model: UserModel) -> User:
@@ -63,8 +95,16 @@ def user_from_model(model: UserModel) -> User:
         tg_id=UserId(model.tg_id),
         username=model.username,
         cv_text=model.cv_text,
-        cv_specializations=UserSpecializations.from_strs(model.cv_specializations or []),
-        cv_skills=UserSkills.from_strs(model.cv_skills or []),
+        cv_specializations=(
+            UserSpecializations.from_mask(model.cv_specializations_mask)
+            if model.cv_specializations_mask is not None
+            else UserSpecializations.from_strs(model.cv_specializations or [])
+        ),
+        cv_skills=(
+            UserSkills.from_mask(model.cv_skills_mask)
+            if model.cv_skills_mask is not None
+            else UserSkills.from_strs(model.cv_skills or [])
+        ),
         cv_salary=salary,
         filter_salary_mode=(
             FilterMode(model.filter_salary_mode) if model.filter_salary_mode else FilterMode.SOFT
@@ -72,4 +112,33 @@ def user_from_model(model: UserModel) -> User:
         cv_work_format=work_format,
         filter_work_format_mode=work_format_mode,
         is_active=model.is_active,
+        delivery_mode=(
+            DeliveryMode(model.delivery_mode) if model.delivery_mode else DeliveryMode.INSTANT
+        ),
+    )
+
+
+def match_profile_from_row(row: Row[tuple[Any, ...]]) -> MatchProfile:
+    """Build a MatchProfile from `MATCH_PROFILE_COLUMNS` without hydrating a User.
+
+    Applies the same normalization as `user_from_model` + `MatchProfile.from_user`.
+    """
+    min_salary = None
+    if row.filter_salary_mode == FilterMode.STRICT.value and row.cv_salary_amount is not None:
+        min_salary = UserSalary.create(row.cv_salary_amount, row.cv_salary_currency).amount
+
+    work_format = None
+    if (
+        row.filter_work_format_mode == FilterMode.STRICT.value
+        and row.cv_work_format
+        and row.cv_work_format != UserWorkFormat.UNDEFINED.value
+    ):
+        work_format = UserWorkFormat(row.cv_work_format)
+
+    return MatchProfile(
+        tg_id=row.tg_id,
+        specializations_mask=row.cv_specializations_mask,
+        skills_mask=row.cv_skills_mask,
+        min_salary=min_salary,
+        work_format=work_format,
     )
@@ -1,33 +1,63 @@
+from typing import Any
+
 from app.domain.shared.value_objects import Salary, Skills, Specializations, WorkFormat
 from app.domain.vacancy.entities import Vacancy
-from app.domain.vacancy.value_objects import ContentHash, VacancyId
+from app.domain.vacancy.value_objects import ContentHash, SimHash, VacancyId
 from app.infrastructure.db.models import Vacancy as VacancyModel
 
+_UINT64 = 1 << 64
+_INT64_MAX = (1 << 63) - 1
+
+
+def simhash_to_db(simhash: SimHash | None) -> int | None:
+    """Store the unsigned fingerprint in a signed BIGINT column."""
+    if simhash is None:
+        return None
+    value = simhash.value
+    return value - _UINT64 if value > _INT64_MAX else value
+
+
+def simhash_from_db(value: int | None) -> int | None:
+    if value is None:
+        return None
+    return value + _UINT64 if value < 0 else value
+
 
 def vacancy_to_model(vacancy: Vacancy) -> VacancyModel:
-    return VacancyModel(
-        id=vacancy.id.value,
-        text=vacancy.text,
-        specializations=[s.value for s in vacancy.specializations.items],
-        skills=[skill.value for skill in vacancy.skills.items],
-        mirror_chat_id=vacancy.mirror_chat_id,
-        mirror_message_id=vacancy.mirror_message_id,
-        content_hash=vacancy.content_hash.value,
-        salary_amount=vacancy.salary.amount,
-        salary_currency=vacancy.salary.currency.value if vacancy.salary.currency else None,
-        work_format=vacancy.work_format.value if vacancy.work_format else None,
-        created_at=vacancy.created_at,
-        is_active=vacancy.is_active,
-    )
+    return VacancyModel(**vacancy_to_row(vacancy))
+
+
+def vacancy_to_row(vacancy: Vacancy) -> dict[str, Any]:
+    """Column values of the `vacancies` row, for Core INSERT statements."""
+    return {
+        "id": vacancy.id.value,
+        "text": vacancy.text,
+        "specializations": [s.value for s in vacancy.specializations.items],
+        "skills": [skill.value for skill in vacancy.skills.items],
+        "specializations_mask": vacancy.specializations.to_mask(),
+        "skills_mask": vacancy.skills.to_mask(),
+        "mirror_chat_id": vacancy.mirror_chat_id,
+        "mirror_message_id": vacancy.mirror_message_id,
+        "content_hash": vacancy.content_hash.value,
+        "simhash": simhash_to_db(vacancy.simhash),
+        "salary_amount": vacancy.salary.amount,
+        "salary_currency": vacancy.salary.currency.value if vacancy.salary.currency else None,
+        "work_format": vacancy.work_format.value if vacancy.work_format else None,
+        "created_at": vacancy.created_at,
+        "is_active": vacancy.is_active,
+    }
 
 
 def apply_vacancy(model: VacancyModel, vacancy: Vacancy) -> None:
     model.text = vacancy.text
     model.specializations = [s.value for s in vacancy.specializations.items]
     model.skills = [skill.value for skill in vacancy.skills.items]
+    model.specializations_mask = vacancy.specializations.to_mask()
+    model.skills_mask = vacancy.skills.to_mask()
     model.mirror_chat_id = vacancy.mirror_chat_id
     model.mirror_message_id = vacancy.mirror_message_id
     model.content_hash = vacancy.content_hash.value
+    model.simhash = simhash_to_db(vacancy.simhash)
     model.salary_amount = vacancy.salary.amount
     model.salary_currency = vacancy.salary.currency.value if vacancy.salary.currency else None
     model.work_format = vacancy.work_format.value
@@ -38,8 +68,16 @@ def vacancy_from_model(model: VacancyModel) -> Vacancy:
     return Vacancy(
         id=VacancyId(model.id),
         text=model.text,
-        specializations=Specializations.from_strs(model.specializations or []),
-        skills=Skills.from_strs(model.skills or []),
+        specializations=(
+            Specializations.from_mask(model.specializations_mask)
+            if model.specializations_mask is not None
+            else Specializations.from_strs(model.specializations or [])
+        ),
+        skills=(
+            Skills.from_mask(model.skills_mask)
+            if model.skills_mask is not None
+            else Skills.from_strs(model.skills or [])
+        ),
         mirror_chat_id=model.mirror_chat_id,
         mirror_message_id=model.mirror_message_id,
         salary=Salary.create(model.salary_amount, model.salary_currency),
@@ -47,4 +85,10 @@ def vacancy_from_model(model: VacancyModel) -> Vacancy:
         content_hash=ContentHash(model.content_hash),
         created_at=model.created_at,
         is_active=model.is_active,
+        simhash=_simhash_or_none(model.simhash),
     )
+
+
+def _simhash_or_none(value: int | None) -> SimHash | None:
+    unsigned = simhash_from_db(value)
+    return SimHash(unsigned) if unsigned is not None else None
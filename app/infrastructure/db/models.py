@@ -1,8 +1,23 @@
 from __future__ import annotations
 
+from datetime import datetime
+from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import BigInteger, Boolean, DateTime, Integer, String, Text, func
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    SmallInteger,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
@@ -14,17 +29,29 @@ class Base(AsyncAttrs, DeclarativeBase):
 
 class Vacancy(Base):
     __tablename__ = "vacancies"
+    __table_args__ = (
+        # Serves reverse matching: newest active vacancies, mask check without heap access.
+        Index(
+            "ix_vacancies_active_created_at",
+            "created_at",
+            postgresql_include=["specializations_mask", "skills_mask"],
+            postgresql_where=text("is_active IS true"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     text: Mapped[str] = mapped_column(Text)
 
     specializations: Mapped[list[str]] = mapped_column(JSONB, default=list)
     skills: Mapped[list[str]] = mapped_column(JSONB, default=list)
+    specializations_mask: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    skills_mask: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
 
     mirror_chat_id: Mapped[int] = mapped_column(BigInteger)
     mirror_message_id: Mapped[int] = mapped_column(BigInteger)
 
     content_hash: Mapped[str] = mapped_column(String, unique=True, index=True)
+    simhash: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
 
     salary_amount: Mapped[int | None] = mapped_column(Integer, nullable=True)
     salary_currency: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -37,6 +64,25 @@ class Vacancy(Base):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Serves the matching prefilter with full index-only scans (the `&` mask tests
+        # are filtered, not seeked); the predicate must stay `IS true` and the
+        # INCLUDE list must cover the match profile projection.
+        Index(
+            "ix_users_active_match_masks",
+            "cv_specializations_mask",
+            "cv_skills_mask",
+            postgresql_include=[
+                "tg_id",
+                "cv_salary_amount",
+                "cv_salary_currency",
+                "filter_salary_mode",
+                "cv_work_format",
+                "filter_work_format_mode",
+            ],
+            postgresql_where=text("is_active IS true"),
+        ),
+    )
 
     tg_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     username: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -44,6 +90,8 @@ class User(Base):
 
     cv_specializations: Mapped[list[str]] = mapped_column(JSONB, default=list)
     cv_skills: Mapped[list[str]] = mapped_column(JSONB, default=list)
+    cv_specializations_mask: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    cv_skills_mask: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
 
     cv_salary_amount: Mapped[int | None] = mapped_column(Integer, nullable=True)
     cv_salary_currency: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -53,6 +101,92 @@ class User(Base):
     filter_work_format_mode: Mapped[str] = mapped_column(String, default="SOFT")
 
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    delivery_mode: Mapped[str] = mapped_column(String, default="INSTANT", server_default="INSTANT")
+
+
+class IngestJob(Base):
+    __tablename__ = "ingest_jobs"
+    __table_args__ = (
+        UniqueConstraint("chat_id", "message_id", name="uq_ingest_jobs_chat_message"),
+        Index("ix_ingest_jobs_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    chat_id: Mapped[int] = mapped_column(BigInteger)
+    message_id: Mapped[int] = mapped_column(BigInteger)
+    text: Mapped[str] = mapped_column(Text)
+
+    status: Mapped[str] = mapped_column(String, default="PENDING")
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    leased_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    mirror_chat_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    mirror_message_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class ChannelCursor(Base):
+    __tablename__ = "channel_cursors"
+
+    chat_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    last_message_id: Mapped[int] = mapped_column(BigInteger)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class LLMExtractionCache(Base):
+    __tablename__ = "llm_extraction_cache"
+    __table_args__ = (
+        PrimaryKeyConstraint("text_hash", "extractor_version", name="pk_llm_extraction_cache"),
+        Index("ix_llm_extraction_cache_expires_at", "expires_at"),
+    )
+
+    text_hash: Mapped[str] = mapped_column(String)
+    extractor_version: Mapped[str] = mapped_column(String)
+    result: Mapped[dict[str, Any]] = mapped_column(JSONB)
+    is_vacancy: Mapped[bool] = mapped_column(Boolean)
+    hits: Mapped[int] = mapped_column(Integer, default=0)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+class Delivery(Base):
+    __tablename__ = "deliveries"
+    __table_args__ = (
+        UniqueConstraint("vacancy_id", "tg_id", name="uq_deliveries_vacancy_user"),
+        # Serves the delivery worker: open rows in lease order.
+        Index(
+            "ix_deliveries_open_priority_created_at",
+            "priority",
+            text("created_at DESC"),
+            postgresql_where=text("status IN ('PENDING', 'SENDING')"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    vacancy_id: Mapped[str] = mapped_column(UUID(as_uuid=True))
+    tg_id: Mapped[int] = mapped_column(BigInteger)
+
+    status: Mapped[str] = mapped_column(String, default="PENDING")
+    priority: Mapped[int] = mapped_column(SmallInteger, default=0, server_default="0")
+    digest: Mapped[bool] = mapped_column(Boolean, default=False, server_default=text("false"))
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    next_attempt_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    leased_until: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    sent_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
 async def init_db() -> None:
@@ -0,0 +1,31 @@
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.ingest.repository import IChannelCursorRepository
+from app.infrastructure.db.models import ChannelCursor as ChannelCursorModel
+
+
+class ChannelCursorRepository(IChannelCursorRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_last_message_id(self, chat_id: int) -> int | None:
+        result = await self._session.execute(
+            select(ChannelCursorModel.last_message_id).where(ChannelCursorModel.chat_id == chat_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def advance(self, chat_id: int, message_id: int) -> None:
+        stmt = insert(ChannelCursorModel).values(chat_id=chat_id, last_message_id=message_id)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ChannelCursorModel.chat_id],
+            set_={
+                "last_message_id": func.greatest(
+                    ChannelCursorModel.last_message_id,
+                    stmt.excluded.last_message_id,
+                ),
+                "updated_at": func.now(),
+            },
+        )
+        await self._session.execute(stmt)
@@ -0,0 +1,255 @@
+from datetime import datetime, timedelta
+from typing import Any, cast
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    CursorResult,
+    Select,
+    String,
+    and_,
+    case,
+    func,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.delivery.entities import Delivery, DeliveryPriority, DeliveryStatus
+from app.domain.delivery.repository import IDeliveryRepository
+from app.domain.user.value_objects import DeliveryMode
+from app.infrastructure.db.models import Delivery as DeliveryModel
+from app.infrastructure.db.models import User as UserModel
+from app.infrastructure.db.models import Vacancy as VacancyModel
+
+# One bound parameter per recipient; keeps one INSERT well below asyncpg's 32767 limit.
+_ENQUEUE_CHUNK_SIZE = 10_000
+_OPEN_STATUSES = (DeliveryStatus.PENDING.value, DeliveryStatus.SENDING.value)
+_DIGEST_PREVIEW_CHARS = 120
+
+
+class DeliveryRepository(IDeliveryRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def enqueue(
+        self,
+        vacancy_id: UUID,
+        tg_ids: list[int],
+        priority: DeliveryPriority,
+    ) -> int:
+        """Queue the vacancy for each recipient; pairs already in the log are skipped.
+
+        Rows are selected from `users`, so each one records whether its user
+        currently wants a digest instead of an instant forward. Inactive users
+        are left out: a profile index in another process may still match users
+        who blocked the bot until its next reload.
+        """
+        enqueued = 0
+        for start in range(0, len(tg_ids), _ENQUEUE_CHUNK_SIZE):
+            recipients = select(
+                literal(vacancy_id),
+                UserModel.tg_id,
+                literal(DeliveryStatus.PENDING.value),
+                literal(priority.value),
+                UserModel.delivery_mode == DeliveryMode.DIGEST.value,
+            ).where(
+                UserModel.tg_id.in_(tg_ids[start : start + _ENQUEUE_CHUNK_SIZE]),
+                UserModel.is_active.is_(True),
+            )
+            stmt = (
+                insert(DeliveryModel)
+                .from_select(["vacancy_id", "tg_id", "status", "priority", "digest"], recipients)
+                .on_conflict_do_nothing(index_elements=["vacancy_id", "tg_id"])
+                .returning(DeliveryModel.id)
+            )
+            result = await self._session.execute(stmt)
+            enqueued += len(result.scalars().all())
+        return enqueued
+
+    async def lease_due(self, limit: int, lease_seconds: float) -> list[Delivery]:
+        """Lease instant deliveries: by priority, freshest first."""
+        due_ids = (
+            select(DeliveryModel.id)
+            .where(_is_due(), DeliveryModel.digest.is_(False))
+            .order_by(DeliveryModel.priority, DeliveryModel.created_at.desc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return await self._lease(due_ids, lease_seconds)
+
+    async def lease_digests(self, limit: int, lease_seconds: float) -> list[Delivery]:
+        """Lease digest deliveries grouped by user, with a text preview of each vacancy."""
+        due_ids = (
+            select(DeliveryModel.id)
+            .where(_is_due(), DeliveryModel.digest.is_(True))
+            .order_by(DeliveryModel.tg_id, DeliveryModel.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return await self._lease(due_ids, lease_seconds, with_preview=True)
+
+    async def _lease(
+        self,
+        due_ids: Select[tuple[int]],
+        lease_seconds: float,
+        *,
+        with_preview: bool = False,
+    ) -> list[Delivery]:
+        now = func.now()
+        preview = (
+            func.left(VacancyModel.text, _DIGEST_PREVIEW_CHARS)
+            if with_preview
+            else literal(None, String)
+        )
+        stmt = (
+            update(DeliveryModel)
+            .where(
+                DeliveryModel.id.in_(due_ids.scalar_subquery()),
+                DeliveryModel.vacancy_id == VacancyModel.id,
+            )
+            .values(
+                status=DeliveryStatus.SENDING.value,
+                # An expired lease means the worker died mid-send: count it as an attempt.
+                attempts=case(
+                    (
+                        DeliveryModel.status == DeliveryStatus.SENDING.value,
+                        DeliveryModel.attempts + 1,
+                    ),
+                    else_=DeliveryModel.attempts,
+                ),
+                leased_until=now + timedelta(seconds=lease_seconds),
+            )
+            .returning(
+                DeliveryModel.id,
+                DeliveryModel.vacancy_id,
+                DeliveryModel.tg_id,
+                VacancyModel.mirror_chat_id,
+                VacancyModel.mirror_message_id,
+                DeliveryModel.priority,
+                DeliveryModel.attempts,
+                preview.label("preview"),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return [
+            Delivery(
+                id=row.id,
+                vacancy_id=row.vacancy_id,
+                tg_id=row.tg_id,
+                mirror_chat_id=row.mirror_chat_id,
+                mirror_message_id=row.mirror_message_id,
+                priority=DeliveryPriority(row.priority),
+                attempts=row.attempts,
+                preview=row.preview,
+            )
+            for row in result
+        ]
+
+    async def count_open(self) -> int:
+        result = await self._session.execute(
+            select(func.count())
+            .select_from(DeliveryModel)
+            .where(DeliveryModel.status.in_(_OPEN_STATUSES))
+        )
+        return int(result.scalar_one())
+
+    async def mark_sent(self, delivery_ids: list[int]) -> None:
+        if not delivery_ids:
+            return
+        await self._session.execute(
+            update(DeliveryModel)
+            .where(DeliveryModel.id.in_(delivery_ids))
+            .values(
+                status=DeliveryStatus.SENT.value,
+                attempts=DeliveryModel.attempts + 1,
+                leased_until=None,
+                last_error=None,
+                sent_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def mark_forbidden(self, delivery_ids: list[int]) -> None:
+        if not delivery_ids:
+            return
+        await self._session.execute(
+            update(DeliveryModel)
+            .where(DeliveryModel.id.in_(delivery_ids))
+            .values(
+                status=DeliveryStatus.FORBIDDEN.value,
+                attempts=DeliveryModel.attempts + 1,
+                leased_until=None,
+                last_error="bot forbidden",
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def mark_retry(
+        self,
+        delivery_ids: list[int],
+        error: str,
+        next_attempt_at: datetime,
+    ) -> None:
+        if not delivery_ids:
+            return
+        await self._session.execute(
+            update(DeliveryModel)
+            .where(DeliveryModel.id.in_(delivery_ids))
+            .values(
+                status=DeliveryStatus.PENDING.value,
+                attempts=DeliveryModel.attempts + 1,
+                next_attempt_at=next_attempt_at,
+                leased_until=None,
+                last_error=error,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def cancel_for_users(self, tg_ids: list[int]) -> int:
+        """Close queued deliveries of users who blocked the bot, so none is attempted."""
+        if not tg_ids:
+            return 0
+        result = await self._session.execute(
+            update(DeliveryModel)
+            .where(
+                DeliveryModel.tg_id.in_(tg_ids),
+                DeliveryModel.status == DeliveryStatus.PENDING.value,
+            )
+            .values(status=DeliveryStatus.FORBIDDEN.value, last_error="bot forbidden")
+            .execution_options(synchronize_session=False)
+        )
+        return int(cast("CursorResult[Any]", result).rowcount or 0)
+
+    async def mark_dead(self, delivery_ids: list[int], error: str) -> None:
+        if not delivery_ids:
+            return
+        await self._session.execute(
+            update(DeliveryModel)
+            .where(DeliveryModel.id.in_(delivery_ids))
+            .values(
+                status=DeliveryStatus.FAILED.value,
+                attempts=DeliveryModel.attempts + 1,
+                leased_until=None,
+                last_error=error,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+
+def _is_due() -> ColumnElement[bool]:
+    now = func.now()
+    return or_(
+        and_(
+            DeliveryModel.status == DeliveryStatus.PENDING.value,
+            DeliveryModel.next_attempt_at <= now,
+        ),
+        and_(
+            DeliveryModel.status == DeliveryStatus.SENDING.value,
+            DeliveryModel.leased_until < now,
+        ),
+    )
@@ -0,0 +1,183 @@
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, and_, case, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.ingest.entities import IngestJob, IngestJobStatus
+from app.domain.ingest.repository import IIngestJobRepository
+from app.infrastructure.db.mappers.ingest_job import ingest_job_from_model
+from app.infrastructure.db.models import IngestJob as IngestJobModel
+
+
+class IngestJobRepository(IIngestJobRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def add_leased(
+        self,
+        chat_id: int,
+        message_id: int,
+        text: str,
+        lease_seconds: float,
+    ) -> IngestJob | None:
+        stmt = (
+            insert(IngestJobModel)
+            .values(
+                chat_id=chat_id,
+                message_id=message_id,
+                text=text,
+                status=IngestJobStatus.PROCESSING.value,
+                attempts=0,
+                leased_until=func.now() + timedelta(seconds=lease_seconds),
+            )
+            .on_conflict_do_nothing(index_elements=["chat_id", "message_id"])
+            .returning(IngestJobModel)
+        )
+        result = await self._session.execute(stmt)
+        model = result.scalar_one_or_none()
+        if model is None:
+            return None
+        return ingest_job_from_model(model)
+
+    async def lease_due(self, limit: int, lease_seconds: float) -> list[IngestJob]:
+        now = func.now()
+        due_ids = (
+            select(IngestJobModel.id)
+            .where(
+                or_(
+                    and_(
+                        IngestJobModel.status == IngestJobStatus.PENDING.value,
+                        IngestJobModel.next_attempt_at <= now,
+                    ),
+                    and_(
+                        IngestJobModel.status == IngestJobStatus.PROCESSING.value,
+                        IngestJobModel.leased_until < now,
+                    ),
+                )
+            )
+            .order_by(IngestJobModel.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(IngestJobModel)
+            .where(IngestJobModel.id.in_(due_ids.scalar_subquery()))
+            .values(
+                status=IngestJobStatus.PROCESSING.value,
+                # An expired lease means the worker died mid-job: count it as an attempt.
+                attempts=case(
+                    (
+                        IngestJobModel.status == IngestJobStatus.PROCESSING.value,
+                        IngestJobModel.attempts + 1,
+                    ),
+                    else_=IngestJobModel.attempts,
+                ),
+                leased_until=now + timedelta(seconds=lease_seconds),
+                updated_at=now,
+            )
+            .returning(IngestJobModel)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return [ingest_job_from_model(model) for model in result.scalars().all()]
+
+    async def set_mirror(
+        self,
+        job_id: int,
+        leased_attempts: int,
+        mirror_chat_id: int,
+        mirror_message_id: int,
+    ) -> bool:
+        return await self._update_leased(
+            job_id,
+            leased_attempts,
+            mirror_chat_id=mirror_chat_id,
+            mirror_message_id=mirror_message_id,
+        )
+
+    async def mark_done(self, job_id: int, leased_attempts: int) -> bool:
+        return await self._update_leased(
+            job_id,
+            leased_attempts,
+            status=IngestJobStatus.DONE.value,
+            leased_until=None,
+        )
+
+    async def mark_retry(
+        self,
+        job_id: int,
+        leased_attempts: int,
+        error: str,
+        next_attempt_at: datetime,
+    ) -> bool:
+        return await self._update_leased(
+            job_id,
+            leased_attempts,
+            status=IngestJobStatus.PENDING.value,
+            attempts=IngestJobModel.attempts + 1,
+            next_attempt_at=next_attempt_at,
+            leased_until=None,
+            last_error=error,
+        )
+
+    async def mark_dead(self, job_id: int, leased_attempts: int, error: str) -> bool:
+        return await self._update_leased(
+            job_id,
+            leased_attempts,
+            status=IngestJobStatus.DEAD.value,
+            attempts=IngestJobModel.attempts + 1,
+            leased_until=None,
+            last_error=error,
+        )
+
+    async def defer(
+        self,
+        job_id: int,
+        leased_attempts: int,
+        reason: str,
+        next_attempt_at: datetime,
+    ) -> bool:
+        return await self._update_leased(
+            job_id,
+            leased_attempts,
+            status=IngestJobStatus.PENDING.value,
+            next_attempt_at=next_attempt_at,
+            leased_until=None,
+            last_error=reason,
+        )
+
+    async def _update_leased(self, job_id: int, leased_attempts: int, **values: Any) -> bool:
+        """Update a job only while the caller's lease still holds it.
+
+        Every lease after an expiry bumps `attempts`, so a worker whose lease
+        ran out no longer matches and cannot overwrite its successor's result.
+        """
+        result = await self._session.execute(
+            update(IngestJobModel)
+            .where(
+                IngestJobModel.id == job_id,
+                IngestJobModel.status == IngestJobStatus.PROCESSING.value,
+                IngestJobModel.attempts == leased_attempts,
+            )
+            .values(**values, updated_at=func.now())
+        )
+        return bool(cast("CursorResult[Any]", result).rowcount)
+
+    async def purge_done(self, older_than: datetime) -> int:
+        result = await self._session.execute(
+            delete(IngestJobModel).where(
+                IngestJobModel.status == IngestJobStatus.DONE.value,
+                IngestJobModel.updated_at < older_than,
+            )
+        )
+        return int(cast("CursorResult[Any]", result).rowcount or 0)
+
+    async def iter_texts(self, batch_size: int = 1000) -> AsyncIterator[str]:
+        result = await self._session.stream_scalars(
+            select(IngestJobModel.text).execution_options(yield_per=batch_size)
+        )
+        async for text in result:
+            yield text
@@ -0,0 +1,96 @@
+from datetime import timedelta
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, delete, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.db.models import LLMExtractionCache as LLMExtractionCacheModel
+
+
+class LLMExtractionCacheRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(self, text_hash: str, extractor_version: str) -> dict[str, Any] | None:
+        """Return a live cached result and bump its usage stats in the same statement."""
+        stmt = (
+            update(LLMExtractionCacheModel)
+            .where(
+                LLMExtractionCacheModel.text_hash == text_hash,
+                LLMExtractionCacheModel.extractor_version == extractor_version,
+                LLMExtractionCacheModel.expires_at > func.now(),
+            )
+            .values(
+                hits=LLMExtractionCacheModel.hits + 1,
+                last_used_at=func.now(),
+            )
+            .returning(LLMExtractionCacheModel.result)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def put(
+        self,
+        text_hash: str,
+        extractor_version: str,
+        result: dict[str, Any],
+        *,
+        is_vacancy: bool,
+        ttl: timedelta,
+    ) -> None:
+        stmt = insert(LLMExtractionCacheModel).values(
+            text_hash=text_hash,
+            extractor_version=extractor_version,
+            result=result,
+            is_vacancy=is_vacancy,
+            hits=0,
+            expires_at=func.now() + ttl,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                LLMExtractionCacheModel.text_hash,
+                LLMExtractionCacheModel.extractor_version,
+            ],
+            set_={
+                "result": stmt.excluded.result,
+                "is_vacancy": stmt.excluded.is_vacancy,
+                "expires_at": stmt.excluded.expires_at,
+                "last_used_at": func.now(),
+            },
+        )
+        await self._session.execute(stmt)
+
+    async def get_verdicts(
+        self,
+        text_hashes: list[str],
+        extractor_version: str,
+    ) -> dict[str, bool]:
+        result = await self._session.execute(
+            select(LLMExtractionCacheModel.text_hash, LLMExtractionCacheModel.is_vacancy).where(
+                LLMExtractionCacheModel.text_hash.in_(text_hashes),
+                LLMExtractionCacheModel.extractor_version == extractor_version,
+                LLMExtractionCacheModel.expires_at > func.now(),
+            )
+        )
+        return {text_hash: is_vacancy for text_hash, is_vacancy in result.all()}
+
+    async def purge(self, max_entries: int) -> int:
+        """Drop expired entries, then the least recently used ones above `max_entries`."""
+        expired = await self._session.execute(
+            delete(LLMExtractionCacheModel).where(LLMExtractionCacheModel.expires_at <= func.now())
+        )
+        removed = cast("CursorResult[Any]", expired).rowcount or 0
+        if max_entries <= 0:
+            return removed
+
+        key = tuple_(LLMExtractionCacheModel.text_hash, LLMExtractionCacheModel.extractor_version)
+        overflow = (
+            select(LLMExtractionCacheModel.text_hash, LLMExtractionCacheModel.extractor_version)
+            .order_by(LLMExtractionCacheModel.last_used_at.desc())
+            .offset(max_entries)
+        )
+        evicted = await self._session.execute(
+            delete(LLMExtractionCacheModel).where(key.in_(overflow))
+        )
+        return removed + (cast("CursorResult[Any]", evicted).rowcount or 0)
@@ -1,13 +1,30 @@
-from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import array
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+
+from sqlalchemy import Row, Select, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.domain.matching.profile import MatchProfile, ProfileUpdate
+from app.domain.shared.value_objects import Salary, Skills, Specializations, WorkFormat
 from app.domain.user.entities import User
 from app.domain.user.repository import IUserRepository
-from app.domain.user.value_objects import UserId
-from app.infrastructure.db.mappers.user import apply_user, user_from_model, user_to_model
+from app.domain.user.value_objects import DeliveryMode, FilterMode, UserId
+from app.infrastructure.db.mappers.user import (
+    MATCH_PROFILE_COLUMNS,
+    match_profile_from_row,
+    salary_columns,
+    specialization_columns,
+    user_columns,
+    user_from_model,
+    user_to_model,
+    work_format_columns,
+)
 from app.infrastructure.db.models import User as UserModel
 
+_PREVIOUS_PREFIX = "previous_"
+
 
 class UserRepository(IUserRepository):
     def __init__(self, session: AsyncSession) -> None:
@@ -27,41 +44,215 @@ class UserRepository(IUserRepository):
 
     async def update(self, user: User) -> None:
         result = await self._session.execute(
-            select(UserModel).where(UserModel.tg_id == user.tg_id.value)
+            update(UserModel)
+            .where(UserModel.tg_id == user.tg_id.value)
+            .values(**user_columns(user))
+            .returning(UserModel.tg_id)
+            .execution_options(synchronize_session=False)
         )
-        model = result.scalar_one_or_none()
-        if model is None:
+        if result.scalar_one_or_none() is None:
             raise ValueError("User not found")
-        apply_user(model, user)
 
     async def upsert(self, user: User) -> None:
-        result = await self._session.execute(
-            select(UserModel).where(UserModel.tg_id == user.tg_id.value)
+        columns = user_columns(user)
+        stmt = insert(UserModel).values(tg_id=user.tg_id.value, **columns)
+        await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[UserModel.tg_id],
+                set_={key: stmt.excluded[key] for key in columns},
+            )
+        )
+
+    async def register(self, user: User) -> ProfileUpdate:
+        """Insert a new user, or refresh the username and reactivate an existing one.
+
+        One statement either way; the CTE reads `is_active` from the snapshot
+        taken before the upsert, so a reactivation is reported as such.
+        """
+        previous = (
+            select(UserModel.is_active).where(UserModel.tg_id == user.tg_id.value).cte("previous")
+        )
+        upsert = insert(UserModel).values(tg_id=user.tg_id.value, **user_columns(user))
+        stmt = (
+            upsert.on_conflict_do_update(
+                index_elements=[UserModel.tg_id],
+                set_={"username": upsert.excluded.username, "is_active": True},
+            )
+            .returning(
+                *MATCH_PROFILE_COLUMNS,
+                UserModel.is_active,
+                select(previous.c.is_active).scalar_subquery().label("previous_is_active"),
+            )
+            .add_cte(previous)
+        )
+        row = (await self._session.execute(stmt)).one()
+        current = match_profile_from_row(row)
+        created = row.previous_is_active is None
+        return ProfileUpdate(
+            previous=None if created else current,
+            current=current,
+            was_active=bool(row.previous_is_active),
+            is_active=row.is_active,
         )
-        model = result.scalar_one_or_none()
-        if model is None:
-            self._session.add(user_to_model(user))
-            return
-        apply_user(model, user)
 
-    async def find_prefiltered_candidates(
+    async def update_resume(
         self,
-        specializations: set[str],
-        skills: set[str],
-        is_active: bool = True,
-    ) -> list[User]:
-        query = select(UserModel)
-        query = query.where(UserModel.is_active.is_(is_active))
+        tg_id: UserId,
+        *,
+        cv_text: str | None,
+        specializations: Specializations,
+        skills: Skills,
+        salary: Salary | None,
+        salary_mode: FilterMode,
+        work_format: WorkFormat | None,
+        work_format_mode: FilterMode,
+    ) -> ProfileUpdate | None:
+        return await self._update_profile(
+            tg_id,
+            {
+                "cv_text": cv_text,
+                **specialization_columns(specializations, skills),
+                **salary_columns(salary, salary_mode),
+                **work_format_columns(work_format, work_format_mode),
+            },
+        )
 
-        if specializations:
-            query = query.where(
-                UserModel.cv_specializations.bool_op("?|")(array(sorted(specializations)))
+    async def update_specializations_and_skills(
+        self,
+        tg_id: UserId,
+        specializations: Specializations,
+        skills: Skills,
+    ) -> ProfileUpdate | None:
+        return await self._update_profile(tg_id, specialization_columns(specializations, skills))
+
+    async def update_work_format_filter(
+        self,
+        tg_id: UserId,
+        work_format: WorkFormat | None,
+        mode: FilterMode,
+    ) -> ProfileUpdate | None:
+        return await self._update_profile(tg_id, work_format_columns(work_format, mode))
+
+    async def update_salary_filter(
+        self,
+        tg_id: UserId,
+        salary: Salary | None,
+        mode: FilterMode,
+    ) -> ProfileUpdate | None:
+        return await self._update_profile(tg_id, salary_columns(salary, mode))
+
+    async def update_delivery_mode(self, tg_id: UserId, delivery_mode: DeliveryMode) -> bool:
+        result = await self._session.execute(
+            update(UserModel)
+            .where(UserModel.tg_id == tg_id.value)
+            .values(delivery_mode=delivery_mode.value)
+            .returning(UserModel.tg_id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def _update_profile(self, tg_id: UserId, values: dict[str, Any]) -> ProfileUpdate | None:
+        """Write only the given columns and return the match profile before and after.
+
+        The row is locked and read in a sub-select of the same UPDATE, so the
+        previous profile costs no extra round trip and `cv_text` is never fetched.
+        """
+        previous_users = UserModel.__table__.alias("previous_users")
+        previous = (
+            select(
+                *(previous_users.c[column.key] for column in MATCH_PROFILE_COLUMNS),
+                previous_users.c.is_active,
             )
-        if skills:
-            query = query.where(
-                UserModel.cv_skills.bool_op("?|")(array(sorted(skills)))
+            .where(previous_users.c.tg_id == tg_id.value)
+            .with_for_update()
+            .subquery("previous")
+        )
+        stmt = (
+            update(UserModel)
+            .where(UserModel.tg_id == previous.c.tg_id)
+            .values(**values)
+            .returning(
+                *MATCH_PROFILE_COLUMNS,
+                UserModel.is_active,
+                *(
+                    previous.c[column.key].label(f"{_PREVIOUS_PREFIX}{column.key}")
+                    for column in MATCH_PROFILE_COLUMNS
+                ),
+                previous.c.is_active.label(f"{_PREVIOUS_PREFIX}is_active"),
             )
+            .execution_options(synchronize_session=False)
+        )
+        row = (await self._session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return ProfileUpdate(
+            previous=match_profile_from_row(_previous_row(row)),
+            current=match_profile_from_row(row),
+            was_active=row.previous_is_active,
+            is_active=row.is_active,
+        )
 
+    async def find_prefiltered_profiles(
+        self,
+        specializations_mask: int,
+        skills_mask: int,
+        is_active: bool = True,
+    ) -> list[MatchProfile]:
+        query = build_prefilter_query(specializations_mask, skills_mask, is_active=is_active)
         result = await self._session.execute(query)
-        models = result.scalars().all()
-        return [user_from_model(model) for model in models]
+        return [match_profile_from_row(row) for row in result]
+
+    async def iter_match_profiles(self, batch_size: int = 1000) -> AsyncIterator[MatchProfile]:
+        query = (
+            select(*MATCH_PROFILE_COLUMNS)
+            .where(UserModel.is_active.is_(True))
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream(query)
+        async for row in result:
+            yield match_profile_from_row(row)
+
+    async def deactivate_many(self, tg_ids: list[int]) -> list[int]:
+        """Mark active users inactive in one statement; returns the ones that changed."""
+        if not tg_ids:
+            return []
+        result = await self._session.execute(
+            update(UserModel)
+            .where(UserModel.tg_id.in_(tg_ids), UserModel.is_active.is_(True))
+            .values(is_active=False)
+            .returning(UserModel.tg_id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.scalars())
+
+
+def build_prefilter_query(
+    specializations_mask: int,
+    skills_mask: int,
+    *,
+    is_active: bool = True,
+) -> Select[tuple[Any, ...]]:
+    """Match profile columns of users sharing any specialization and any skill bit.
+
+    A zero mask means no filter on that dimension. A btree cannot seek on
+    `mask & :m <> 0`, so `ix_users_active_match_masks` is not used for lookups:
+    it is a narrow covering index that Postgres reads in full with an index-only
+    scan, filtering the masks there instead of in the much wider `users` heap.
+    `is_(True)` renders as `IS true`, which the partial index predicate needs.
+    """
+    query = select(*MATCH_PROFILE_COLUMNS).where(UserModel.is_active.is_(is_active))
+    if specializations_mask:
+        query = query.where(UserModel.cv_specializations_mask.op("&")(specializations_mask) != 0)
+    if skills_mask:
+        query = query.where(UserModel.cv_skills_mask.op("&")(skills_mask) != 0)
+    return query
+
+
+def _previous_row(row: Row[tuple[Any, ...]]) -> Any:
+    return SimpleNamespace(
+        **{
+            key.removeprefix(_PREVIOUS_PREFIX): value
+            for key, value in row._mapping.items()
+            if key.startswith(_PREVIOUS_PREFIX)
+        }
+    )
@@ -1,4 +1,8 @@
-from sqlalchemy import select
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.vacancy.entities import Vacancy
@@ -6,11 +10,16 @@ from app.domain.vacancy.repository import IVacancyRepository
 from app.domain.vacancy.value_objects import ContentHash, VacancyId
 from app.infrastructure.db.mappers.vacancy import (
     apply_vacancy,
+    simhash_from_db,
     vacancy_from_model,
     vacancy_to_model,
+    vacancy_to_row,
 )
 from app.infrastructure.db.models import Vacancy as VacancyModel
 
+# Fifteen bound parameters per row; keeps one INSERT below asyncpg's 32767 limit.
+_INSERT_CHUNK_SIZE = 2000
+
 
 class VacancyRepository(IVacancyRepository):
     def __init__(self, session: AsyncSession) -> None:
@@ -40,6 +49,51 @@ class VacancyRepository(IVacancyRepository):
         )
         return result.scalar_one_or_none() is not None
 
+    async def count(self) -> int:
+        result = await self._session.execute(select(func.count()).select_from(VacancyModel))
+        return int(result.scalar_one())
+
+    async def iter_content_hashes(self, batch_size: int = 10_000) -> AsyncIterator[str]:
+        result = await self._session.stream_scalars(
+            select(VacancyModel.content_hash).execution_options(yield_per=batch_size)
+        )
+        async for content_hash in result:
+            yield content_hash
+
+    async def iter_simhashes(self, batch_size: int = 10_000) -> AsyncIterator[int]:
+        result = await self._session.stream_scalars(
+            select(VacancyModel.simhash)
+            .where(VacancyModel.simhash.is_not(None))
+            .execution_options(yield_per=batch_size)
+        )
+        async for value in result:
+            yield simhash_from_db(value)
+
+    async def find_recent_for_profile(
+        self,
+        specializations_mask: int,
+        skills_mask: int,
+        since: datetime,
+        limit: int,
+    ) -> list[Vacancy]:
+        """Newest active vacancies sharing a specialization and a skill with the profile.
+
+        Walks `ix_vacancies_active_created_at` backwards and checks the masks
+        stored in it, so only matching rows are fetched from the heap.
+        """
+        result = await self._session.execute(
+            select(VacancyModel)
+            .where(
+                VacancyModel.is_active.is_(True),
+                VacancyModel.created_at >= since,
+                VacancyModel.specializations_mask.op("&")(specializations_mask) != 0,
+                VacancyModel.skills_mask.op("&")(skills_mask) != 0,
+            )
+            .order_by(VacancyModel.created_at.desc())
+            .limit(limit)
+        )
+        return [vacancy_from_model(model) for model in result.scalars()]
+
     async def add(self, vacancy: Vacancy) -> None:
         self._session.add(vacancy_to_model(vacancy))
 
@@ -52,12 +106,30 @@ class VacancyRepository(IVacancyRepository):
             raise ValueError("Vacancy not found")
         apply_vacancy(model, vacancy)
 
-    async def upsert(self, vacancy: Vacancy) -> None:
-        result = await self._session.execute(
-            select(VacancyModel).where(VacancyModel.content_hash == vacancy.content_hash.value)
-        )
-        model = result.scalar_one_or_none()
-        if model is None:
-            self._session.add(vacancy_to_model(vacancy))
-            return
-        apply_vacancy(model, vacancy)
+    async def insert_if_absent(self, vacancy: Vacancy) -> VacancyId | None:
+        """Insert the vacancy unless its content hash is stored; returns the new id."""
+        inserted = await self.insert_many_if_absent([vacancy])
+        return inserted[0] if inserted else None
+
+    async def insert_many_if_absent(self, vacancies: list[Vacancy]) -> list[VacancyId]:
+        """Insert vacancies whose content hash is not stored yet; returns their ids.
+
+        Duplicates, including repeats within the batch, are skipped by
+        `ON CONFLICT DO NOTHING` instead of failing the transaction.
+        """
+        inserted: list[VacancyId] = []
+        for start in range(0, len(vacancies), _INSERT_CHUNK_SIZE):
+            stmt = (
+                insert(VacancyModel)
+                .values(
+                    [
+                        vacancy_to_row(vacancy)
+                        for vacancy in vacancies[start : start + _INSERT_CHUNK_SIZE]
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=["content_hash"])
+                .returning(VacancyModel.id)
+            )
+            result = await self._session.execute(stmt)
+            inserted.extend(VacancyId(value) for value in result.scalars())
+        return inserted
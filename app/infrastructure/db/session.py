@@ -1,10 +1,139 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from collections.abc import Callable
+from enum import StrEnum
+from time import monotonic
+from typing import Any, cast
 
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from app.application.ports.observability_port import IObservabilityService
 from app.core.config import config
 
-engine = create_async_engine(config.ASYNC_SQLALCHEMY_DATABASE_URI)
-async_session_factory = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+
+class DatabaseWorkload(StrEnum):
+    DEFAULT = "default"
+    INGEST = "ingest"
+    MATCHING = "matching"
+    MINIAPP = "miniapp"
+
+
+class ObservedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that reports how long each checkout waited for a connection."""
+
+    on_wait: Callable[[float], None] | None = None
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = monotonic()
+        try:
+            return super()._do_get()
+        finally:
+            if self.on_wait is not None:
+                self.on_wait(monotonic() - started_at)
+
+    def recreate(self) -> "ObservedQueuePool":
+        # QueuePool.recreate() builds `self.__class__`, but is typed as returning QueuePool.
+        pool = cast(ObservedQueuePool, super().recreate())
+        pool.on_wait = self.on_wait
+        return pool
+
+
+def _pool_size(workload: DatabaseWorkload) -> int:
+    return {
+        DatabaseWorkload.DEFAULT: config.DB_POOL_SIZE,
+        DatabaseWorkload.INGEST: config.DB_INGEST_POOL_SIZE,
+        DatabaseWorkload.MATCHING: config.DB_MATCHING_POOL_SIZE,
+        DatabaseWorkload.MINIAPP: config.DB_MINIAPP_POOL_SIZE,
+    }[workload]
+
+
+def create_engine(workload: DatabaseWorkload) -> AsyncEngine:
+    """Engine with its own pool, so a burst in one workload cannot starve the others.
+
+    Connections carry a server-side `statement_timeout` and are tagged with the
+    workload as `application_name`, which makes them tell apart in `pg_stat_activity`.
+    A `DB_PREPARED_STATEMENT_CACHE_SIZE` of 0 turns the asyncpg statement cache
+    off, as required behind PgBouncer in transaction mode.
+    """
+    connect_args: dict[str, Any] = {
+        "prepared_statement_cache_size": config.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        "server_settings": {
+            "application_name": f"{config.LOGFIRE_SERVICE_NAME}:{workload.value}",
+            "statement_timeout": str(config.DB_STATEMENT_TIMEOUT_MS),
+        },
+    }
+    return create_async_engine(
+        config.ASYNC_SQLALCHEMY_DATABASE_URI,
+        poolclass=ObservedQueuePool,
+        pool_size=_pool_size(workload),
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=config.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+
+
+def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+
+def instrument_pools(observability: IObservabilityService) -> None:
+    """Export checked-out connections, overflow in use and checkout wait of every pool."""
+    for workload, workload_engine in engines.items():
+        pool = workload_engine.sync_engine.pool
+        if isinstance(pool, ObservedQueuePool):
+            _instrument_pool(pool, workload, observability)
+
+
+def _instrument_pool(
+    pool: ObservedQueuePool,
+    workload: DatabaseWorkload,
+    observability: IObservabilityService,
+) -> None:
+    # Counted here rather than read from the pool: `checkin` fires before the
+    # connection is back in the queue, so `pool.checkedout()` would lag by one.
+    checked_out = 0
+
+    def on_checkout(*_: object) -> None:
+        nonlocal checked_out
+        checked_out += 1
+        report()
+
+    def on_checkin(*_: object) -> None:
+        nonlocal checked_out
+        checked_out -= 1
+        report()
+
+    def report() -> None:
+        overflow = max(checked_out - pool.size(), 0)
+        observability.observe_db_pool_usage(workload.value, checked_out, overflow)
+
+    def on_wait(seconds: float) -> None:
+        observability.observe_db_pool_wait(workload.value, seconds)
+
+    pool.on_wait = on_wait
+    event.listen(pool, "checkout", on_checkout)
+    event.listen(pool, "checkin", on_checkin)
+
+
+async def dispose_engines() -> None:
+    for workload_engine in engines.values():
+        await workload_engine.dispose()
+
+
+engines = {workload: create_engine(workload) for workload in DatabaseWorkload}
+engine = engines[DatabaseWorkload.DEFAULT]
+async_session_factory = create_session_factory(engine)
+ingest_session_factory = create_session_factory(engines[DatabaseWorkload.INGEST])
+matching_session_factory = create_session_factory(engines[DatabaseWorkload.MATCHING])
+miniapp_session_factory = create_session_factory(engines[DatabaseWorkload.MINIAPP])
@@ -1,6 +1,17 @@
 from .base import SQLAlchemyUnitOfWork
+from .delivery_uow import DeliveryUnitOfWork
+from .extraction_cache_uow import ExtractionCacheUnitOfWork
+from .ingest_uow import IngestUnitOfWork
 from .matching_uow import MatchingUnitOfWork
 from .user_uow import UserUnitOfWork
 from .vacancy_uow import VacancyUnitOfWork
 
-__all__ = ["SQLAlchemyUnitOfWork", "MatchingUnitOfWork", "VacancyUnitOfWork", "UserUnitOfWork"]
+__all__ = [
+    "SQLAlchemyUnitOfWork",
+    "DeliveryUnitOfWork",
+    "ExtractionCacheUnitOfWork",
+    "IngestUnitOfWork",
+    "MatchingUnitOfWork",
+    "VacancyUnitOfWork",
+    "UserUnitOfWork",
+]
@@ -0,0 +1,26 @@
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.ports.unit_of_work import DeliveryUnitOfWork as DeliveryUnitOfWorkPort
+from app.infrastructure.db.repositories.delivery_repository import DeliveryRepository
+from app.infrastructure.db.repositories.user_repository import UserRepository
+from app.infrastructure.db.uow.base import SQLAlchemyUnitOfWork
+
+
+class DeliveryUnitOfWork(SQLAlchemyUnitOfWork, DeliveryUnitOfWorkPort):
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        super().__init__(session_factory)
+        self.deliveries: DeliveryRepository | None = None
+        self.users: UserRepository | None = None
+
+    async def __aenter__(self) -> "DeliveryUnitOfWork":
+        await super().__aenter__()
+        self.deliveries = DeliveryRepository(self.session)
+        self.users = UserRepository(self.session)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            await super().__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self.deliveries = None
+            self.users = None
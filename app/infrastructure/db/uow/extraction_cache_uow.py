@@ -0,0 +1,23 @@
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.db.repositories.llm_extraction_cache_repository import (
+    LLMExtractionCacheRepository,
+)
+from app.infrastructure.db.uow.base import SQLAlchemyUnitOfWork
+
+
+class ExtractionCacheUnitOfWork(SQLAlchemyUnitOfWork):
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        super().__init__(session_factory)
+        self.extraction_cache: LLMExtractionCacheRepository | None = None
+
+    async def __aenter__(self) -> "ExtractionCacheUnitOfWork":
+        await super().__aenter__()
+        self.extraction_cache = LLMExtractionCacheRepository(self.session)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            await super().__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self.extraction_cache = None
@@ -0,0 +1,28 @@
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.ports.unit_of_work import IngestUnitOfWork as IngestUnitOfWorkPort
+from app.infrastructure.db.repositories.channel_cursor_repository import (
+    ChannelCursorRepository,
+)
+from app.infrastructure.db.repositories.ingest_job_repository import IngestJobRepository
+from app.infrastructure.db.uow.base import SQLAlchemyUnitOfWork
+
+
+class IngestUnitOfWork(SQLAlchemyUnitOfWork, IngestUnitOfWorkPort):
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        super().__init__(session_factory)
+        self.ingest_jobs: IngestJobRepository | None = None
+        self.channel_cursors: ChannelCursorRepository | None = None
+
+    async def __aenter__(self) -> "IngestUnitOfWork":
+        await super().__aenter__()
+        self.ingest_jobs = IngestJobRepository(self.session)
+        self.channel_cursors = ChannelCursorRepository(self.session)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            await super().__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self.ingest_jobs = None
+            self.channel_cursors = None
@@ -0,0 +1,5 @@
+from .bloom import BloomFilter
+from .content_hash_index import ContentHashIndex, DedupVerdict
+from .simhash_index import SimHashIndex
+
+__all__ = ["BloomFilter", "ContentHashIndex", "DedupVerdict", "SimHashIndex"]
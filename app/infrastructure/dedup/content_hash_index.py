@@ -0,0 +1,94 @@
+from collections import OrderedDict
+from collections.abc import AsyncIterable
+from enum import StrEnum
+
+from app.core.logger import get_app_logger
+from app.infrastructure.dedup.bloom import BloomFilter
+
+logger = get_app_logger(__name__)
+
+
+class DedupVerdict(StrEnum):
+    NEW = "new"
+    SEEN = "seen"
+    MAYBE = "maybe"
+
+
+class ContentHashIndex:
+    """In-process front for `exists_by_content_hash`.
+
+    A Bloom filter warmed from `vacancies.content_hash` answers "definitely new"
+    without a DB round trip, an exact LRU of recent hashes answers repeats, and
+    only the remaining possible hits fall back to the database. Hashes reserved
+    by a worker that is still processing them are tracked separately, so
+    concurrent copies of one text are not mirrored twice.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, recent_size: int) -> None:
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._recent_size = max(recent_size, 0)
+        self._bloom = BloomFilter(capacity=capacity, error_rate=error_rate)
+        self._recent: OrderedDict[str, None] = OrderedDict()
+        self._in_flight: set[str] = set()
+        self._is_warm = False
+
+    @property
+    def is_warm(self) -> bool:
+        return self._is_warm
+
+    async def warm_up(self, hashes: AsyncIterable[str], expected_count: int) -> int:
+        self._bloom = BloomFilter(
+            capacity=max(self._capacity, expected_count * 2),
+            error_rate=self._error_rate,
+        )
+        loaded = 0
+        async for content_hash in hashes:
+            self._bloom.add(content_hash)
+            loaded += 1
+        self._is_warm = True
+        logger.info(
+            "Content hash index warmed with %s hashes (bits=%s, hashes=%s)",
+            loaded,
+            self._bloom.size_bits,
+            self._bloom.hash_count,
+        )
+        return loaded
+
+    def check(self, content_hash: str) -> DedupVerdict:
+        if content_hash in self._recent:
+            self._recent.move_to_end(content_hash)
+            return DedupVerdict.SEEN
+        if not self._is_warm:
+            return DedupVerdict.MAYBE
+        if not self._bloom.might_contain(content_hash):
+            return DedupVerdict.NEW
+        return DedupVerdict.MAYBE
+
+    def add(self, content_hash: str) -> None:
+        self._bloom.add(content_hash)
+        self.remember(content_hash)
+        if self._bloom.is_saturated and len(self._bloom) == self._bloom.capacity + 1:
+            logger.warning(
+                "Content hash Bloom filter exceeded its capacity (%s); "
+                "false positives will fall back to the database more often",
+                self._bloom.capacity,
+            )
+
+    def remember(self, content_hash: str) -> None:
+        if self._recent_size == 0:
+            return
+        self._recent[content_hash] = None
+        self._recent.move_to_end(content_hash)
+        while len(self._recent) > self._recent_size:
+            self._recent.popitem(last=False)
+
+    def reserve(self, content_hash: str) -> bool:
+        """Claim a hash for processing; False while another worker holds it."""
+        if content_hash in self._in_flight:
+            return False
+        self._in_flight.add(content_hash)
+        return True
+
+    def release(self, content_hash: str) -> None:
+        self._in_flight.discard(content_hash)
@@ -0,0 +1,69 @@
+from collections import defaultdict
+from collections.abc import AsyncIterable
+
+from app.core.logger import get_app_logger
+
+logger = get_app_logger(__name__)
+
+_SIMHASH_BITS = 64
+
+
+class SimHashIndex:
+    """LSH banding index for near-duplicate SimHash lookups.
+
+    Fingerprints are split into `max_distance + 1` bands. Two fingerprints within
+    `max_distance` differing bits must agree on at least one whole band, so only
+    fingerprints sharing a band are compared instead of scanning every vacancy.
+    """
+
+    def __init__(self, max_distance: int) -> None:
+        if not 0 <= max_distance < _SIMHASH_BITS:
+            raise ValueError("SimHash max distance must be between 0 and 63")
+        self.max_distance = max_distance
+        band_count = max_distance + 1
+        base_width, extra = divmod(_SIMHASH_BITS, band_count)
+        self._bands: list[tuple[int, int]] = []
+        offset = 0
+        for band in range(band_count):
+            width = base_width + (1 if band < extra else 0)
+            self._bands.append((offset, (1 << width) - 1))
+            offset += width
+        self._tables: list[defaultdict[int, list[int]]] = [
+            defaultdict(list) for _ in range(band_count)
+        ]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    async def warm_up(self, fingerprints: AsyncIterable[int]) -> int:
+        loaded = 0
+        async for fingerprint in fingerprints:
+            self.add(fingerprint)
+            loaded += 1
+        logger.info(
+            "SimHash index warmed with %s fingerprints (bands=%s)",
+            loaded,
+            len(self._bands),
+        )
+        return loaded
+
+    def add(self, fingerprint: int) -> None:
+        for table, key in zip(self._tables, self._band_keys(fingerprint), strict=True):
+            table[key].append(fingerprint)
+        self._size += 1
+
+    def find_near(self, fingerprint: int) -> tuple[int, int] | None:
+        """Return the closest indexed fingerprint and its distance, if within threshold."""
+        best: tuple[int, int] | None = None
+        for table, key in zip(self._tables, self._band_keys(fingerprint), strict=True):
+            for candidate in table.get(key, ()):
+                distance = (candidate ^ fingerprint).bit_count()
+                if distance <= self.max_distance and (best is None or distance < best[1]):
+                    best = (candidate, distance)
+                    if distance == 0:
+                        return best
+        return best
+
+    def _band_keys(self, fingerprint: int) -> list[int]:
+        return [(fingerprint >> offset) & mask for offset, mask in self._bands]
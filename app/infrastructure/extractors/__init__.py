@@ -1,3 +1,13 @@
+from app.infrastructure.extractors.cached_vacancy_extractor import CachedVacancyLLMExtractor
+from app.infrastructure.extractors.preclassified_vacancy_extractor import (
+    PreClassifiedVacancyLLMExtractor,
+    PreClassifierMode,
+)
 from app.infrastructure.extractors.vacancy_extractor import GoogleVacancyLLMExtractor
 
-__all__ = ["GoogleVacancyLLMExtractor"]
+__all__ = [
+    "CachedVacancyLLMExtractor",
+    "GoogleVacancyLLMExtractor",
+    "PreClassifiedVacancyLLMExtractor",
+    "PreClassifierMode",
+]
@@ -0,0 +1,137 @@
+from datetime import timedelta
+from time import monotonic
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.dto import OutVacancyParse
+from app.application.ports.llm_port import (
+    IVacancyBatchLLMExtractor,
+    IVacancyBatchPrefetcher,
+    IVacancyLLMExtractor,
+)
+from app.application.ports.observability_port import IObservabilityService
+from app.core.logger import get_app_logger
+from app.domain.vacancy.entities import Vacancy
+from app.infrastructure.db.uow import ExtractionCacheUnitOfWork
+
+logger = get_app_logger(__name__)
+
+
+class CachedVacancyLLMExtractor(IVacancyLLMExtractor, IVacancyBatchPrefetcher):
+    """Persistent read-through cache in front of a vacancy extractor.
+
+    Results are keyed by the normalized text hash (same normalization as vacancy
+    dedup) plus the extractor version, so prompt or model changes start a fresh
+    cache. Negative verdicts are cached too: repeated spam and "not a vacancy"
+    posts never reach the `vacancies` table and would otherwise hit the LLM every time.
+    Cache failures are logged and bypassed, never surfaced to the pipeline.
+
+    When the inner extractor supports batching, `prefetch` fills the cache for a
+    group of texts with batched requests ahead of their one-by-one processing.
+    """
+
+    def __init__(
+        self,
+        inner: IVacancyLLMExtractor,
+        session_factory: async_sessionmaker[AsyncSession],
+        observability: IObservabilityService,
+        *,
+        version: str,
+        ttl: timedelta,
+        max_entries: int,
+        batch_size: int = 0,
+        purge_interval_seconds: float = 3600,
+    ) -> None:
+        self._inner = inner
+        self._session_factory = session_factory
+        self._observability = observability
+        self._version = version
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._batch_size = batch_size
+        self._purge_interval_seconds = purge_interval_seconds
+        self._last_purge: float | None = None
+
+    async def parse_vacancy(self, text: str) -> OutVacancyParse:
+        text_hash = Vacancy.compute_content_hash(text).value
+        cached = await self._lookup(text_hash)
+        if cached is not None:
+            return cached
+
+        result = await self._inner.parse_vacancy(text)
+        await self._store(text_hash, result)
+        return result
+
+    async def prefetch(self, texts: list[str]) -> None:
+        if self._batch_size < 2 or not isinstance(self._inner, IVacancyBatchLLMExtractor):
+            return
+        try:
+            pending = await self._uncached(texts)
+            for start in range(0, len(pending), self._batch_size):
+                chunk = pending[start : start + self._batch_size]
+                if len(chunk) < 2:
+                    # A lone message gains nothing from batching; it is parsed on its turn.
+                    break
+                results = await self._inner.parse_vacancies([text for _, text in chunk])
+                for (text_hash, _), result in zip(chunk, results, strict=True):
+                    await self._store(text_hash, result)
+        except Exception:
+            logger.exception("Batched vacancy prefetch failed; messages fall back to single parse")
+
+    async def _uncached(self, texts: list[str]) -> list[tuple[str, str]]:
+        by_hash: dict[str, str] = {}
+        for text in texts:
+            by_hash.setdefault(Vacancy.compute_content_hash(text).value, text)
+        if not by_hash:
+            return []
+        uow = ExtractionCacheUnitOfWork(self._session_factory)
+        async with uow:
+            cached = await uow.extraction_cache.get_verdicts(list(by_hash), self._version)
+        return [(text_hash, text) for text_hash, text in by_hash.items() if text_hash not in cached]
+
+    async def _lookup(self, text_hash: str) -> OutVacancyParse | None:
+        try:
+            uow = ExtractionCacheUnitOfWork(self._session_factory)
+            async with uow:
+                payload = await uow.extraction_cache.get(text_hash, self._version)
+        except Exception:
+            logger.exception("LLM extraction cache lookup failed")
+            self._observability.observe_llm_cache_lookup("error")
+            return None
+
+        if payload is None:
+            self._observability.observe_llm_cache_lookup("miss")
+            return None
+        try:
+            result = OutVacancyParse.model_validate(payload)
+        except ValidationError:
+            logger.warning("Discarding unreadable LLM extraction cache entry %s", text_hash)
+            self._observability.observe_llm_cache_lookup("miss")
+            return None
+        self._observability.observe_llm_cache_lookup("hit")
+        return result
+
+    async def _store(self, text_hash: str, result: OutVacancyParse) -> None:
+        try:
+            uow = ExtractionCacheUnitOfWork(self._session_factory)
+            async with uow:
+                await uow.extraction_cache.put(
+                    text_hash,
+                    self._version,
+                    result.model_dump(mode="json"),
+                    is_vacancy=result.is_vacancy,
+                    ttl=self._ttl,
+                )
+                if self._purge_due():
+                    purged = await uow.extraction_cache.purge(self._max_entries)
+                    logger.info("Purged %s LLM extraction cache entries", purged)
+        except Exception:
+            logger.exception("Failed to store LLM extraction cache entry")
+
+    def _purge_due(self) -> bool:
+        now = monotonic()
+        if self._last_purge is not None and now - self._last_purge < self._purge_interval_seconds:
+            return False
+        self._last_purge = now
+        return True
@@ -0,0 +1,76 @@
+from typing import Literal
+
+import logfire
+
+from app.application.dto import OutVacancyParse
+from app.application.ports.llm_port import IVacancyBatchPrefetcher, IVacancyLLMExtractor
+from app.application.ports.observability_port import IObservabilityService
+from app.core.logger import get_app_logger
+from app.infrastructure.preclassifier import PreClassifierVerdict, VacancyPreClassifier
+
+logger = get_app_logger(__name__)
+extractor_logfire = logfire.with_tags("extractor")
+
+PreClassifierMode = Literal["off", "shadow", "enforce"]
+
+
+class PreClassifiedVacancyLLMExtractor(IVacancyLLMExtractor, IVacancyBatchPrefetcher):
+    """Gate LLM extraction behind a cheap local pre-classifier.
+
+    In `enforce` mode rejected texts get a negative result without an LLM call.
+    In `shadow` mode the LLM is always called and the local verdict is only
+    compared against it, so thresholds can be tuned on live traffic first.
+    """
+
+    def __init__(
+        self,
+        inner: IVacancyLLMExtractor,
+        classifier: VacancyPreClassifier,
+        observability: IObservabilityService,
+        *,
+        mode: PreClassifierMode,
+    ) -> None:
+        self._inner = inner
+        self._classifier = classifier
+        self._observability = observability
+        self._mode = mode
+
+    async def parse_vacancy(self, text: str) -> OutVacancyParse:
+        if self._mode == "off":
+            return await self._inner.parse_vacancy(text)
+
+        verdict = self._classifier.classify(text)
+        if self._mode == "enforce" and not verdict.passed:
+            self._observe(verdict, agreement="unknown")
+            return OutVacancyParse(is_vacancy=False)
+
+        result = await self._inner.parse_vacancy(text)
+        self._observe(verdict, agreement=_agreement(verdict, result))
+        return result
+
+    async def prefetch(self, texts: list[str]) -> None:
+        if not isinstance(self._inner, IVacancyBatchPrefetcher):
+            return
+        if self._mode == "enforce":
+            texts = [text for text in texts if self._classifier.classify(text).passed]
+        await self._inner.prefetch(texts)
+
+    def _observe(self, verdict: PreClassifierVerdict, *, agreement: str) -> None:
+        self._observability.observe_preclassifier_decision(
+            "pass" if verdict.passed else "reject",
+            verdict.reason,
+            agreement,
+        )
+        if agreement == "false_reject":
+            extractor_logfire.warning(
+                "Pre-classifier rejected a vacancy",
+                mode=self._mode,
+                reason=verdict.reason,
+                score=verdict.score,
+            )
+
+
+def _agreement(verdict: PreClassifierVerdict, result: OutVacancyParse) -> str:
+    if verdict.passed == result.is_vacancy:
+        return "agree"
+    return "false_pass" if verdict.passed else "false_reject"
@@ -1,22 +1,107 @@
-from app.application.dto import OutVacancyParse
+import asyncio
+import hashlib
+import json
+from html import escape
+
+from pydantic_ai.exceptions import UnexpectedModelBehavior
+
+from app.application.dto import OutVacancyBatchParse, OutVacancyParse
 from app.application.ports.llm_port import IVacancyLLMExtractor
-from app.infrastructure.llm import get_vacancy_parse_agent
+from app.core.config import config
+from app.core.logger import get_app_logger
+from app.infrastructure.llm import (
+    build_vacancy_batch_system_prompt,
+    build_vacancy_parse_system_prompt,
+    get_vacancy_batch_parse_agent,
+    get_vacancy_parse_agent,
+)
 from app.infrastructure.llm_runtime import run_with_llm_retry
+from app.infrastructure.llm_scheduler import LLMPriority, estimate_tokens
+
+logger = get_app_logger(__name__)
+
+_USER_PROMPT_PREFIX = "Проанализируй текст и сначала определи, является ли он вакансией:\n"
+_BATCH_PROMPT_PREFIX = "Разбери каждое сообщение отдельно:\n"
 
 
 class GoogleVacancyLLMExtractor(IVacancyLLMExtractor):
     def __init__(self) -> None:
         self._agent = get_vacancy_parse_agent()
 
+    @property
+    def cache_version(self) -> str:
+        """Fingerprint of everything that shapes the answer besides the message text."""
+        payload = json.dumps(
+            {
+                "model": config.GOOGLE_MODEL,
+                "system_prompt": build_vacancy_parse_system_prompt(),
+                "user_prompt": _USER_PROMPT_PREFIX,
+                "batch_system_prompt": build_vacancy_batch_system_prompt(),
+                "batch_user_prompt": _BATCH_PROMPT_PREFIX,
+                "output_schema": OutVacancyParse.model_json_schema(),
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
     async def parse_vacancy(self, text: str) -> OutVacancyParse:
         result = await run_with_llm_retry(
             "vacancy_parse",
             lambda: self._agent.run(
-                user_prompt=(
-                    "Проанализируй текст и сначала определи, является ли он вакансией:\n"
-                    f"{text}"
-                ),
+                user_prompt=f"{_USER_PROMPT_PREFIX}{text}",
                 metadata={"pipeline": "vacancy_ingest"},
             ),
+            priority=LLMPriority.BACKGROUND,
+            estimated_tokens=estimate_tokens(text),
+        )
+        return result.output
+
+    async def parse_vacancies(self, texts: list[str]) -> list[OutVacancyParse]:
+        """Parse several messages with one request, sharing the system prompt.
+
+        Messages the model skipped, duplicated or answered off-schema are parsed
+        one by one instead, so the result always lines up with `texts`.
+        """
+        if len(texts) <= 1:
+            return [await self.parse_vacancy(text) for text in texts]
+
+        by_id: dict[int, OutVacancyParse] = {}
+        try:
+            batch = await self._run_batch(texts)
+        except UnexpectedModelBehavior:
+            logger.warning("Batched vacancy parse failed schema validation; parsing one by one")
+        else:
+            for item in batch.items:
+                if 1 <= item.id <= len(texts) and item.id not in by_id:
+                    by_id[item.id] = OutVacancyParse.model_validate(item.model_dump(exclude={"id"}))
+
+        missing = [index for index in range(1, len(texts) + 1) if index not in by_id]
+        if missing:
+            logger.info(
+                "Batched vacancy parse answered %s of %s messages; falling back for the rest",
+                len(texts) - len(missing),
+                len(texts),
+            )
+            fallbacks = await asyncio.gather(
+                *(self.parse_vacancy(texts[index - 1]) for index in missing)
+            )
+            by_id.update(zip(missing, fallbacks, strict=True))
+        return [by_id[index] for index in range(1, len(texts) + 1)]
+
+    async def _run_batch(self, texts: list[str]) -> OutVacancyBatchParse:
+        agent = get_vacancy_batch_parse_agent()
+        messages = "\n".join(
+            f'<message id="{index}">\n{escape(text, quote=False)}\n</message>'
+            for index, text in enumerate(texts, start=1)
+        )
+        result = await run_with_llm_retry(
+            "vacancy_batch_parse",
+            lambda: agent.run(
+                user_prompt=f"{_BATCH_PROMPT_PREFIX}{messages}",
+                metadata={"pipeline": "vacancy_ingest_batch", "batch_size": len(texts)},
+            ),
+            priority=LLMPriority.BACKGROUND,
+            estimated_tokens=estimate_tokens(messages) + 100 * len(texts),
         )
         return result.output
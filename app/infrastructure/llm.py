@@ -4,7 +4,12 @@ from pydantic_ai import Agent
 from pydantic_ai.models.google import GoogleModel, Model
 from pydantic_ai.providers.google import GoogleProvider
 
-from app.application.dto import OutResumeParse, OutResumeSalaryParse, OutVacancyParse
+from app.application.dto import (
+    OutResumeParse,
+    OutResumeSalaryParse,
+    OutVacancyBatchParse,
+    OutVacancyParse,
+)
 from app.core.config import config
 from app.domain.shared.value_objects import SkillType
 
@@ -14,10 +19,9 @@ def get_google_model() -> Model:
     return GoogleModel(config.GOOGLE_MODEL, provider=provider)
 
 
-@lru_cache(maxsize=1)
-def get_vacancy_parse_agent() -> Agent[None, OutVacancyParse]:
+def build_vacancy_parse_system_prompt() -> str:
     allowed_skills = ", ".join(skill.value for skill in SkillType)
-    system_prompt = (
+    return (
         "Ты — строгий фильтр IT-вакансий. Ошибка классификации опаснее в сторону false positive, "
         "чем false negative.\n"
         "Сначала реши только is_vacancy.\n"
@@ -65,9 +69,12 @@ def get_vacancy_parse_agent() -> Agent[None, OutVacancyParse]:
         "4. work_format: REMOTE, HYBRID, ONSITE или UNDEFINED.\n"
     )
 
+
+@lru_cache(maxsize=1)
+def get_vacancy_parse_agent() -> Agent[None, OutVacancyParse]:
     return Agent[None, OutVacancyParse](
         model=get_google_model(),
-        system_prompt=system_prompt,
+        system_prompt=build_vacancy_parse_system_prompt(),
         output_type=OutVacancyParse,
         model_settings={"temperature": 0.0},
         name="vacancy_parser_agent",
@@ -75,6 +82,28 @@ def get_vacancy_parse_agent() -> Agent[None, OutVacancyParse]:
     )
 
 
+def build_vacancy_batch_system_prompt() -> str:
+    return (
+        f"{build_vacancy_parse_system_prompt()}\n"
+        'Тебе придет несколько сообщений, каждое в теге <message id="...">.\n'
+        "Разбирай каждое сообщение независимо от остальных по правилам выше.\n"
+        "Верни в items ровно один элемент на каждое сообщение, с тем же id. "
+        "Не объединяй и не пропускай сообщения.\n"
+    )
+
+
+@lru_cache(maxsize=1)
+def get_vacancy_batch_parse_agent() -> Agent[None, OutVacancyBatchParse]:
+    return Agent[None, OutVacancyBatchParse](
+        model=get_google_model(),
+        system_prompt=build_vacancy_batch_system_prompt(),
+        output_type=OutVacancyBatchParse,
+        model_settings={"temperature": 0.0},
+        name="vacancy_batch_parser_agent",
+        metadata={"agent_type": "vacancy_batch_parser"},
+    )
+
+
 @lru_cache(maxsize=1)
 def get_resume_parse_agent() -> Agent[None, OutResumeParse]:
     allowed_skills = ", ".join(skill.value for skill in SkillType)
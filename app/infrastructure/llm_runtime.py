@@ -1,38 +1,100 @@
 import asyncio
+import re
 from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from time import monotonic
 
-from pydantic_ai.exceptions import ModelHTTPError
+import httpx
+from pydantic_ai.exceptions import ModelAPIError, ModelHTTPError
 
+from app.core.config import config
 from app.core.logger import get_app_logger
+from app.infrastructure.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.infrastructure.llm_scheduler import (
+    LLMPriority,
+    LLMQueueTimeoutError,
+    estimate_tokens,
+    get_llm_scheduler,
+)
+from app.infrastructure.observability import build_observability_service
 
 logger = get_app_logger(__name__)
 
 _RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# Rate limiting says nothing about provider health; the scheduler handles it.
+_UNHEALTHY_STATUS_CODES = _RETRYABLE_STATUS_CODES - {429}
 _RETRY_ATTEMPTS = 3
 _BASE_DELAY_SECONDS = 1.0
+# Gemini reports the quota window in the error body as RetryInfo.retryDelay ("17s").
+_RETRY_DELAY_RE = re.compile(r"retryDelay['\"]?\s*[:=]\s*['\"]?(\d+(?:\.\d+)?)s")
 
 
 class TemporaryLLMUnavailableError(Exception):
     pass
 
 
+class LLMCircuitOpenError(TemporaryLLMUnavailableError):
+    def __init__(self, message: str, retry_in: float) -> None:
+        super().__init__(message)
+        self.retry_in = retry_in
+
+
+@lru_cache(maxsize=1)
+def get_llm_circuit_breaker() -> CircuitBreaker:
+    return CircuitBreaker(
+        "gemini",
+        build_observability_service(),
+        failure_threshold=config.LLM_CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout=config.LLM_CIRCUIT_RECOVERY_SECONDS,
+    )
+
+
 async def run_with_llm_retry[T](
     operation_name: str,
     runner: Callable[[], Awaitable[T]],
+    *,
+    priority: LLMPriority = LLMPriority.BACKGROUND,
+    estimated_tokens: int | None = None,
 ) -> T:
+    scheduler = get_llm_scheduler()
+    breaker = get_llm_circuit_breaker()
+    tokens = estimated_tokens if estimated_tokens is not None else estimate_tokens("")
+    deadline = monotonic() + _deadline_seconds(priority)
+
     for attempt in range(1, _RETRY_ATTEMPTS + 1):
         try:
-            return await runner()
+            async with scheduler.slot(priority, estimated_tokens=tokens, deadline=deadline):
+                # Checked after admission so queued calls see a circuit that opened meanwhile.
+                breaker.before_call()
+                result = await _call_with_breaker(breaker, runner)
+        except CircuitOpenError as exc:
+            raise LLMCircuitOpenError(
+                f"LLM circuit open during {operation_name}",
+                retry_in=exc.retry_in,
+            ) from exc
+        except LLMQueueTimeoutError as exc:
+            raise TemporaryLLMUnavailableError(
+                f"LLM queue deadline exceeded during {operation_name}"
+            ) from exc
         except ModelHTTPError as exc:
             if exc.status_code not in _RETRYABLE_STATUS_CODES:
                 raise
 
-            if attempt == _RETRY_ATTEMPTS:
+            retry_after = _retry_after_seconds(exc)
+            delay_seconds = (
+                retry_after
+                if retry_after is not None
+                else _BASE_DELAY_SECONDS * (2 ** (attempt - 1))
+            )
+            if exc.status_code == 429:
+                # Pause every caller, not just this one: the quota is shared.
+                scheduler.throttle(operation_name, delay_seconds)
+
+            if attempt == _RETRY_ATTEMPTS or monotonic() + delay_seconds > deadline:
                 raise TemporaryLLMUnavailableError(
                     f"LLM temporarily unavailable during {operation_name}"
                 ) from exc
 
-            delay_seconds = _BASE_DELAY_SECONDS * (2 ** (attempt - 1))
             logger.warning(
                 "LLM provider temporarily unavailable during %s "
                 "(status=%s, model=%s, attempt=%s/%s). Retrying in %.1fs",
@@ -43,4 +105,59 @@ async def run_with_llm_retry[T](
                 _RETRY_ATTEMPTS,
                 delay_seconds,
             )
-            await asyncio.sleep(delay_seconds)
+            if exc.status_code != 429:
+                await asyncio.sleep(delay_seconds)
+            continue
+
+        actual_tokens = _reported_tokens(result)
+        if actual_tokens is not None:
+            scheduler.record_usage(tokens, actual_tokens)
+        return result
+
+
+async def _call_with_breaker[T](
+    breaker: CircuitBreaker,
+    runner: Callable[[], Awaitable[T]],
+) -> T:
+    try:
+        result = await runner()
+    except ModelHTTPError as exc:
+        if exc.status_code in _UNHEALTHY_STATUS_CODES:
+            breaker.record_failure()
+        else:
+            breaker.record_ignored()
+        raise
+    except (TimeoutError, ConnectionError, httpx.TransportError, ModelAPIError):
+        # Transport errors (DNS, refused connection, read timeout) and non-HTTP
+        # provider errors are what an outage looks like from here.
+        breaker.record_failure()
+        raise
+    except BaseException:
+        breaker.record_ignored()
+        raise
+    breaker.record_success()
+    return result
+
+
+def _deadline_seconds(priority: LLMPriority) -> float:
+    if priority == LLMPriority.INTERACTIVE:
+        return config.LLM_INTERACTIVE_DEADLINE_SECONDS
+    return config.LLM_BACKGROUND_DEADLINE_SECONDS
+
+
+def _retry_after_seconds(exc: ModelHTTPError) -> float | None:
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is not None:
+        return float(retry_after)
+    if exc.body is None:
+        return None
+    match = _RETRY_DELAY_RE.search(str(exc.body))
+    return float(match.group(1)) if match else None
+
+
+def _reported_tokens(result: object) -> int | None:
+    usage = getattr(result, "usage", None)
+    if callable(usage):
+        usage = usage()
+    total = getattr(usage, "total_tokens", None)
+    return total if isinstance(total, int) else None
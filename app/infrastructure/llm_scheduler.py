@@ -0,0 +1,198 @@
+import asyncio
+import heapq
+import itertools
+import math
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from time import monotonic
+
+from app.application.ports.observability_port import IObservabilityService
+from app.core.config import config
+from app.core.logger import get_app_logger
+from app.infrastructure.observability import build_observability_service
+from app.infrastructure.rate_limit import TokenBucket
+
+logger = get_app_logger(__name__)
+
+# Roughly three characters per token for mixed Cyrillic/Latin text, plus the
+# system prompt and structured output every call carries.
+_CHARS_PER_TOKEN = 3
+_PROMPT_OVERHEAD_TOKENS = 1500
+_TOKENS_PER_IMAGE = 260
+_BURST_SECONDS = 10.0
+
+
+class LLMPriority(IntEnum):
+    """Lower value is admitted first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+class LLMQueueTimeoutError(Exception):
+    pass
+
+
+@dataclass(order=True, slots=True)
+class _Ticket:
+    priority: int
+    sequence: int
+
+
+def estimate_tokens(text: str, *, images: int = 0) -> int:
+    return _PROMPT_OVERHEAD_TOKENS + len(text) // _CHARS_PER_TOKEN + images * _TOKENS_PER_IMAGE
+
+
+class LLMScheduler:
+    """Process-wide admission control for LLM calls.
+
+    Calls wait in a priority queue (FIFO within a priority) until a concurrency
+    slot is free and both the requests-per-minute and tokens-per-minute buckets
+    can pay for them. Background calls never take the last
+    `interactive_reserved_slots` slots, and a provider Retry-After pauses all
+    admissions until it passes.
+    """
+
+    def __init__(
+        self,
+        observability: IObservabilityService,
+        *,
+        max_concurrency: int,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        interactive_reserved_slots: int = 1,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("LLM scheduler requires at least one concurrency slot")
+        self._observability = observability
+        self._max_concurrency = max_concurrency
+        self._background_limit = max(max_concurrency - interactive_reserved_slots, 1)
+        self._clock = clock
+        self._requests = TokenBucket(
+            requests_per_minute / 60,
+            max(requests_per_minute / 60 * _BURST_SECONDS, 1.0),
+            clock=clock,
+        )
+        self._tokens = TokenBucket(
+            tokens_per_minute / 60,
+            max(tokens_per_minute / 60 * _BURST_SECONDS, float(_PROMPT_OVERHEAD_TOKENS)),
+            clock=clock,
+        )
+        self._condition = asyncio.Condition()
+        self._waiting: list[_Ticket] = []
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._paused_until = 0.0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiting)
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        priority: LLMPriority,
+        *,
+        estimated_tokens: int,
+        deadline: float | None = None,
+    ) -> AsyncIterator[None]:
+        """Hold an admission slot; `deadline` is an absolute time on the scheduler clock."""
+        await self._acquire(priority, estimated_tokens, deadline)
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def throttle(self, operation_name: str, seconds: float) -> None:
+        """Stop admitting calls for `seconds` after the provider rate-limited us."""
+        self._observability.observe_llm_rate_limited(operation_name)
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        self._tokens.adjust(actual_tokens - estimated_tokens)
+
+    async def _acquire(
+        self,
+        priority: LLMPriority,
+        estimated_tokens: int,
+        deadline: float | None,
+    ) -> None:
+        ticket = _Ticket(priority.value, next(self._sequence))
+        enqueued_at = self._clock()
+        async with self._condition:
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    delay = self._admission_delay(ticket, estimated_tokens)
+                    if delay == 0:
+                        heapq.heappop(self._waiting)
+                        self._requests.try_consume(1)
+                        self._tokens.try_consume(estimated_tokens)
+                        self._in_flight += 1
+                        self._condition.notify_all()
+                        break
+
+                    timeout = None if math.isinf(delay) else delay
+                    if deadline is not None:
+                        remaining = deadline - self._clock()
+                        if remaining <= 0:
+                            raise LLMQueueTimeoutError(
+                                f"LLM admission deadline exceeded ({priority.name.lower()})"
+                            )
+                        timeout = remaining if timeout is None else min(timeout, remaining)
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), timeout)
+                    except TimeoutError:
+                        pass
+            except BaseException:
+                if ticket in self._waiting:
+                    self._waiting.remove(ticket)
+                    heapq.heapify(self._waiting)
+                self._condition.notify_all()
+                raise
+
+        self._observability.observe_llm_queue_wait(
+            priority.name.lower(),
+            self._clock() - enqueued_at,
+        )
+
+    def _admission_delay(self, ticket: _Ticket, estimated_tokens: int) -> float:
+        if self._waiting[0] is not ticket:
+            return math.inf
+        limit = (
+            self._max_concurrency
+            if ticket.priority == LLMPriority.INTERACTIVE
+            else self._background_limit
+        )
+        if self._in_flight >= limit:
+            return math.inf
+        paused_for = self._paused_until - self._clock()
+        if paused_for > 0:
+            return paused_for
+        return max(self._requests.wait_time(1), self._tokens.wait_time(estimated_tokens))
+
+
+@lru_cache(maxsize=1)
+def get_llm_scheduler() -> LLMScheduler:
+    logger.info(
+        "LLM scheduler configured (concurrency=%s, rpm=%s, tpm=%s)",
+        config.LLM_MAX_CONCURRENCY,
+        config.LLM_REQUESTS_PER_MINUTE,
+        config.LLM_TOKENS_PER_MINUTE,
+    )
+    return LLMScheduler(
+        build_observability_service(),
+        max_concurrency=config.LLM_MAX_CONCURRENCY,
+        requests_per_minute=config.LLM_REQUESTS_PER_MINUTE,
+        tokens_per_minute=config.LLM_TOKENS_PER_MINUTE,
+    )
@@ -1,3 +1,4 @@
-from .telegram_notification_service import TelegramNotificationService
+from .send_limiter import TelegramSendLimiter, get_telegram_send_limiter
+from .telegram_delivery_sender import TelegramDeliverySender
 
-__all__ = ["TelegramNotificationService"]
+__all__ = ["TelegramDeliverySender", "TelegramSendLimiter", "get_telegram_send_limiter"]
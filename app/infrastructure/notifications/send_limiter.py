@@ -0,0 +1,87 @@
+import asyncio
+from collections.abc import Callable
+from functools import lru_cache
+from time import monotonic
+
+from app.core.config import config
+from app.core.logger import get_app_logger
+from app.infrastructure.rate_limit import TokenBucket
+
+logger = get_app_logger(__name__)
+
+_IDLE_CHAT_BUCKETS_LIMIT = 10_000
+
+
+class TelegramSendLimiter:
+    """Process-wide pacing for Bot API sends.
+
+    Each send pays one token from the bot-wide bucket (Telegram allows about 30
+    messages per second) and one from the recipient chat's bucket (about one
+    message per second per chat). A flood-control `retry_after` pauses every
+    send until it passes, since Telegram throttles the bot as a whole.
+    """
+
+    def __init__(
+        self,
+        *,
+        global_rate: float,
+        per_chat_rate: float,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._clock = clock
+        self._per_chat_rate = per_chat_rate
+        self._global = TokenBucket(global_rate, max(global_rate, 1.0), clock=clock)
+        self._chats: dict[int, TokenBucket] = {}
+        self._paused_until = 0.0
+
+    @property
+    def paused_for(self) -> float:
+        return max(self._paused_until - self._clock(), 0.0)
+
+    async def acquire(self, chat_id: int) -> None:
+        """Wait until one message may be sent to `chat_id` and pay for it."""
+        while True:
+            chat = self._chat_bucket(chat_id)
+            delay = max(self.paused_for, self._global.wait_time(), chat.wait_time())
+            if delay == 0:
+                self._global.try_consume()
+                chat.try_consume()
+                return
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            if len(self._chats) >= _IDLE_CHAT_BUCKETS_LIMIT:
+                self._drop_idle_chats()
+            bucket = TokenBucket(
+                self._per_chat_rate, max(self._per_chat_rate, 1.0), clock=self._clock
+            )
+            self._chats[chat_id] = bucket
+        return bucket
+
+    def _drop_idle_chats(self) -> None:
+        # A full bucket behaves exactly like a fresh one, so it can be forgotten.
+        idle = [
+            chat_id
+            for chat_id, bucket in self._chats.items()
+            if bucket.available >= bucket.capacity
+        ]
+        for chat_id in idle:
+            del self._chats[chat_id]
+
+
+@lru_cache(maxsize=1)
+def get_telegram_send_limiter() -> TelegramSendLimiter:
+    logger.info(
+        "Telegram send limiter configured (global=%s/s, per_chat=%s/s)",
+        config.TELEGRAM_SEND_RATE_PER_SECOND,
+        config.TELEGRAM_PER_CHAT_RATE_PER_SECOND,
+    )
+    return TelegramSendLimiter(
+        global_rate=config.TELEGRAM_SEND_RATE_PER_SECOND,
+        per_chat_rate=config.TELEGRAM_PER_CHAT_RATE_PER_SECOND,
+    )
@@ -0,0 +1,185 @@
+import asyncio
+import html
+from collections.abc import Awaitable, Callable
+from itertools import batched
+from time import monotonic
+from typing import Any
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramForbiddenError, TelegramRetryAfter
+
+from app.application.ports.notification_port import IDeliverySender
+from app.application.ports.observability_port import IObservabilityService
+from app.core.logger import get_app_logger
+from app.domain.delivery.entities import Delivery, DeliveryReport, DeliveryStatus
+from app.infrastructure.notifications.send_limiter import TelegramSendLimiter
+
+logger = get_app_logger(__name__)
+
+# Keeps a digest well under Telegram's 4096-character message limit.
+DIGEST_MAX_ITEMS = 20
+
+
+class TelegramDeliverySender(IDeliverySender):
+    """Forward mirror posts for a batch of deliveries, or send them as digests.
+
+    Sends run concurrently, paced by the shared `TelegramSendLimiter`; a
+    flood-control `retry_after` pauses the limiter and the send is retried.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        observability: IObservabilityService,
+        limiter: TelegramSendLimiter,
+        *,
+        concurrency: int,
+        max_flood_retries: int,
+        mirror_channel_username: str = "",
+    ) -> None:
+        self._bot = bot
+        self._observability = observability
+        self._limiter = limiter
+        self._concurrency = max(concurrency, 1)
+        self._max_flood_retries = max_flood_retries
+        self._mirror_channel_username = mirror_channel_username.strip().lstrip("@")
+        self._backlog = 0
+
+    async def send(self, deliveries: list[Delivery]) -> DeliveryReport:
+        return await self._send_groups([[delivery] for delivery in deliveries], self._forward)
+
+    async def send_digests(self, deliveries: list[Delivery]) -> DeliveryReport:
+        """Send each user one message listing their deliveries, linking to the mirror posts."""
+        by_user: dict[int, list[Delivery]] = {}
+        for delivery in deliveries:
+            by_user.setdefault(delivery.tg_id, []).append(delivery)
+        groups = [
+            list(chunk)
+            for user_deliveries in by_user.values()
+            for chunk in batched(user_deliveries, DIGEST_MAX_ITEMS)
+        ]
+        return await self._send_groups(groups, self._send_digest)
+
+    async def _send_groups(
+        self,
+        groups: list[list[Delivery]],
+        send: Callable[[list[Delivery]], Awaitable[Any]],
+    ) -> DeliveryReport:
+        """Make one send per group; the outcome applies to every delivery in it."""
+        report = DeliveryReport()
+        if not groups:
+            return report
+        started_at = monotonic()
+        pending = iter(groups)
+        self._change_backlog(len(groups))
+
+        async def worker() -> None:
+            # Workers share one iterator, so each group is taken exactly once.
+            for group in pending:
+                try:
+                    status, error = await self._send_one(group, send)
+                finally:
+                    self._change_backlog(-1)
+                ids = [delivery.id for delivery in group]
+                if status == DeliveryStatus.SENT:
+                    report.sent.extend(ids)
+                elif status == DeliveryStatus.FORBIDDEN:
+                    report.forbidden.extend(ids)
+                else:
+                    report.failed.update(dict.fromkeys(ids, error or status.value))
+
+        workers = min(self._concurrency, len(groups))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        self._observability.observe_dispatch_duration(monotonic() - started_at)
+        logger.info(
+            "Delivery batch finished: sent=%s forbidden=%s failed=%s",
+            len(report.sent),
+            len(report.forbidden),
+            len(report.failed),
+        )
+        return report
+
+    async def _send_one(
+        self,
+        group: list[Delivery],
+        send: Callable[[list[Delivery]], Awaitable[Any]],
+    ) -> tuple[DeliveryStatus, str | None]:
+        """Send to one user, retrying after flood control; returns status and error."""
+        tg_id = group[0].tg_id
+        vacancy_ids = ", ".join(str(delivery.vacancy_id) for delivery in group)
+        for _ in range(self._max_flood_retries + 1):
+            await self._limiter.acquire(tg_id)
+            try:
+                await send(group)
+            except TelegramRetryAfter as exc:
+                self._observability.observe_telegram_send("retry_after")
+                logger.warning(
+                    "Flood control while sending vacancy %s: pausing sends for %ss",
+                    vacancy_ids,
+                    exc.retry_after,
+                )
+                self._limiter.pause(exc.retry_after)
+            except TelegramForbiddenError:
+                self._observability.observe_telegram_send("forbidden")
+                logger.warning(
+                    "Failed to send vacancy %s to user %s: bot forbidden",
+                    vacancy_ids,
+                    tg_id,
+                )
+                return DeliveryStatus.FORBIDDEN, None
+            except Exception as exc:
+                self._observability.observe_telegram_send("failed")
+                logger.exception("Failed to send vacancy %s to user %s", vacancy_ids, tg_id)
+                return DeliveryStatus.FAILED, type(exc).__name__
+            else:
+                self._observability.observe_telegram_send("sent")
+                return DeliveryStatus.SENT, None
+        return DeliveryStatus.FAILED, TelegramRetryAfter.__name__
+
+    async def _forward(self, group: list[Delivery]) -> None:
+        delivery = group[0]
+        await self._bot.forward_message(
+            chat_id=delivery.tg_id,
+            from_chat_id=delivery.mirror_chat_id,
+            message_id=delivery.mirror_message_id,
+        )
+
+    async def _send_digest(self, group: list[Delivery]) -> None:
+        await self._bot.send_message(
+            chat_id=group[0].tg_id,
+            text=build_digest_text(group, self._mirror_channel_username),
+            parse_mode="HTML",
+            disable_web_page_preview=True,
+        )
+
+    def _change_backlog(self, delta: int) -> None:
+        self._backlog += delta
+        self._observability.observe_telegram_send_backlog(self._backlog)
+
+
+def build_digest_text(deliveries: list[Delivery], mirror_channel_username: str = "") -> str:
+    lines = [f"📬 <b>Подборка вакансий: {len(deliveries)}</b>", ""]
+    for number, delivery in enumerate(deliveries, start=1):
+        url = mirror_post_url(
+            delivery.mirror_chat_id,
+            delivery.mirror_message_id,
+            mirror_channel_username,
+        )
+        title = _preview_title(delivery.preview) or "Вакансия"
+        lines.append(f'{number}. <a href="{html.escape(url)}">{html.escape(title)}</a>')
+    return "\n".join(lines)
+
+
+def mirror_post_url(chat_id: int, message_id: int, channel_username: str = "") -> str:
+    """Link to a mirror post: public by username, otherwise the members-only `/c/` form."""
+    if channel_username:
+        return f"https://t.me/{channel_username}/{message_id}"
+    internal_id = str(chat_id).removeprefix("-100").removeprefix("-")
+    return f"https://t.me/c/{internal_id}/{message_id}"
+
+
+def _preview_title(preview: str | None) -> str:
+    if not preview:
+        return ""
+    first_line = next((line.strip() for line in preview.splitlines() if line.strip()), "")
+    return first_line[:80]
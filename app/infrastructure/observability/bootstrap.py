@@ -4,7 +4,7 @@ from prometheus_client import start_http_server
 from app.application.ports.observability_port import IObservabilityService
 from app.core.config import config
 from app.core.logger import get_app_logger
-from app.infrastructure.db.session import engine
+from app.infrastructure.db.session import engines, instrument_pools
 from app.infrastructure.observability.service import (
     NoOpObservabilityService,
     PrometheusObservabilityService,
@@ -53,7 +53,7 @@ def init_logfire() -> None:
             include_content=False,
             include_binary_content=False,
         )
-        logfire.instrument_sqlalchemy(engine)
+        logfire.instrument_sqlalchemy(engines=engines.values())
         logfire.instrument_system_metrics()
         logger.info("Logfire initialized")
     except Exception:
@@ -66,6 +66,7 @@ def init_metrics_server() -> None:
         return
 
     start_http_server(port=config.METRICS_PORT, addr=config.METRICS_ADDR)
+    instrument_pools(build_observability_service())
     logger.info(
         "Metrics server started at %s:%s",
         config.METRICS_ADDR,
@@ -1,5 +1,5 @@
 import psutil  # type: ignore[import-untyped]
-from prometheus_client import Counter, Gauge
+from prometheus_client import Counter, Gauge, Histogram
 
 VACANCIES_COLLECTED_TOTAL = Counter(
     "job_monitor_vacancies_collected_total",
@@ -17,6 +17,95 @@ SKILL_MATCHES_TOTAL = Counter(
     ["skill"],
 )
 
+INGEST_QUEUE_DEPTH = Gauge(
+    "job_monitor_ingest_queue_depth",
+    "Number of received messages waiting in the ingest queue.",
+)
+
+INGEST_QUEUE_WAIT_SECONDS = Histogram(
+    "job_monitor_ingest_queue_wait_seconds",
+    "Time a received message spent in the ingest queue before processing.",
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+
+DEDUP_CHECKS_TOTAL = Counter(
+    "job_monitor_dedup_checks_total",
+    "Content-hash dedup checks by in-memory verdict (new, seen, maybe -> database).",
+    ["result"],
+)
+
+LLM_CACHE_LOOKUPS_TOTAL = Counter(
+    "job_monitor_llm_cache_lookups_total",
+    "Vacancy extraction cache lookups by result (hit, miss, error).",
+    ["result"],
+)
+
+PRECLASSIFIER_DECISIONS_TOTAL = Counter(
+    "job_monitor_preclassifier_decisions_total",
+    "Local pre-classifier verdicts and their agreement with the LLM (unknown when not called).",
+    ["verdict", "reason", "agreement"],
+)
+
+LLM_QUEUE_WAIT_SECONDS = Histogram(
+    "job_monitor_llm_queue_wait_seconds",
+    "Time an LLM call waited for admission by the scheduler, by priority.",
+    ["priority"],
+    buckets=(0.01, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+
+LLM_RATE_LIMITED_TOTAL = Counter(
+    "job_monitor_llm_rate_limited_total",
+    "LLM calls rejected by the provider with 429, by operation.",
+    ["operation"],
+)
+
+CIRCUIT_STATE = Gauge(
+    "job_monitor_circuit_state",
+    "Circuit breaker state per upstream (0 closed, 1 half-open, 2 open).",
+    ["name"],
+)
+
+TELEGRAM_SENDS_TOTAL = Counter(
+    "job_monitor_telegram_sends_total",
+    "Bot API send attempts to users by result (sent, forbidden, failed, retry_after).",
+    ["result"],
+)
+
+TELEGRAM_SEND_BACKLOG = Gauge(
+    "job_monitor_telegram_send_backlog",
+    "Recipients of in-progress vacancy dispatches that have not been handled yet.",
+)
+
+DISPATCH_DURATION_SECONDS = Histogram(
+    "job_monitor_dispatch_duration_seconds",
+    "Time from the start of a delivery batch until its last recipient was handled.",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+)
+
+DELIVERY_QUEUE_DEPTH = Gauge(
+    "job_monitor_delivery_queue_depth",
+    "Deliveries waiting in the persistent queue or leased to a worker.",
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Database connections currently checked out of the pool",
+    ["workload"],
+)
+
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Checked-out database connections beyond the pool size",
+    ["workload"],
+)
+
+DB_POOL_WAIT_SECONDS = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a database connection from the pool",
+    ["workload"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30),
+)
+
 PROCESS_RSS_BYTES = Gauge(
     "job_monitor_process_rss_bytes",
     "Resident set size (RSS) memory used by the current process in bytes.",
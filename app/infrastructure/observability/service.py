@@ -1,10 +1,27 @@
 from app.application.ports.observability_port import IObservabilityService
 from app.infrastructure.observability.metrics import (
+    CIRCUIT_STATE,
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_WAIT_SECONDS,
+    DEDUP_CHECKS_TOTAL,
+    DELIVERY_QUEUE_DEPTH,
+    DISPATCH_DURATION_SECONDS,
+    INGEST_QUEUE_DEPTH,
+    INGEST_QUEUE_WAIT_SECONDS,
+    LLM_CACHE_LOOKUPS_TOTAL,
+    LLM_QUEUE_WAIT_SECONDS,
+    LLM_RATE_LIMITED_TOTAL,
     MESSAGES_NOT_VACANCY_TOTAL,
+    PRECLASSIFIER_DECISIONS_TOTAL,
     SKILL_MATCHES_TOTAL,
+    TELEGRAM_SEND_BACKLOG,
+    TELEGRAM_SENDS_TOTAL,
     VACANCIES_COLLECTED_TOTAL,
 )
 
+_CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
 
 class PrometheusObservabilityService(IObservabilityService):
     def observe_vacancy_collected(self, count: int = 1) -> None:
@@ -16,6 +33,51 @@ class PrometheusObservabilityService(IObservabilityService):
     def observe_skill_match(self, skill: str, count: int = 1) -> None:
         SKILL_MATCHES_TOTAL.labels(skill=skill).inc(count)
 
+    def observe_ingest_queue_depth(self, depth: int) -> None:
+        INGEST_QUEUE_DEPTH.set(depth)
+
+    def observe_ingest_queue_wait(self, seconds: float) -> None:
+        INGEST_QUEUE_WAIT_SECONDS.observe(seconds)
+
+    def observe_dedup_check(self, result: str) -> None:
+        DEDUP_CHECKS_TOTAL.labels(result=result).inc()
+
+    def observe_llm_cache_lookup(self, result: str) -> None:
+        LLM_CACHE_LOOKUPS_TOTAL.labels(result=result).inc()
+
+    def observe_preclassifier_decision(self, verdict: str, reason: str, agreement: str) -> None:
+        PRECLASSIFIER_DECISIONS_TOTAL.labels(
+            verdict=verdict, reason=reason, agreement=agreement
+        ).inc()
+
+    def observe_llm_queue_wait(self, priority: str, seconds: float) -> None:
+        LLM_QUEUE_WAIT_SECONDS.labels(priority=priority).observe(seconds)
+
+    def observe_llm_rate_limited(self, operation: str) -> None:
+        LLM_RATE_LIMITED_TOTAL.labels(operation=operation).inc()
+
+    def observe_circuit_state(self, name: str, state: str) -> None:
+        CIRCUIT_STATE.labels(name=name).set(_CIRCUIT_STATE_VALUES.get(state, -1))
+
+    def observe_telegram_send(self, result: str) -> None:
+        TELEGRAM_SENDS_TOTAL.labels(result=result).inc()
+
+    def observe_telegram_send_backlog(self, depth: int) -> None:
+        TELEGRAM_SEND_BACKLOG.set(depth)
+
+    def observe_dispatch_duration(self, seconds: float) -> None:
+        DISPATCH_DURATION_SECONDS.observe(seconds)
+
+    def observe_delivery_queue_depth(self, depth: int) -> None:
+        DELIVERY_QUEUE_DEPTH.set(depth)
+
+    def observe_db_pool_usage(self, workload: str, checked_out: int, overflow: int) -> None:
+        DB_POOL_CHECKED_OUT.labels(workload=workload).set(checked_out)
+        DB_POOL_OVERFLOW.labels(workload=workload).set(overflow)
+
+    def observe_db_pool_wait(self, workload: str, seconds: float) -> None:
+        DB_POOL_WAIT_SECONDS.labels(workload=workload).observe(seconds)
+
 
 class NoOpObservabilityService(IObservabilityService):
     def observe_vacancy_collected(self, count: int = 1) -> None:
@@ -26,3 +88,45 @@ class NoOpObservabilityService(IObservabilityService):
 
     def observe_skill_match(self, skill: str, count: int = 1) -> None:
         return None
+
+    def observe_ingest_queue_depth(self, depth: int) -> None:
+        return None
+
+    def observe_ingest_queue_wait(self, seconds: float) -> None:
+        return None
+
+    def observe_dedup_check(self, result: str) -> None:
+        return None
+
+    def observe_llm_cache_lookup(self, result: str) -> None:
+        return None
+
+    def observe_preclassifier_decision(self, verdict: str, reason: str, agreement: str) -> None:
+        return None
+
+    def observe_llm_queue_wait(self, priority: str, seconds: float) -> None:
+        return None
+
+    def observe_llm_rate_limited(self, operation: str) -> None:
+        return None
+
+    def observe_circuit_state(self, name: str, state: str) -> None:
+        return None
+
+    def observe_telegram_send(self, result: str) -> None:
+        return None
+
+    def observe_telegram_send_backlog(self, depth: int) -> None:
+        return None
+
+    def observe_dispatch_duration(self, seconds: float) -> None:
+        return None
+
+    def observe_delivery_queue_depth(self, depth: int) -> None:
+        return None
+
+    def observe_db_pool_usage(self, workload: str, checked_out: int, overflow: int) -> None:
+        return None
+
+    def observe_db_pool_wait(self, workload: str, seconds: float) -> None:
+        return None
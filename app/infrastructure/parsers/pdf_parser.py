@@ -10,6 +10,7 @@ from app.core.logger import get_app_logger
 from app.domain.shared.value_objects import Salary
 from app.infrastructure.llm import get_resume_parse_agent, get_resume_salary_agent
 from app.infrastructure.llm_runtime import run_with_llm_retry
+from app.infrastructure.llm_scheduler import LLMPriority, estimate_tokens
 from app.infrastructure.parsers.base import BaseResumeParser, ParserInput
 from app.infrastructure.parsers.exceptions import NotAResumeError, ParserError, TooManyPagesError
 
@@ -117,6 +118,8 @@ class PDFParser(BaseResumeParser):
                 user_prompt=prompt_parts,
                 metadata={"pipeline": "resume_parse"},
             ),
+            priority=LLMPriority.INTERACTIVE,
+            estimated_tokens=estimate_tokens(pdf_text, images=len(images)),
         )
         parsed_data = result.output
 
@@ -148,6 +151,8 @@ class PDFParser(BaseResumeParser):
                 user_prompt=f"Текст резюме:\n{pdf_text}",
                 metadata={"pipeline": "resume_salary_pass"},
             ),
+            priority=LLMPriority.INTERACTIVE,
+            estimated_tokens=estimate_tokens(pdf_text),
         )
         return result.output
 
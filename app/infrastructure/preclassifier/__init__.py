@@ -0,0 +1,10 @@
+from .classifier import PreClassifierVerdict, VacancyPreClassifier
+from .model import HashedLogisticRegression
+from .rules import rule_rejection
+
+__all__ = [
+    "HashedLogisticRegression",
+    "PreClassifierVerdict",
+    "VacancyPreClassifier",
+    "rule_rejection",
+]
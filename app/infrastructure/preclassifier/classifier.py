@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+
+from app.infrastructure.preclassifier.model import HashedLogisticRegression
+from app.infrastructure.preclassifier.rules import rule_rejection
+
+
+@dataclass(frozen=True, slots=True)
+class PreClassifierVerdict:
+    passed: bool
+    reason: str
+    score: float | None = None
+
+
+class VacancyPreClassifier:
+    """Local first stage that rejects clear non-vacancies before the LLM.
+
+    Rules run first; the optional model only rejects texts it scores below
+    `reject_threshold`, so it is tuned for precision on negatives.
+    """
+
+    def __init__(
+        self,
+        model: HashedLogisticRegression | None = None,
+        *,
+        reject_threshold: float = 0.1,
+    ) -> None:
+        self._model = model
+        self._reject_threshold = reject_threshold
+
+    def classify(self, text: str) -> PreClassifierVerdict:
+        reason = rule_rejection(text)
+        if reason is not None:
+            return PreClassifierVerdict(passed=False, reason=reason)
+        if self._model is None:
+            return PreClassifierVerdict(passed=True, reason="rules")
+
+        score = self._model.predict_proba(text)
+        if score < self._reject_threshold:
+            return PreClassifierVerdict(passed=False, reason="model", score=score)
+        return PreClassifierVerdict(passed=True, reason="model", score=score)
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import math
+import random
+import re
+from collections.abc import Iterable
+from pathlib import Path
+
+_TOKEN_RE = re.compile(r"[\w+#]+", re.UNICODE)
+_URL_RE = re.compile(r"https?://\S+|t\.me/\S+", re.IGNORECASE)
+_MODEL_FORMAT = "hashed-logreg-v1"
+
+
+def _hashed_features(text: str, n_features: int) -> dict[int, float]:
+    """Signed feature hashing of word unigrams and bigrams."""
+    tokens = _TOKEN_RE.findall(_URL_RE.sub(" url ", text.lower()))
+    grams = tokens + [f"{left} {right}" for left, right in zip(tokens, tokens[1:], strict=False)]
+    features: dict[int, float] = {}
+    for gram in grams:
+        digest = int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest())
+        index = digest % n_features
+        sign = 1.0 if digest >> 63 else -1.0
+        features[index] = features.get(index, 0.0) + sign
+    if not features:
+        return features
+    norm = math.sqrt(sum(value * value for value in features.values()))
+    return {index: value / norm for index, value in features.items()}
+
+
+def _sigmoid(value: float) -> float:
+    if value >= 0:
+        return 1.0 / (1.0 + math.exp(-value))
+    exp = math.exp(value)
+    return exp / (1.0 + exp)
+
+
+class HashedLogisticRegression:
+    """Tiny CPU text classifier: hashed n-gram features + logistic regression.
+
+    Weights are kept sparse, so a model trained on a few thousand labelled posts
+    loads in milliseconds and scores a message in microseconds.
+    """
+
+    def __init__(self, weights: dict[int, float], bias: float, n_features: int) -> None:
+        self._weights = weights
+        self._bias = bias
+        self.n_features = n_features
+
+    def predict_proba(self, text: str) -> float:
+        """Probability that `text` is a vacancy."""
+        score = self._bias
+        for index, value in _hashed_features(text, self.n_features).items():
+            score += self._weights.get(index, 0.0) * value
+        return _sigmoid(score)
+
+    @classmethod
+    def train(
+        cls,
+        samples: Iterable[tuple[str, bool]],
+        *,
+        n_features: int = 2**18,
+        epochs: int = 8,
+        learning_rate: float = 0.5,
+        l2: float = 1e-6,
+        seed: int = 0,
+    ) -> "HashedLogisticRegression":
+        dataset = [(_hashed_features(text, n_features), label) for text, label in samples]
+        if not dataset:
+            raise ValueError("Cannot train a pre-classifier without samples")
+
+        weights: dict[int, float] = {}
+        bias = 0.0
+        rng = random.Random(seed)
+        for epoch in range(epochs):
+            rng.shuffle(dataset)
+            step = learning_rate / (1 + epoch)
+            for features, label in dataset:
+                score = bias + sum(weights.get(i, 0.0) * v for i, v in features.items())
+                error = _sigmoid(score) - (1.0 if label else 0.0)
+                bias -= step * error
+                for index, value in features.items():
+                    weight = weights.get(index, 0.0)
+                    weights[index] = weight - step * (error * value + l2 * weight)
+        return cls(weights, bias, n_features)
+
+    def save(self, path: str | Path) -> None:
+        payload = {
+            "format": _MODEL_FORMAT,
+            "n_features": self.n_features,
+            "bias": self._bias,
+            "weights": {str(index): weight for index, weight in self._weights.items() if weight},
+        }
+        Path(path).write_text(json.dumps(payload), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "HashedLogisticRegression":
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        if payload.get("format") != _MODEL_FORMAT:
+            raise ValueError(f"Unsupported pre-classifier model format in {path}")
+        weights = {int(index): float(weight) for index, weight in payload["weights"].items()}
+        return cls(weights, float(payload["bias"]), int(payload["n_features"]))
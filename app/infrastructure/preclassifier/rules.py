@@ -0,0 +1,58 @@
+import re
+
+# Hiring vocabulary: a post without any of these is never a vacancy for our purposes.
+_HIRING_RE = re.compile(
+    r"ваканси|ищем|требуетс|нужен|нужна|нанима|в команду|обязанност|требовани|условия"
+    r"|зарплат|з/п|зп\b|оклад|вилка|оффер|офер|удал[её]нк|гибрид|офис|откликн|резюме на"
+    r"|hiring|we are looking|looking for|join our|vacancy|position|salary|responsibilit"
+    r"|requirements|remote|developer|engineer|разработчик|инженер|аналитик|дизайнер"
+    r"|тестировщик|devops|qa\b|lead\b|тимлид",
+    re.IGNORECASE,
+)
+_SELF_PROMO_RE = re.compile(
+    r"#резюме|#ищу_?работу|#cv\b|ищу работу|ищу проект|ищу заказ|возьму проект|возьмусь за"
+    r"|рассмотрю предложения|мо[её] портфолио|open to work|#opentowork|#фриланс_?услуги"
+    r"|предлагаю свои услуги|выполню|сделаю для вас",
+    re.IGNORECASE,
+)
+# Employer posts are hiring-specific; generic words like "офис" or "developer" also
+# show up in course ads, so ads are only rejected without these.
+_STRONG_HIRING_RE = re.compile(
+    r"ваканси|обязанност|требовани|зарплат|з/п|оклад|вилка|hiring|responsibilit|requirements",
+    re.IGNORECASE,
+)
+_AD_RE = re.compile(
+    r"#реклама|промокод|розыгрыш|курс со скидкой|бесплатный вебинар|записывайтесь на курс"
+    r"|запишитесь на курс|онлайн-школ",
+    re.IGNORECASE,
+)
+_DIGEST_RE = re.compile(r"подборка|дайджест|digest|вакансии недели|топ вакансий", re.IGNORECASE)
+_VACANCY_TAG_RE = re.compile(r"#ваканси|#vacancy|#job\b", re.IGNORECASE)
+_LINK_RE = re.compile(r"https?://\S+|t\.me/\S+", re.IGNORECASE)
+
+_DIGEST_MIN_LINKS = 4
+# Counted per line: a single vacancy often stacks several tags in its header.
+_DIGEST_MIN_TAGGED_LINES = 3
+
+
+def rule_rejection(text: str) -> str | None:
+    """Return the reason a text is clearly not a single vacancy, or None if plausible.
+
+    Mirrors the negative cases of the vacancy system prompt; only confident
+    negatives are rejected, everything ambiguous is left to the LLM.
+    """
+    if not _HIRING_RE.search(text):
+        return "no_hiring_signal"
+    if _SELF_PROMO_RE.search(text):
+        return "self_promo"
+    if _AD_RE.search(text) and not _STRONG_HIRING_RE.search(text):
+        return "advertisement"
+    if _tagged_lines(text) >= _DIGEST_MIN_TAGGED_LINES:
+        return "digest"
+    if _DIGEST_RE.search(text) and len(_LINK_RE.findall(text)) >= _DIGEST_MIN_LINKS:
+        return "digest"
+    return None
+
+
+def _tagged_lines(text: str) -> int:
+    return sum(1 for line in text.splitlines() if _VACANCY_TAG_RE.search(line))
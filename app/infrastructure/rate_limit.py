@@ -0,0 +1,53 @@
+from collections.abc import Callable
+from time import monotonic
+
+
+class TokenBucket:
+    """Classic token bucket: refills at `rate` units per second up to `capacity`.
+
+    Not thread-safe; callers share it within one event loop.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        *,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("Token bucket rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated_at = clock()
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def wait_time(self, amount: float = 1.0) -> float:
+        """Seconds until `amount` units can be taken (0 when available now)."""
+        self._refill()
+        missing = min(amount, self.capacity) - self._tokens
+        return max(missing, 0.0) / self.rate
+
+    def try_consume(self, amount: float = 1.0) -> bool:
+        if self.wait_time(amount) > 0:
+            return False
+        self._tokens -= min(amount, self.capacity)
+        return True
+
+    def adjust(self, amount: float) -> None:
+        """Debit (positive) or refund (negative) units after the fact; may go into debt."""
+        self._refill()
+        self._tokens = min(self._tokens - amount, self.capacity)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
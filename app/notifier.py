@@ -0,0 +1,38 @@
+import asyncio
+
+from aiogram import Bot
+
+from app.bootstrap.bootstrap import build_delivery_worker
+from app.bootstrap.shutdown import install_shutdown_handlers, remove_shutdown_handlers
+from app.core.config import config
+from app.infrastructure.db import dispose_engines
+from app.infrastructure.observability import init_logfire, init_metrics_server
+from app.infrastructure.sentry import init_sentry
+
+
+async def main() -> None:
+    """Run only the delivery worker; set DELIVERY_WORKER_ENABLED=false for the main app."""
+    config.validate_runtime()
+    init_sentry()
+    init_logfire()
+    init_metrics_server()
+
+    bot = Bot(token=config.BOT_TOKEN)
+    worker = build_delivery_worker(bot)
+    stop_event = asyncio.Event()
+    installed_signals = install_shutdown_handlers(stop_event)
+    worker_task = asyncio.create_task(worker.start(), name="delivery-worker")
+    stop_task = asyncio.create_task(stop_event.wait(), name="shutdown-signal")
+    try:
+        await asyncio.wait({worker_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        remove_shutdown_handlers(installed_signals)
+        worker.stop()
+        stop_task.cancel()
+        await asyncio.gather(worker_task, stop_task, return_exceptions=True)
+        await bot.session.close()
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
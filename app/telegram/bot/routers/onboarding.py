@@ -27,11 +27,11 @@ async def cmd_start(message: Message, state: FSMContext) -> None:
     uow = UserUnitOfWork(async_session_factory)
     service = UserService(uow)
     try:
-        user, is_new = await service.get_or_create_user(
+        is_new = await service.register_user(
             tg_id=user_id,
             username=message.from_user.username,
         )
-        logger.info(f"User {user.username} saved in db")
+        logger.info(f"User {message.from_user.username} saved in db")
     except Exception:
         logger.exception(f"Failed to save user (tg_id={user_id})")
         logger.info("/start aborted due to persistence failure")
@@ -23,7 +23,12 @@ async def send_settings_menu(bot: Bot, chat_id: int, tg_id: int) -> None:
         return
 
     view = build_settings_menu_view(user)
-    if not view.specialty_url or not view.format_url or not view.salary_url:
+    if (
+        not view.specialty_url
+        or not view.format_url
+        or not view.salary_url
+        or not view.delivery_url
+    ):
         await bot.send_message(
             chat_id=chat_id,
             text=build_settings_unavailable_text(),
@@ -38,8 +43,10 @@ async def send_settings_menu(bot: Bot, chat_id: int, tg_id: int) -> None:
             specialty_and_skills_label=view.specialty_label,
             format_label=view.format_label,
             salary_label=view.salary_label,
+            delivery_label=view.delivery_label,
             specialty_url=view.specialty_url,
             format_url=view.format_url,
             salary_url=view.salary_url,
+            delivery_url=view.delivery_url,
         ),
     )
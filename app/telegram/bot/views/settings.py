@@ -4,18 +4,20 @@ from urllib.parse import urlsplit, urlunsplit
 
 from app.core.config import config
 from app.domain.user.entities import User
-from app.domain.user.value_objects import FilterMode
+from app.domain.user.value_objects import DeliveryMode, FilterMode
 from app.telegram.bot.views.copy import build_settings_intro_text
 from app.telegram.bot.views.tracking_settings import format_work_format
 
 SETTINGS_ENTRY_SPECIALTY = "specialty"
 SETTINGS_ENTRY_FORMAT = "format"
 SETTINGS_ENTRY_SALARY = "salary"
+SETTINGS_ENTRY_DELIVERY = "delivery"
 
 ENTRY_TO_PAGE = {
     SETTINGS_ENTRY_SPECIALTY: "specialty",
     SETTINGS_ENTRY_FORMAT: "format",
     SETTINGS_ENTRY_SALARY: "salary",
+    SETTINGS_ENTRY_DELIVERY: "delivery",
 }
 
 
@@ -24,9 +26,11 @@ class SettingsMenuView:
     specialty_label: str
     format_label: str
     salary_label: str
+    delivery_label: str
     specialty_url: str
     format_url: str
     salary_url: str
+    delivery_url: str
 
 
 def build_settings_menu_view(user: User) -> SettingsMenuView:
@@ -37,18 +41,22 @@ def build_settings_menu_view(user: User) -> SettingsMenuView:
     specialty_label = f"Направления и стек [Выбрано: {selected_count}]"
     format_label = f"Формат работы [{_format_label(user)}]"
     salary_label = f"Зарплатный ориентир [{_salary_label(user)}]"
+    delivery_label = f"Доставка [{_delivery_label(user)}]"
 
     specialty_url = _build_entry_url(SETTINGS_ENTRY_SPECIALTY)
     format_url = _build_entry_url(SETTINGS_ENTRY_FORMAT)
     salary_url = _build_entry_url(SETTINGS_ENTRY_SALARY)
+    delivery_url = _build_entry_url(SETTINGS_ENTRY_DELIVERY)
 
     return SettingsMenuView(
         specialty_label=specialty_label,
         format_label=format_label,
         salary_label=salary_label,
+        delivery_label=delivery_label,
         specialty_url=specialty_url,
         format_url=format_url,
         salary_url=salary_url,
+        delivery_url=delivery_url,
     )
 
 
@@ -74,6 +82,12 @@ def _salary_label(user: User) -> str:
     return f"от {amount} RUB/мес"
 
 
+def _delivery_label(user: User) -> str:
+    if user.delivery_mode == DeliveryMode.DIGEST:
+        return "Подборкой"
+    return "Сразу"
+
+
 def _build_entry_url(entry: str) -> str:
     raw_base = config.MINI_APP_BASE_URL.strip()
     if not raw_base:
@@ -5,12 +5,12 @@ from fastapi import Depends, HTTPException, Request
 from app.application.services.user_service import UserService
 from app.core.config import config
 from app.domain.user.entities import User
-from app.infrastructure.db import UserUnitOfWork, async_session_factory
+from app.infrastructure.db import UserUnitOfWork, miniapp_session_factory
 from app.telegram.miniapp.auth import MiniAppUserContext, validate_init_data
 
 
 def get_user_service() -> UserService:
-    return UserService(UserUnitOfWork(async_session_factory))
+    return UserService(UserUnitOfWork(miniapp_session_factory))
 
 
 def parse_user_context(init_data: str) -> MiniAppUserContext:
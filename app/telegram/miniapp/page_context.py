@@ -3,7 +3,9 @@ from dataclasses import dataclass
 from fastapi import Request
 
 from app.application.dto.miniapp import ChoiceOptionDto, WorkFormatChoice
+from app.core.config import config
 from app.domain.shared.value_objects import SkillType, SpecializationType, WorkFormat
+from app.domain.user.value_objects import DeliveryMode
 
 
 @dataclass(frozen=True, slots=True)
@@ -232,6 +234,11 @@ _WORK_FORMAT_LABELS = {
     WorkFormat.ONSITE.value: "Офис",
 }
 
+_DELIVERY_MODE_LABELS = {
+    DeliveryMode.INSTANT: "Сразу",
+    DeliveryMode.DIGEST: "Подборкой",
+}
+
 
 def build_specialization_options() -> list[str]:
     return [item.value for item in SpecializationType]
@@ -266,6 +273,13 @@ def build_work_format_options() -> list[ChoiceOptionDto]:
     return options
 
 
+def build_delivery_mode_options() -> list[ChoiceOptionDto]:
+    return [
+        ChoiceOptionDto(value=item.value, label=_DELIVERY_MODE_LABELS[item])
+        for item in DeliveryMode
+    ]
+
+
 def _path_for(request: Request, name: str, **path_params: object) -> str:
     return str(request.app.url_path_for(name, **path_params))
 
@@ -309,3 +323,19 @@ def build_salary_page_context(request: Request) -> dict[str, object]:
         "save_url": _path_for(request, "miniapp-save-salary"),
         "success_text": "Зарплата сохранена.",
     }
+
+
+def build_delivery_page_context(request: Request) -> dict[str, object]:
+    return {
+        "page_title": "Настройка доставки",
+        "page_description": (
+            "Вакансии можно получать сразу или подборкой: одним сообщением "
+            f"со ссылками раз в {config.DIGEST_INTERVAL_MINUTES} мин."
+        ),
+        "active_page": "delivery",
+        "current_value": "",
+        "options": build_delivery_mode_options(),
+        "action_label": "Сохранить",
+        "save_url": _path_for(request, "miniapp-save-delivery"),
+        "success_text": "Режим доставки сохранен.",
+    }
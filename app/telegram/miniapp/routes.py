@@ -4,6 +4,8 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 
 from app.application.dto.miniapp import (
+    DeliveryReadResponse,
+    DeliverySaveRequest,
     FormatReadResponse,
     FormatSaveRequest,
     SalaryModeChoice,
@@ -24,6 +26,7 @@ from app.telegram.miniapp.deps import (
     parse_user_context,
 )
 from app.telegram.miniapp.page_context import (
+    build_delivery_page_context,
     build_format_page_context,
     build_salary_page_context,
     build_specialty_page_context,
@@ -65,6 +68,15 @@ async def salary_page(request: Request) -> HTMLResponse:
     )
 
 
+@router.get("/miniapp/delivery", response_class=HTMLResponse, name="miniapp-delivery")
+async def delivery_page(request: Request) -> HTMLResponse:
+    return templates.TemplateResponse(
+        request,
+        "pages/delivery.html",
+        build_delivery_page_context(request),
+    )
+
+
 @router.get(
     "/miniapp/api/specialty",
     name="miniapp-read-specialty",
@@ -190,6 +202,38 @@ async def save_salary(
     return SaveResponse(message="Зарплата сохранена.")
 
 
+@router.get(
+    "/miniapp/api/delivery",
+    name="miniapp-read-delivery",
+    response_model=DeliveryReadResponse,
+)
+async def read_delivery(
+    user: Annotated[User, Depends(get_current_user)],
+) -> DeliveryReadResponse:
+    return DeliveryReadResponse(delivery_mode=user.delivery_mode.value)
+
+
+@router.post(
+    "/miniapp/api/delivery",
+    name="miniapp-save-delivery",
+    response_model=SaveResponse,
+)
+async def save_delivery(
+    payload: DeliverySaveRequest,
+    service: Annotated[UserService, Depends(get_user_service)],
+) -> SaveResponse:
+    user_context = parse_user_context(payload.init_data)
+
+    updated = await service.update_delivery_mode(
+        tg_id=user_context.tg_id,
+        delivery_mode=payload.delivery_mode,
+    )
+    if not updated:
+        raise HTTPException(status_code=404, detail="Пользователь не найден.")
+
+    return SaveResponse(message="Режим доставки сохранен.")
+
+
 def _work_format_choice(user: User) -> str:
     if (
         user.filter_work_format_mode != FilterMode.STRICT
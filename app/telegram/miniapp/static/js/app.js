@@ -116,6 +116,11 @@
             : String(payload.salary_amount_rub);
       }
       toggleSalaryAmountField();
+      return;
+    }
+
+    if (pageKind === "delivery") {
+      applyCheckedValue("delivery_mode", payload.delivery_mode || "INSTANT");
     }
   }
 
@@ -143,6 +148,12 @@
       };
     }
 
+    if (pageKind === "delivery") {
+      return {
+        delivery_mode: getCheckedValue("delivery_mode") || "INSTANT",
+      };
+    }
+
     return {};
   }
 
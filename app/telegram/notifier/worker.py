@@ -0,0 +1,102 @@
+import asyncio
+from contextlib import suppress
+from time import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.ports.notification_port import IDeliverySender
+from app.application.ports.observability_port import IObservabilityService
+from app.application.services.delivery_outbox_service import DeliveryOutboxService
+from app.core.config import config
+from app.core.logger import get_app_logger
+from app.infrastructure.db import DeliveryUnitOfWork
+
+logger = get_app_logger(__name__)
+
+
+class DeliveryWorker:
+    """Drain the persistent delivery queue filled by matching.
+
+    Workers in one or several processes can run side by side: rows are leased
+    with SKIP LOCKED, and a lease that runs out (e.g. after a crash) makes its
+    rows due again. A full batch is followed by the next one right away;
+    otherwise the worker polls every `DELIVERY_POLL_SECONDS`.
+
+    Deliveries for users in digest mode stay queued until the next
+    `DIGEST_INTERVAL_MINUTES` boundary of the wall clock, so restarts do not
+    shift or repeat the schedule.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        sender: IDeliverySender,
+        observability: IObservabilityService,
+    ) -> None:
+        self._session_factory = session_factory
+        self._sender = sender
+        self._observability = observability
+        self._stopping = asyncio.Event()
+        self._digest_slot = self._current_digest_slot()
+
+    def _outbox(self) -> DeliveryOutboxService:
+        return DeliveryOutboxService(
+            DeliveryUnitOfWork(self._session_factory),
+            lease_seconds=config.DELIVERY_LEASE_SECONDS,
+            max_attempts=config.DELIVERY_MAX_ATTEMPTS,
+        )
+
+    async def start(self) -> None:
+        logger.info("Delivery worker started.")
+        while not self._stopping.is_set():
+            try:
+                handled = await self.run_once()
+                digest_slot = self._current_digest_slot()
+                if digest_slot != self._digest_slot:
+                    await self.run_digests()
+                    # Only now: a failed pass is retried on the next iteration.
+                    self._digest_slot = digest_slot
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Delivery worker iteration failed")
+                handled = 0
+            if handled < config.DELIVERY_BATCH_SIZE:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._stopping.wait(), config.DELIVERY_POLL_SECONDS)
+        logger.info("Delivery worker stopped.")
+
+    def stop(self) -> None:
+        """Finish the batch in flight, then return from `start`."""
+        self._stopping.set()
+
+    async def run_once(self) -> int:
+        outbox = self._outbox()
+        deliveries = await outbox.lease_due(config.DELIVERY_BATCH_SIZE)
+        self._observability.observe_delivery_queue_depth(await outbox.count_open())
+        if not deliveries:
+            return 0
+        report = await self._sender.send(deliveries)
+        await outbox.record(deliveries, report)
+        return len(deliveries)
+
+    async def run_digests(self) -> int:
+        """Send every due digest, batch by batch; returns how many deliveries were handled."""
+        handled = 0
+        while not self._stopping.is_set():
+            outbox = self._outbox()
+            deliveries = await outbox.lease_digests(config.DIGEST_BATCH_SIZE)
+            if not deliveries:
+                break
+            report = await self._sender.send_digests(deliveries)
+            await outbox.record(deliveries, report)
+            handled += len(deliveries)
+            if len(deliveries) < config.DIGEST_BATCH_SIZE:
+                break
+        if handled:
+            logger.info("Digest pass finished: deliveries=%s", handled)
+        return handled
+
+    @staticmethod
+    def _current_digest_slot() -> int:
+        return int(time() // (max(config.DIGEST_INTERVAL_MINUTES, 1) * 60))
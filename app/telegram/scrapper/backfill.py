@@ -0,0 +1,173 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import logfire
+from telethon import TelegramClient, utils
+from telethon.errors import FloodWaitError
+from telethon.tl.custom.message import Message
+
+from app.core.logger import get_app_logger
+
+logger = get_app_logger(__name__)
+scraper_logfire = logfire.with_tags("scraper")
+
+CursorReader = Callable[[int], Awaitable[int | None]]
+MessageSink = Callable[[int, int, str], Awaitable[None]]
+BatchPrefetch = Callable[[list[str]], Awaitable[None]]
+
+
+@dataclass(frozen=True, slots=True)
+class BackfillPlan:
+    channel: str | int
+    entity: Any
+    chat_id: int
+    cursor: int | None
+
+
+class ChannelBackfiller:
+    """Catch up on channel history posted while the scraper was offline.
+
+    Each channel is walked from its persisted high-water mark in ascending
+    message order. The sink advances the mark as messages are recorded, so an
+    interrupted run resumes where it stopped. Until a channel has been walked up
+    to its newest message, live messages must not move its mark (see
+    `is_caught_up`), or a restart would resume past the rest of the gap.
+    """
+
+    def __init__(
+        self,
+        client: TelegramClient,
+        read_cursor: CursorReader,
+        sink: MessageSink,
+        queue_load: Callable[[], float],
+        *,
+        batch_size: int,
+        batch_delay_seconds: float,
+        max_messages_per_channel: int,
+        max_queue_load: float = 0.5,
+        prefetch: BatchPrefetch | None = None,
+    ) -> None:
+        self._client = client
+        self._read_cursor = read_cursor
+        self._sink = sink
+        self._queue_load = queue_load
+        self._batch_size = max(batch_size, 1)
+        self._batch_delay_seconds = batch_delay_seconds
+        self._max_messages_per_channel = max_messages_per_channel
+        self._max_queue_load = max_queue_load
+        self._prefetch = prefetch
+        self._pending: set[int] = set()
+
+    def is_caught_up(self, chat_id: int) -> bool:
+        """Whether live messages of the channel may advance its high-water mark."""
+        return chat_id not in self._pending
+
+    async def prepare(self, channels: list[str | int]) -> list[BackfillPlan]:
+        """Resolve channels, snapshot their high-water marks and mark them pending.
+
+        Must run before live ingest is subscribed, otherwise fresh live messages
+        would move the marks past the gap that needs to be backfilled.
+        """
+        plans: list[BackfillPlan] = []
+        for channel in channels:
+            try:
+                entity = await self._client.get_input_entity(channel)
+                chat_id = utils.get_peer_id(entity)
+                cursor = await self._read_cursor(chat_id)
+            except Exception:
+                logger.exception("Backfill skipped: failed to resolve channel %s", channel)
+                continue
+            plans.append(
+                BackfillPlan(channel=channel, entity=entity, chat_id=chat_id, cursor=cursor)
+            )
+            self._pending.add(chat_id)
+        return plans
+
+    async def run(self, plans: list[BackfillPlan]) -> None:
+        with scraper_logfire.span("scraper.backfill", channels=len(plans)):
+            for plan in plans:
+                try:
+                    await self._backfill_channel(plan)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("Backfill failed for channel %s", plan.channel)
+        logger.info("Backfill finished for %s channels", len(plans))
+
+    async def _backfill_channel(self, plan: BackfillPlan) -> None:
+        cursor = plan.cursor
+        total = 0
+
+        while total < self._max_messages_per_channel:
+            limit = min(self._batch_size, self._max_messages_per_channel - total)
+            try:
+                batch = await self._fetch_batch(plan.entity, cursor, limit)
+            except FloodWaitError as exc:
+                logger.warning(
+                    "Backfill flood wait for channel %s: sleeping %ss",
+                    plan.channel,
+                    exc.seconds,
+                )
+                await asyncio.sleep(exc.seconds)
+                continue
+
+            if not batch:
+                self._pending.discard(plan.chat_id)
+                break
+
+            await self._wait_for_queue_capacity()
+            if self._prefetch is not None:
+                await self._prefetch([message.text for message in batch if message.text])
+            for message in batch:
+                text = message.text or ""
+                if text:
+                    await self._sink(plan.chat_id, message.id, text)
+            cursor = batch[-1].id
+            total += len(batch)
+            scraper_logfire.info(
+                "Backfill batch submitted",
+                chat_id=plan.chat_id,
+                batch_size=len(batch),
+                total=total,
+                last_message_id=cursor,
+            )
+            if len(batch) < limit:
+                self._pending.discard(plan.chat_id)
+                break
+            await asyncio.sleep(self._batch_delay_seconds)
+
+        logger.info(
+            "Backfill for channel %s (%s) submitted %s messages",
+            plan.channel,
+            plan.chat_id,
+            total,
+        )
+
+    async def _fetch_batch(
+        self,
+        entity: Any,
+        cursor: int | None,
+        limit: int,
+    ) -> list[Message]:
+        if cursor is None:
+            # No high-water mark yet: take only the most recent messages.
+            newest_first = [
+                message async for message in self._client.iter_messages(entity, limit=limit)
+            ]
+            return list(reversed(newest_first))
+
+        return [
+            message
+            async for message in self._client.iter_messages(
+                entity,
+                min_id=cursor,
+                reverse=True,
+                limit=limit,
+            )
+        ]
+
+    async def _wait_for_queue_capacity(self) -> None:
+        while self._queue_load() > self._max_queue_load:
+            await asyncio.sleep(self._batch_delay_seconds)
@@ -1,137 +1,538 @@
+import asyncio
+from datetime import timedelta
+from time import monotonic
+
 import logfire
-from aiogram import Bot
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from telethon import TelegramClient, events
 from telethon.tl.custom.message import Message
 
 from app.application.dto import InfoRawVacancy
-from app.application.ports.llm_port import IVacancyLLMExtractor
+from app.application.ports.llm_port import IVacancyBatchPrefetcher, IVacancyLLMExtractor
 from app.application.ports.observability_port import IObservabilityService
+from app.application.services.delivery_outbox_service import DeliveryOutboxService
+from app.application.services.ingest_outbox_service import IngestOutboxService
 from app.application.services.matcher_service import MatcherService
+from app.application.services.reverse_matcher_service import (
+    ReverseMatcherService,
+    get_profile_change_queue,
+)
+from app.application.services.user_profile_index import get_user_profile_index
 from app.application.services.vacancy_service import VacancyService
 from app.core.config import config
 from app.core.logger import get_app_logger
+from app.domain.ingest.entities import IngestJob
+from app.domain.shared.domain_errors import DomainError
 from app.domain.vacancy.entities import Vacancy
 from app.domain.vacancy.value_objects import ContentHash
-from app.infrastructure.db import MatchingUnitOfWork, VacancyUnitOfWork
-from app.infrastructure.llm_runtime import TemporaryLLMUnavailableError
-from app.infrastructure.notifications import TelegramNotificationService
+from app.infrastructure.db import (
+    DeliveryUnitOfWork,
+    IngestUnitOfWork,
+    MatchingUnitOfWork,
+    VacancyUnitOfWork,
+)
+from app.infrastructure.dedup import ContentHashIndex, DedupVerdict, SimHashIndex
+from app.infrastructure.llm_runtime import LLMCircuitOpenError, TemporaryLLMUnavailableError
+from app.telegram.scrapper.backfill import BackfillPlan, ChannelBackfiller
 from app.telegram.scrapper.channels import normalized_channels
+from app.telegram.scrapper.ingest_queue import IngestQueue
 
 logger = get_app_logger(__name__)
 scraper_logfire = logfire.with_tags("scraper")
 
+_OUTBOX_PURGE_INTERVAL_SECONDS = 3600
+_IN_FLIGHT_RETRY_SECONDS = 30.0
+
+
+class MirrorForwardError(Exception):
+    pass
+
 
 class TelegramScraper:
     def __init__(
         self,
         client: TelegramClient,
-        bot: Bot,
         session_factory: async_sessionmaker[AsyncSession],
         extractor: IVacancyLLMExtractor,
         observability: IObservabilityService,
+        matching_session_factory: async_sessionmaker[AsyncSession] | None = None,
     ) -> None:
         self.client = client
+        # Ingest and matching use separate pools, so a matching fan-out cannot
+        # hold up the ingest workers (and the other way round).
         self._session_factory = session_factory
+        self._matching_session_factory = matching_session_factory or session_factory
         self._extractor = extractor
         self._observability = observability
-        self._notification_service = TelegramNotificationService(bot)
+        self._ingest_queue: IngestQueue[IngestJob] = IngestQueue(
+            self._process_job,
+            observability,
+            workers=config.INGEST_WORKERS,
+            maxsize=config.INGEST_QUEUE_MAXSIZE,
+        )
+        self._content_hashes = ContentHashIndex(
+            capacity=config.DEDUP_BLOOM_CAPACITY,
+            error_rate=config.DEDUP_BLOOM_ERROR_RATE,
+            recent_size=config.DEDUP_RECENT_HASHES,
+        )
+        self._simhashes: SimHashIndex | None = (
+            SimHashIndex(config.SIMHASH_MAX_DISTANCE) if config.SIMHASH_MAX_DISTANCE > 0 else None
+        )
+        self._replay_task: asyncio.Task[None] | None = None
+        self._backfill_task: asyncio.Task[None] | None = None
+        self._backfiller: ChannelBackfiller | None = None
+        self._user_index_task: asyncio.Task[None] | None = None
+        self._reverse_match_task: asyncio.Task[None] | None = None
+
+    def _outbox(self) -> IngestOutboxService:
+        return IngestOutboxService(
+            IngestUnitOfWork(self._session_factory),
+            lease_seconds=config.INGEST_JOB_LEASE_SECONDS,
+            max_attempts=config.INGEST_JOB_MAX_ATTEMPTS,
+        )
+
+    def _delivery_outbox(self) -> DeliveryOutboxService:
+        return DeliveryOutboxService(
+            DeliveryUnitOfWork(self._matching_session_factory),
+            lease_seconds=config.DELIVERY_LEASE_SECONDS,
+            max_attempts=config.DELIVERY_MAX_ATTEMPTS,
+        )
 
     async def _message_handler(self, event: events.NewMessage.Event) -> None:
         message = event.message
+        text = message.text or ""
+        scraper_logfire.info(
+            "Message received",
+            chat_id=event.chat_id,
+            message_id=message.id,
+        )
+        if not text:
+            scraper_logfire.info(
+                "Message skipped: empty text",
+                chat_id=event.chat_id,
+                message_id=message.id,
+            )
+            return
+
+        # A live message must not move the mark past a gap backfill has yet to walk.
+        backfiller = self._backfiller
+        advance_cursor = backfiller is None or backfiller.is_caught_up(event.chat_id)
+        try:
+            await self._enqueue_message(
+                event.chat_id,
+                message.id,
+                text,
+                advance_cursor=advance_cursor,
+            )
+        except Exception:
+            logger.exception(
+                "Failed to record message in ingest outbox (chat_id=%s, message_id=%s, "
+                "source_channel=%s, source_message_preview=%r)",
+                event.chat_id,
+                message.id,
+                self._source_channel_name(event),
+                self._message_preview(text),
+            )
+
+    async def _enqueue_message(
+        self,
+        chat_id: int,
+        message_id: int,
+        text: str,
+        *,
+        advance_cursor: bool = True,
+    ) -> None:
+        job = await self._outbox().record_message(
+            chat_id=chat_id,
+            message_id=message_id,
+            text=text,
+            advance_cursor=advance_cursor,
+        )
+        if job is None:
+            scraper_logfire.info(
+                "Message skipped: already recorded",
+                chat_id=chat_id,
+                message_id=message_id,
+            )
+            return
+
+        await self._ingest_queue.submit(job)
+
+    async def _process_job(self, job: IngestJob) -> None:
         content_hash: str | None = None
+        reserved_hash: str | None = None
+        simhash: int | None = None
         vacancy_id: str | None = None
+        outbox = self._outbox()
 
         try:
             with scraper_logfire.span(
                 "scraper.handle_message",
-                chat_id=event.chat_id,
-                message_id=message.id,
+                chat_id=job.chat_id,
+                message_id=job.message_id,
+                job_id=job.id,
+                attempt=job.attempts + 1,
             ):
-                scraper_logfire.info(
-                    "Message received",
-                    chat_id=event.chat_id,
-                    message_id=message.id,
+                message_info = InfoRawVacancy(
+                    text=job.text,
+                    chat_id=job.chat_id,
+                    message_id=job.message_id,
                 )
-                message_info = await self._send_to_mirror(event)
-                if not message_info:
-                    return
 
                 content_hash = Vacancy.compute_content_hash(message_info.text).value
-                check_uow = VacancyUnitOfWork(self._session_factory)
-                async with check_uow:
-                    exists = await check_uow.vacancies.exists_by_content_hash(
-                        ContentHash(content_hash)
+                if not self._content_hashes.reserve(content_hash):
+                    # Another worker holds the same text; by the retry it is stored or gone.
+                    scraper_logfire.info(
+                        "Message deferred: same text in flight",
+                        chat_id=job.chat_id,
+                        message_id=job.message_id,
+                        content_hash=content_hash,
+                    )
+                    await self._defer_job(
+                        outbox, job, "same text in flight", _IN_FLIGHT_RETRY_SECONDS
+                    )
+                    return
+                reserved_hash = content_hash
+
+                duplicate_source = await self._find_duplicate_source(content_hash)
+                if duplicate_source is not None:
+                    scraper_logfire.info(
+                        "Duplicate vacancy skipped",
+                        chat_id=job.chat_id,
+                        message_id=job.message_id,
+                        content_hash=content_hash,
+                        source=duplicate_source,
                     )
-                if exists:
+                    await outbox.complete(job)
+                    return
+
+                simhash = Vacancy.compute_simhash(message_info.text).value
+                near_duplicate = self._find_near_duplicate(simhash)
+                if near_duplicate is not None:
                     scraper_logfire.info(
                         "Duplicate vacancy skipped",
-                        chat_id=event.chat_id,
-                        message_id=message.id,
+                        chat_id=job.chat_id,
+                        message_id=job.message_id,
                         content_hash=content_hash,
-                        source="prefilter",
+                        source="near_duplicate",
+                        distance=near_duplicate,
                     )
+                    await outbox.complete(job)
                     return
 
                 uow = VacancyUnitOfWork(self._session_factory)
                 v_service = VacancyService(uow, self._extractor, self._observability)
                 parse_result = await v_service.parse_message(message_info)
                 if not parse_result:
+                    await outbox.complete(job)
                     return
 
+                # Only accepted, non-duplicate vacancies reach the mirror channel.
+                reused_mirror = job.mirror_message_id is not None
+                message_info = await self._send_to_mirror(outbox, job)
                 saved_vacancy_id = await v_service.save_vacancy(message_info, parse_result)
+                if saved_vacancy_id is None:
+                    scraper_logfire.info(
+                        "Duplicate vacancy skipped",
+                        chat_id=job.chat_id,
+                        message_id=job.message_id,
+                        content_hash=content_hash,
+                        source="save",
+                    )
+                    self._content_hashes.remember(content_hash)
+                    # A reused post may already back the vacancy an earlier attempt stored.
+                    if not reused_mirror:
+                        await self._retract_mirror(job)
+                    await outbox.complete(job)
+                    return
                 vacancy_id = str(saved_vacancy_id.value)
+                self._content_hashes.add(content_hash)
+                if self._simhashes is not None:
+                    self._simhashes.add(simhash)
                 scraper_logfire.info(
                     "Vacancy saved",
-                    chat_id=event.chat_id,
-                    message_id=message.id,
+                    chat_id=job.chat_id,
+                    message_id=job.message_id,
                     content_hash=content_hash,
                     vacancy_id=vacancy_id,
                 )
+                await outbox.complete(job)
 
                 matcher = MatcherService(
-                    MatchingUnitOfWork(self._session_factory),
-                    self._notification_service,
+                    MatchingUnitOfWork(self._matching_session_factory),
+                    self._delivery_outbox(),
                     self._observability,
                 )
                 await matcher.match_vacancy(saved_vacancy_id)
-        except IntegrityError:
+        except LLMCircuitOpenError as exc:
             scraper_logfire.info(
-                "Duplicate vacancy skipped",
-                chat_id=event.chat_id,
-                message_id=message.id,
-                content_hash=content_hash,
-                source="save",
+                "Message deferred: llm circuit open",
+                chat_id=job.chat_id,
+                message_id=job.message_id,
+                job_id=job.id,
+                retry_in=exc.retry_in,
             )
+            await self._defer_job(outbox, job, "llm circuit open", exc.retry_in)
         except TemporaryLLMUnavailableError:
             scraper_logfire.warning(
-                "Message skipped: llm temporarily unavailable",
-                chat_id=event.chat_id,
-                message_id=message.id,
+                "Message deferred: llm temporarily unavailable",
+                chat_id=job.chat_id,
+                message_id=job.message_id,
+                job_id=job.id,
                 content_hash=content_hash,
-                vacancy_id=vacancy_id,
             )
-        except Exception:
+            await self._fail_job(outbox, job, "llm temporarily unavailable")
+        except MirrorForwardError:
+            await self._fail_job(outbox, job, "mirror forward failed")
+        except DomainError as exc:
+            scraper_logfire.info(
+                "Message rejected by domain validation",
+                chat_id=job.chat_id,
+                message_id=job.message_id,
+                job_id=job.id,
+                error=exc.message,
+            )
+            await self._retract_mirror(job)
+            await self._fail_job(outbox, job, exc.message, permanent=True)
+        except Exception as exc:
             logger.exception(
-                "Scraper message handling failed (chat_id=%s, message_id=%s, content_hash=%s, "
-                "vacancy_id=%s)",
-                event.chat_id,
-                message.id,
+                "Scraper message handling failed (chat_id=%s, message_id=%s, job_id=%s, "
+                "content_hash=%s, vacancy_id=%s)",
+                job.chat_id,
+                job.message_id,
+                job.id,
                 content_hash,
                 vacancy_id,
             )
+            if vacancy_id is None:
+                await self._fail_job(outbox, job, repr(exc))
+        finally:
+            if reserved_hash is not None:
+                self._content_hashes.release(reserved_hash)
+
+    async def _find_duplicate_source(self, content_hash: str) -> str | None:
+        verdict = self._content_hashes.check(content_hash)
+        self._observability.observe_dedup_check(verdict.value)
+        if verdict == DedupVerdict.SEEN:
+            return "recent"
+        if verdict == DedupVerdict.NEW:
+            return None
+
+        check_uow = VacancyUnitOfWork(self._session_factory)
+        async with check_uow:
+            exists = await check_uow.vacancies.exists_by_content_hash(ContentHash(content_hash))
+        if not exists:
+            return None
+        self._content_hashes.remember(content_hash)
+        return "prefilter"
+
+    def _find_near_duplicate(self, simhash: int) -> int | None:
+        """Return the bit distance to a near-identical stored vacancy, if any."""
+        if self._simhashes is None:
+            return None
+        match = self._simhashes.find_near(simhash)
+        self._observability.observe_dedup_check("near_duplicate" if match else "distinct")
+        return match[1] if match is not None else None
+
+    async def _prefetch_extractions(self, texts: list[str]) -> None:
+        """Prime batched LLM extraction for texts that are not known duplicates."""
+        if not isinstance(self._extractor, IVacancyBatchPrefetcher):
+            return
+        fresh = [text for text in texts if text.strip() and self._is_unseen(text)]
+        if len(fresh) < 2:
+            return
+        await self._extractor.prefetch(fresh)
+
+    def _is_unseen(self, text: str) -> bool:
+        content_hash = Vacancy.compute_content_hash(text).value
+        if self._content_hashes.check(content_hash) != DedupVerdict.NEW:
+            return False
+        if self._simhashes is None:
+            return True
+        return self._simhashes.find_near(Vacancy.compute_simhash(text).value) is None
+
+    async def _warm_up_dedup(self) -> None:
+        try:
+            uow = VacancyUnitOfWork(self._session_factory)
+            async with uow:
+                count = await uow.vacancies.count()
+                await self._content_hashes.warm_up(
+                    uow.vacancies.iter_content_hashes(),
+                    expected_count=count,
+                )
+        except Exception:
+            logger.exception("Failed to warm content hash index; using database checks only")
+
+        if self._simhashes is None:
+            return
+        try:
+            uow = VacancyUnitOfWork(self._session_factory)
+            async with uow:
+                await self._simhashes.warm_up(uow.vacancies.iter_simhashes())
+        except Exception:
+            logger.exception("Failed to warm SimHash index; near-duplicate checks start empty")
+
+    async def _refresh_user_index(self) -> None:
+        index = get_user_profile_index()
+        while True:
+            try:
+                uow = MatchingUnitOfWork(self._matching_session_factory)
+                async with uow:
+                    await index.load(uow.users.iter_match_profiles())
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("User profile index refresh failed")
+            await asyncio.sleep(config.USER_INDEX_REFRESH_SECONDS)
+
+    async def _reverse_match_loop(self) -> None:
+        changes = get_profile_change_queue()
+        while True:
+            await asyncio.sleep(config.REVERSE_MATCH_POLL_SECONDS)
+            for change in changes.pop_settled(config.REVERSE_MATCH_QUIET_SECONDS):
+                matcher = ReverseMatcherService(
+                    MatchingUnitOfWork(self._matching_session_factory),
+                    self._delivery_outbox(),
+                    window=timedelta(hours=config.REVERSE_MATCH_WINDOW_HOURS),
+                    max_vacancies=config.REVERSE_MATCH_MAX_VACANCIES,
+                )
+                try:
+                    await matcher.match_profile(change)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("Reverse matching failed for user %s", change.current.tg_id)
+
+    async def _fail_job(
+        self,
+        outbox: IngestOutboxService,
+        job: IngestJob,
+        error: str,
+        *,
+        permanent: bool = False,
+    ) -> None:
+        try:
+            await outbox.fail(job, error, permanent=permanent)
+        except Exception:
+            logger.exception("Failed to reschedule ingest job %s", job.id)
+
+    async def _defer_job(
+        self,
+        outbox: IngestOutboxService,
+        job: IngestJob,
+        reason: str,
+        delay_seconds: float,
+    ) -> None:
+        try:
+            await outbox.defer(job, reason, max(delay_seconds, 1.0))
+        except Exception:
+            logger.exception("Failed to defer ingest job %s", job.id)
+
+    async def _replay_outbox(self) -> None:
+        last_purge = monotonic()
+        while True:
+            try:
+                free_slots = self._ingest_queue.maxsize - self._ingest_queue.depth
+                limit = min(config.INGEST_REPLAY_BATCH_SIZE, free_slots)
+                if limit > 0:
+                    jobs = await self._outbox().lease_due(limit=limit)
+                    if jobs:
+                        logger.info("Replaying %s ingest jobs from outbox", len(jobs))
+                        await self._prefetch_extractions([job.text for job in jobs])
+                    for job in jobs:
+                        await self._ingest_queue.submit(job)
+
+                if monotonic() - last_purge >= _OUTBOX_PURGE_INTERVAL_SECONDS:
+                    last_purge = monotonic()
+                    purged = await self._outbox().purge_done(
+                        timedelta(hours=config.INGEST_JOB_RETENTION_HOURS)
+                    )
+                    logger.info("Purged %s finished ingest jobs", purged)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Ingest outbox replay failed")
+            await asyncio.sleep(config.INGEST_REPLAY_INTERVAL_SECONDS)
+
+    def _build_backfiller(self) -> ChannelBackfiller:
+        return ChannelBackfiller(
+            self.client,
+            read_cursor=self._outbox().get_channel_cursor,
+            sink=self._enqueue_message,
+            queue_load=self._queue_load,
+            batch_size=config.BACKFILL_BATCH_SIZE,
+            batch_delay_seconds=config.BACKFILL_BATCH_DELAY_SECONDS,
+            max_messages_per_channel=config.BACKFILL_MAX_MESSAGES_PER_CHANNEL,
+            prefetch=self._prefetch_extractions,
+        )
+
+    def _queue_load(self) -> float:
+        if self._ingest_queue.maxsize <= 0:
+            return 0.0
+        return self._ingest_queue.depth / self._ingest_queue.maxsize
 
     async def start(self) -> None:
         channels = normalized_channels(config.CHANNELS)
         logger.info("Scraper listens channels: %s", channels)
+        await self._warm_up_dedup()
+        self._user_index_task = asyncio.create_task(
+            self._refresh_user_index(),
+            name="user-index-refresh",
+        )
+        if config.REVERSE_MATCH_ENABLED:
+            self._reverse_match_task = asyncio.create_task(
+                self._reverse_match_loop(),
+                name="reverse-match",
+            )
+        self._ingest_queue.start()
+        self._replay_task = asyncio.create_task(self._replay_outbox(), name="ingest-outbox-replay")
+
+        backfill_plans: list[BackfillPlan] = []
+        backfiller = self._build_backfiller()
+        if config.BACKFILL_ON_STARTUP:
+            backfill_plans = await backfiller.prepare(channels)
+            self._backfiller = backfiller
+
         self.client.add_event_handler(
             self._message_handler,
             events.NewMessage(chats=channels),
         )
+        if backfill_plans:
+            self._backfill_task = asyncio.create_task(
+                backfiller.run(backfill_plans),
+                name="channel-backfill",
+            )
         logger.info("Scraper started.")
         await self.client.run_until_disconnected()
 
+    async def backfill(self) -> None:
+        """Run a one-off history backfill without subscribing to live messages."""
+        channels = normalized_channels(config.CHANNELS)
+        backfiller = self._build_backfiller()
+        await self._warm_up_dedup()
+        self._ingest_queue.start()
+        try:
+            await backfiller.run(await backfiller.prepare(channels))
+        finally:
+            await self._ingest_queue.drain(timeout=config.INGEST_DRAIN_TIMEOUT_SECONDS)
+
+    async def stop(self) -> None:
+        self.client.remove_event_handler(self._message_handler)
+        for task in (
+            self._backfill_task,
+            self._replay_task,
+            self._user_index_task,
+            self._reverse_match_task,
+        ):
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        self._backfill_task = None
+        self._replay_task = None
+        self._user_index_task = None
+        self._reverse_match_task = None
+        await self._ingest_queue.drain(timeout=config.INGEST_DRAIN_TIMEOUT_SECONDS)
+
     @staticmethod
     def _source_channel_name(event: events.NewMessage.Event) -> str:
         chat = event.chat
@@ -150,40 +551,49 @@ class TelegramScraper:
             return normalized
         return f"{normalized[:limit]}..."
 
-    async def _send_to_mirror(self, event: events.NewMessage.Event) -> InfoRawVacancy | None:
-        message: Message = event.message
-        text = message.text or ""
+    async def _send_to_mirror(self, outbox: IngestOutboxService, job: IngestJob) -> InfoRawVacancy:
+        """Forward the job's message once; a retried job reuses the post it already made."""
+        if job.mirror_chat_id is None or job.mirror_message_id is None:
+            try:
+                mirror_msg: Message = await self.client.forward_messages(
+                    config.MIRROR_CHANNEL,
+                    job.message_id,
+                    from_peer=job.chat_id,
+                )
+            except Exception as exc:
+                logger.exception(
+                    "Failed to forward message to mirror (source_chat_id=%s, "
+                    "source_message_id=%s, source_message_preview=%r)",
+                    job.chat_id,
+                    job.message_id,
+                    self._message_preview(job.text),
+                )
+                raise MirrorForwardError(str(exc)) from exc
 
-        if not text:
-            scraper_logfire.info(
-                "Message skipped: empty text",
-                chat_id=event.chat_id,
-                message_id=message.id,
-            )
-            return None
+            try:
+                await outbox.record_mirror(job, mirror_msg.chat_id, mirror_msg.id)
+            except Exception:
+                logger.exception("Failed to record mirror message of ingest job %s", job.id)
+                job.mirror_chat_id = mirror_msg.chat_id
+                job.mirror_message_id = mirror_msg.id
 
+        return InfoRawVacancy(
+            mirror_chat_id=job.mirror_chat_id,
+            mirror_message_id=job.mirror_message_id,
+            text=job.text,
+            chat_id=job.chat_id,
+            message_id=job.message_id,
+        )
+
+    async def _retract_mirror(self, job: IngestJob) -> None:
+        """Delete a mirror post that no stored vacancy will point to."""
+        if job.mirror_message_id is None:
+            return
         try:
-            mirror_msg: Message = await self.client.forward_messages(
-                config.MIRROR_CHANNEL,
-                message,
-            )
+            await self.client.delete_messages(config.MIRROR_CHANNEL, [job.mirror_message_id])
         except Exception:
-            source_channel = self._source_channel_name(event)
-            preview = self._message_preview(text)
             logger.exception(
-                "Failed to forward message to mirror (source_chat_id=%s, source_channel=%s, "
-                "source_message_id=%s, source_message_preview=%r)",
-                event.chat_id,
-                source_channel,
-                message.id,
-                preview,
+                "Failed to delete orphaned mirror message %s of ingest job %s",
+                job.mirror_message_id,
+                job.id,
             )
-            return None
-
-        return InfoRawVacancy(
-            mirror_chat_id=mirror_msg.chat_id,
-            mirror_message_id=mirror_msg.id,
-            text=text,
-            chat_id=event.chat_id,
-            message_id=message.id,
-        )
@@ -0,0 +1,121 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from time import perf_counter
+
+from app.application.ports.observability_port import IObservabilityService
+from app.core.logger import get_app_logger
+
+logger = get_app_logger(__name__)
+
+
+@dataclass(slots=True)
+class _QueuedItem[T]:
+    payload: T
+    enqueued_at: float
+
+
+class IngestQueue[T]:
+    """Bounded work queue between message receipt and the ingest pipeline.
+
+    `submit` blocks once `maxsize` items are waiting, which pushes backpressure
+    back to the Telethon update loop instead of growing memory without bound.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[T], Awaitable[None]],
+        observability: IObservabilityService,
+        *,
+        workers: int,
+        maxsize: int,
+        name: str = "ingest",
+    ) -> None:
+        if workers < 1:
+            raise ValueError("Ingest queue requires at least one worker")
+        self._handler = handler
+        self._observability = observability
+        self._workers_count = workers
+        self._name = name
+        self._queue: asyncio.Queue[_QueuedItem[T]] = asyncio.Queue(maxsize=max(maxsize, 0))
+        self._workers: list[asyncio.Task[None]] = []
+        self._accepting = False
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def maxsize(self) -> int:
+        return self._queue.maxsize
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._workers)
+
+    def start(self) -> None:
+        if self._workers:
+            return
+        self._accepting = True
+        self._workers = [
+            asyncio.create_task(self._worker_loop(), name=f"{self._name}-worker-{index}")
+            for index in range(self._workers_count)
+        ]
+        logger.info(
+            "Ingest queue %s started (workers=%s, maxsize=%s)",
+            self._name,
+            self._workers_count,
+            self._queue.maxsize,
+        )
+
+    async def submit(self, payload: T) -> bool:
+        if not self._accepting:
+            logger.warning("Ingest queue %s is not accepting new items", self._name)
+            return False
+        if self._queue.full():
+            logger.warning(
+                "Ingest queue %s is full (maxsize=%s); waiting for a free slot",
+                self._name,
+                self._queue.maxsize,
+            )
+        await self._queue.put(_QueuedItem(payload=payload, enqueued_at=perf_counter()))
+        self._observability.observe_ingest_queue_depth(self._queue.qsize())
+        return True
+
+    async def drain(self, timeout: float) -> None:
+        """Stop accepting work, let workers finish queued items, then stop them."""
+        self._accepting = False
+        if not self._workers:
+            return
+
+        pending = self._queue.qsize()
+        logger.info("Draining ingest queue %s (pending=%s)", self._name, pending)
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except TimeoutError:
+            logger.warning(
+                "Ingest queue %s drain timed out after %.1fs; dropping %s queued items",
+                self._name,
+                timeout,
+                self._queue.qsize(),
+            )
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._observability.observe_ingest_queue_depth(self._queue.qsize())
+
+    async def _worker_loop(self) -> None:
+        while True:
+            item = await self._queue.get()
+            try:
+                self._observability.observe_ingest_queue_depth(self._queue.qsize())
+                self._observability.observe_ingest_queue_wait(perf_counter() - item.enqueued_at)
+                await self._handler(item.payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Ingest queue %s handler failed", self._name)
+            finally:
+                self._queue.task_done()
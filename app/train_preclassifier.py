@@ -0,0 +1,89 @@
+"""Train the local vacancy pre-classifier.
+
+Labelled samples come from a JSONL file with `text` and `is_vacancy` keys and/or
+from our own history: texts still kept in `ingest_jobs` paired with the LLM
+verdicts stored in the extraction cache for the current prompt/model version.
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+
+from app.core.config import config
+from app.domain.vacancy.entities import Vacancy
+from app.infrastructure.db import (
+    ExtractionCacheUnitOfWork,
+    IngestUnitOfWork,
+    async_session_factory,
+)
+from app.infrastructure.extractors import GoogleVacancyLLMExtractor
+from app.infrastructure.preclassifier import HashedLogisticRegression
+
+_VERDICT_LOOKUP_CHUNK = 1000
+
+
+def _load_jsonl(path: Path) -> list[tuple[str, bool]]:
+    samples: list[tuple[str, bool]] = []
+    with path.open(encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            samples.append((str(row["text"]), bool(row["is_vacancy"])))
+    return samples
+
+
+async def _load_history() -> list[tuple[str, bool]]:
+    texts_by_hash: dict[str, str] = {}
+    ingest_uow = IngestUnitOfWork(async_session_factory)
+    async with ingest_uow:
+        async for text in ingest_uow.ingest_jobs.iter_texts():
+            texts_by_hash.setdefault(Vacancy.compute_content_hash(text).value, text)
+
+    version = GoogleVacancyLLMExtractor().cache_version
+    hashes = list(texts_by_hash)
+    samples: list[tuple[str, bool]] = []
+    cache_uow = ExtractionCacheUnitOfWork(async_session_factory)
+    async with cache_uow:
+        for start in range(0, len(hashes), _VERDICT_LOOKUP_CHUNK):
+            chunk = hashes[start : start + _VERDICT_LOOKUP_CHUNK]
+            verdicts = await cache_uow.extraction_cache.get_verdicts(chunk, version)
+            samples.extend((texts_by_hash[h], label) for h, label in verdicts.items())
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--input", type=Path, help="JSONL file with text/is_vacancy rows")
+    parser.add_argument(
+        "--from-db",
+        action="store_true",
+        help="Use ingest_jobs texts labelled by cached LLM verdicts",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path(config.PRECLASSIFIER_MODEL_PATH or "preclassifier.json"),
+    )
+    args = parser.parse_args()
+
+    samples: list[tuple[str, bool]] = []
+    if args.input:
+        samples.extend(_load_jsonl(args.input))
+    if args.from_db:
+        samples.extend(await _load_history())
+    if not samples:
+        parser.error("no labelled samples: pass --input and/or --from-db")
+
+    model = HashedLogisticRegression.train(samples)
+    model.save(args.output)
+    positives = sum(label for _, label in samples)
+    print(
+        f"Trained on {len(samples)} samples ({positives} vacancies, "
+        f"{len(samples) - positives} other); model saved to {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,41 @@
+import pytest
+from sqlalchemy.exc import DBAPIError, OperationalError
+
+from app.benchmark_prefilter import (
+    drop_bench_schema,
+    explain_prefilter,
+    plan_nodes,
+    seed_bench_users,
+)
+from app.domain.shared import Skills, Specializations
+from app.infrastructure.db import engine
+
+pytestmark = pytest.mark.integration
+
+_SEEDED_USERS = 20_000
+
+
+async def test_prefilter_query_reads_covering_index_instead_of_heap() -> None:
+    try:
+        raw_conn = await engine.connect()
+    except (OSError, OperationalError, DBAPIError) as exc:
+        pytest.skip(f"Postgres is not reachable: {exc}")
+
+    try:
+        conn = await raw_conn.execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            # Seqscan stays allowed: the narrow covering index has to beat a scan
+            # of the wide, freshly vacuumed users heap on cost alone.
+            await seed_bench_users(conn, _SEEDED_USERS)
+            plan = await explain_prefilter(
+                conn,
+                Specializations.from_strs(["Backend"]).to_mask(),
+                Skills.from_strs(["Python", "SQL"]).to_mask(),
+            )
+        finally:
+            await drop_bench_schema(conn)
+    finally:
+        await raw_conn.close()
+        await engine.dispose()
+
+    assert "Index Only Scan" in {node_type for node_type, _ in plan_nodes(plan)}
@@ -0,0 +1,151 @@
+from datetime import datetime
+from uuid import uuid4
+
+from app.application.services.delivery_outbox_service import (
+    DeliveryOutboxService,
+    retry_delay_seconds,
+)
+from app.application.services.user_profile_index import UserProfileIndex
+from app.domain.delivery import Delivery, DeliveryPriority, DeliveryReport
+from app.domain.matching import MatchProfile
+
+
+class _DeliveryRepositorySpy:
+    def __init__(self, due: list[Delivery] | None = None) -> None:
+        self.calls: list[tuple[str, list[int]]] = []
+        self._due = due or []
+
+    async def lease_due(self, limit: int, lease_seconds: float) -> list[Delivery]:
+        return self._due[:limit]
+
+    async def mark_sent(self, delivery_ids: list[int]) -> None:
+        self.calls.append(("sent", delivery_ids))
+
+    async def mark_forbidden(self, delivery_ids: list[int]) -> None:
+        self.calls.append(("forbidden", delivery_ids))
+
+    async def mark_retry(
+        self, delivery_ids: list[int], error: str, next_attempt_at: datetime
+    ) -> None:
+        self.calls.append(("retry", sorted(delivery_ids)))
+
+    async def mark_dead(self, delivery_ids: list[int], error: str) -> None:
+        self.calls.append(("dead", delivery_ids))
+
+    async def cancel_for_users(self, tg_ids: list[int]) -> int:
+        if tg_ids:
+            self.calls.append(("cancel", tg_ids))
+        return len(tg_ids)
+
+
+class _UserRepositorySpy:
+    def __init__(self, active: set[int]) -> None:
+        self.active = active
+
+    async def deactivate_many(self, tg_ids: list[int]) -> list[int]:
+        deactivated = [tg_id for tg_id in tg_ids if tg_id in self.active]
+        self.active -= set(deactivated)
+        return deactivated
+
+
+class _UnitOfWorkSpy:
+    def __init__(
+        self,
+        active_users: set[int] | None = None,
+        due: list[Delivery] | None = None,
+    ) -> None:
+        self.deliveries = _DeliveryRepositorySpy(due)
+        self.users = _UserRepositorySpy(active_users or set())
+
+    async def __aenter__(self) -> "_UnitOfWorkSpy":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+def _delivery(delivery_id: int, attempts: int) -> Delivery:
+    return Delivery(
+        id=delivery_id,
+        vacancy_id=uuid4(),
+        tg_id=delivery_id,
+        mirror_chat_id=1,
+        mirror_message_id=10,
+        priority=DeliveryPriority.FRESH,
+        attempts=attempts,
+    )
+
+
+def test_retry_delay_grows_and_caps() -> None:
+    assert retry_delay_seconds(1) == 30
+    assert retry_delay_seconds(2) == 120
+    assert retry_delay_seconds(50) == 1800
+
+
+async def test_record_retries_failures_until_max_attempts() -> None:
+    uow = _UnitOfWorkSpy()
+    service = DeliveryOutboxService(
+        uow,  # type: ignore[arg-type]
+        lease_seconds=60,
+        max_attempts=3,
+        profile_index=UserProfileIndex(),
+    )
+    deliveries = [_delivery(1, 0), _delivery(2, 0), _delivery(3, 1), _delivery(4, 2)]
+    report = DeliveryReport(
+        sent=[1],
+        failed={2: "TelegramNetworkError", 3: "TelegramNetworkError", 4: "TelegramNetworkError"},
+    )
+
+    await service.record(deliveries, report)
+
+    assert uow.deliveries.calls == [
+        ("sent", [1]),
+        ("forbidden", []),
+        ("retry", [2]),
+        ("retry", [3]),
+        ("dead", [4]),
+    ]
+
+
+async def test_record_deactivates_users_who_blocked_the_bot() -> None:
+    uow = _UnitOfWorkSpy(active_users={1, 2})
+    index = UserProfileIndex()
+    for tg_id in (1, 2):
+        index.upsert(
+            MatchProfile(
+                tg_id=tg_id,
+                specializations_mask=1,
+                skills_mask=1,
+                min_salary=None,
+                work_format=None,
+            )
+        )
+    service = DeliveryOutboxService(
+        uow,  # type: ignore[arg-type]
+        lease_seconds=60,
+        max_attempts=3,
+        profile_index=index,
+    )
+
+    await service.record(
+        [_delivery(1, 0), _delivery(2, 0)], DeliveryReport(sent=[1], forbidden=[2])
+    )
+
+    assert uow.users.active == {1}
+    assert ("cancel", [2]) in uow.deliveries.calls
+    assert [profile.tg_id for profile in index.candidates(1, 1)] == [1]
+
+
+async def test_lease_due_dead_letters_deliveries_whose_leases_kept_expiring() -> None:
+    uow = _UnitOfWorkSpy(due=[_delivery(1, 0), _delivery(2, 3)])
+    service = DeliveryOutboxService(
+        uow,  # type: ignore[arg-type]
+        lease_seconds=60,
+        max_attempts=3,
+        profile_index=UserProfileIndex(),
+    )
+
+    deliveries = await service.lease_due(limit=10)
+
+    assert [delivery.id for delivery in deliveries] == [1]
+    assert uow.deliveries.calls == [("dead", [2])]
@@ -0,0 +1,86 @@
+from datetime import UTC, datetime
+
+from app.application.services.ingest_outbox_service import (
+    IngestOutboxService,
+    retry_delay_seconds,
+)
+from app.domain.ingest.entities import IngestJob, IngestJobStatus
+
+
+class _IngestJobRepositorySpy:
+    def __init__(self, due: list[IngestJob] | None = None) -> None:
+        self.calls: list[tuple[str, int]] = []
+        self._due = due or []
+
+    async def lease_due(self, limit: int, lease_seconds: float) -> list[IngestJob]:
+        return self._due[:limit]
+
+    async def mark_retry(
+        self, job_id: int, leased_attempts: int, error: str, next_attempt_at: datetime
+    ) -> bool:
+        self.calls.append(("retry", job_id))
+        return True
+
+    async def mark_dead(self, job_id: int, leased_attempts: int, error: str) -> bool:
+        self.calls.append(("dead", job_id))
+        return True
+
+
+class _UnitOfWorkSpy:
+    def __init__(self, due: list[IngestJob] | None = None) -> None:
+        self.ingest_jobs = _IngestJobRepositorySpy(due)
+
+    async def __aenter__(self) -> "_UnitOfWorkSpy":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+def _build_job(attempts: int, job_id: int = 7) -> IngestJob:
+    now = datetime.now(UTC)
+    return IngestJob(
+        id=job_id,
+        chat_id=-100,
+        message_id=42,
+        text="Python developer wanted",
+        status=IngestJobStatus.PROCESSING,
+        attempts=attempts,
+        next_attempt_at=now,
+        created_at=now,
+    )
+
+
+def test_retry_delay_grows_and_caps() -> None:
+    assert retry_delay_seconds(1) == 30
+    assert retry_delay_seconds(2) == 120
+    assert retry_delay_seconds(50) == 3600
+
+
+async def test_fail_schedules_retry_until_max_attempts() -> None:
+    uow = _UnitOfWorkSpy()
+    service = IngestOutboxService(uow, lease_seconds=60, max_attempts=3)  # type: ignore[arg-type]
+
+    await service.fail(_build_job(attempts=0), "llm temporarily unavailable")
+    await service.fail(_build_job(attempts=2), "llm temporarily unavailable")
+
+    assert uow.ingest_jobs.calls == [("retry", 7), ("dead", 7)]
+
+
+async def test_fail_dead_letters_permanent_errors_immediately() -> None:
+    uow = _UnitOfWorkSpy()
+    service = IngestOutboxService(uow, lease_seconds=60, max_attempts=3)  # type: ignore[arg-type]
+
+    await service.fail(_build_job(attempts=0), "invalid vacancy", permanent=True)
+
+    assert uow.ingest_jobs.calls == [("dead", 7)]
+
+
+async def test_lease_due_dead_letters_jobs_whose_leases_kept_expiring() -> None:
+    uow = _UnitOfWorkSpy(due=[_build_job(attempts=1, job_id=1), _build_job(attempts=3, job_id=2)])
+    service = IngestOutboxService(uow, lease_seconds=60, max_attempts=3)  # type: ignore[arg-type]
+
+    jobs = await service.lease_due(limit=10)
+
+    assert [job.id for job in jobs] == [1]
+    assert uow.ingest_jobs.calls == [("dead", 2)]
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from uuid import uuid4
 
 from app.application.services.matcher_service import MatcherService
+from app.application.services.user_profile_index import UserProfileIndex
 from app.domain.shared import WorkFormat
 from app.domain.user.entities import User
 from app.domain.vacancy.entities import Vacancy
@@ -24,14 +25,37 @@ class _UnitOfWorkDummy:
     pass
 
 
-def test_observe_skill_matches_tracks_shared_skills() -> None:
-    observability = _ObservabilitySpy(seen=[])
-    service = MatcherService(
-        uow=_UnitOfWorkDummy(),  # type: ignore[arg-type]
-        notification_service=_NotificationDummy(),  # type: ignore[arg-type]
-        observability=observability,  # type: ignore[arg-type]
-    )
-    vacancy = Vacancy.create(
+class _VacancyRepositoryStub:
+    def __init__(self, vacancy: Vacancy) -> None:
+        self._vacancy = vacancy
+
+    async def get_by_id(self, vacancy_id: object) -> Vacancy:
+        return self._vacancy
+
+
+class _UserRepositoryStub:
+    def __init__(self) -> None:
+        self.prefilter_calls = 0
+
+    async def find_prefiltered_profiles(self, **_: object) -> list[object]:
+        self.prefilter_calls += 1
+        return []
+
+
+class _UnitOfWorkStub:
+    def __init__(self, vacancy: Vacancy) -> None:
+        self.vacancies = _VacancyRepositoryStub(vacancy)
+        self.users = _UserRepositoryStub()
+
+    async def __aenter__(self) -> "_UnitOfWorkStub":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+def _vacancy() -> Vacancy:
+    return Vacancy.create(
         vacancy_id=uuid4(),
         text="Frontend engineer with React and Vue",
         specializations_raw=["Frontend"],
@@ -40,6 +64,16 @@ def test_observe_skill_matches_tracks_shared_skills() -> None:
         mirror_message_id=1,
         work_format=WorkFormat.REMOTE,
     )
+
+
+def test_observe_skill_matches_tracks_shared_skills() -> None:
+    observability = _ObservabilitySpy(seen=[])
+    service = MatcherService(
+        uow=_UnitOfWorkDummy(),  # type: ignore[arg-type]
+        notification_service=_NotificationDummy(),  # type: ignore[arg-type]
+        observability=observability,  # type: ignore[arg-type]
+    )
+    vacancy = _vacancy()
     user = User.create(
         tg_id=1,
         cv_specializations_raw=["Frontend"],
@@ -49,3 +83,24 @@ def test_observe_skill_matches_tracks_shared_skills() -> None:
     service._observe_skill_matches(vacancy=vacancy, user=user)
 
     assert observability.seen == [("vue", 1)]
+
+
+async def test_match_vacancy_uses_injected_index_even_when_empty() -> None:
+    vacancy = _vacancy()
+    uow = _UnitOfWorkStub(vacancy)
+    index = UserProfileIndex()
+    await index.load(_no_profiles())
+    service = MatcherService(
+        uow=uow,  # type: ignore[arg-type]
+        notification_service=_NotificationDummy(),  # type: ignore[arg-type]
+        observability=_ObservabilitySpy(seen=[]),  # type: ignore[arg-type]
+        profile_index=index,
+    )
+
+    assert await service.match_vacancy(vacancy.id) == []
+    assert uow.users.prefilter_calls == 0
+
+
+async def _no_profiles():
+    return
+    yield
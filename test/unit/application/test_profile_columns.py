@@ -0,0 +1,100 @@
+import random
+from uuid import uuid4
+
+import pytest
+
+from app.application.services.profile_columns import ProfileColumns
+from app.domain.matching import MatchProfile, MatchRejectionReason, evaluate_profile_match
+from app.domain.shared import (
+    SKILL_BIT_ORDER,
+    SPECIALIZATION_BIT_ORDER,
+    Skills,
+    Specializations,
+    WorkFormat,
+)
+from app.domain.vacancy.entities import Vacancy
+
+
+def _random_profile(rng: random.Random, tg_id: int) -> MatchProfile:
+    return MatchProfile(
+        tg_id=tg_id,
+        specializations_mask=rng.getrandbits(len(SPECIALIZATION_BIT_ORDER)),
+        skills_mask=rng.getrandbits(len(SKILL_BIT_ORDER)),
+        min_salary=rng.choice([None, 100_000, 200_000, 300_000]),
+        work_format=rng.choice([None, WorkFormat.REMOTE, WorkFormat.HYBRID, WorkFormat.ONSITE]),
+    )
+
+
+def _vacancy(work_format: WorkFormat, salary_amount: int | None) -> Vacancy:
+    return Vacancy.create(
+        vacancy_id=uuid4(),
+        text="Backend engineer",
+        specializations_raw=["Backend", "Infrastructure & DevOps"],
+        skills_raw=["Python", "Go", "SQL"],
+        mirror_chat_id=1,
+        mirror_message_id=1,
+        work_format=work_format,
+        salary_amount=salary_amount,
+    )
+
+
+def _prefiltered(profile: MatchProfile, vacancy: Vacancy) -> bool:
+    return bool(profile.specializations_mask & vacancy.specializations.to_mask()) and bool(
+        profile.skills_mask & vacancy.skills.to_mask()
+    )
+
+
+@pytest.mark.parametrize("work_format", list(WorkFormat))
+@pytest.mark.parametrize("salary_amount", [None, 150_000, 250_000])
+def test_columnar_match_agrees_with_domain_policy(
+    work_format: WorkFormat,
+    salary_amount: int | None,
+) -> None:
+    rng = random.Random(42)
+    profiles = [_random_profile(rng, tg_id) for tg_id in range(1, 501)]
+    columns = ProfileColumns.from_profiles(profiles[:250])
+    for profile in profiles[250:]:
+        columns.upsert(profile)
+    for tg_id in range(1, 501, 7):
+        columns.remove(tg_id)
+    remaining = [profile for profile in profiles if (profile.tg_id - 1) % 7]
+    vacancy = _vacancy(work_format, salary_amount)
+
+    result = columns.match(vacancy)
+
+    candidates = [profile for profile in remaining if _prefiltered(profile, vacancy)]
+    decisions = {
+        profile.tg_id: evaluate_profile_match(vacancy=vacancy, profile=profile)
+        for profile in candidates
+    }
+    assert result.candidate_count == len(candidates)
+    assert sorted(result.accepted_ids) == sorted(
+        tg_id for tg_id, decision in decisions.items() if decision.accepted
+    )
+    for reason in MatchRejectionReason:
+        assert result.rejected[reason] == sum(
+            1 for decision in decisions.values() if decision.reason == reason
+        )
+
+
+def test_columnar_match_counts_shared_skills_of_accepted_users() -> None:
+    columns = ProfileColumns.from_profiles(
+        [
+            MatchProfile(
+                tg_id=tg_id,
+                specializations_mask=Specializations.from_strs(["Backend"]).to_mask(),
+                skills_mask=Skills.from_strs(skills).to_mask(),
+                min_salary=None,
+                work_format=None,
+            )
+            for tg_id, skills in ((1, ["Python", "SQL"]), (2, ["Python"]), (3, ["Vue"]))
+        ]
+    )
+
+    result = columns.match(_vacancy(WorkFormat.REMOTE, None))
+
+    assert sorted(result.accepted_ids) == [1, 2]
+    assert {skill.value: count for skill, count in result.shared_skill_counts.items()} == {
+        "Python": 2,
+        "SQL": 1,
+    }
@@ -0,0 +1,117 @@
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+from app.application.services.reverse_matcher_service import (
+    ProfileChange,
+    ProfileChangeQueue,
+    ReverseMatcherService,
+)
+from app.domain.matching import MatchProfile
+from app.domain.shared import Skills, Specializations, WorkFormat
+from app.domain.vacancy.entities import Vacancy
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _profile(skills: list[str], min_salary: int | None = None) -> MatchProfile:
+    return MatchProfile(
+        tg_id=7,
+        specializations_mask=Specializations.from_strs(["Backend"]).to_mask(),
+        skills_mask=Skills.from_strs(skills).to_mask(),
+        min_salary=min_salary,
+        work_format=None,
+    )
+
+
+def _vacancy(skills: list[str], salary_amount: int | None = None) -> Vacancy:
+    return Vacancy.create(
+        vacancy_id=uuid4(),
+        text="Backend engineer",
+        specializations_raw=["Backend"],
+        skills_raw=skills,
+        mirror_chat_id=1,
+        mirror_message_id=len(skills),
+        work_format=WorkFormat.REMOTE,
+        salary_amount=salary_amount,
+    )
+
+
+class _Vacancies:
+    def __init__(self, vacancies: list[Vacancy]) -> None:
+        self._vacancies = vacancies
+
+    async def find_recent_for_profile(self, **_: object) -> list[Vacancy]:
+        return self._vacancies
+
+
+class _UnitOfWork:
+    def __init__(self, vacancies: list[Vacancy]) -> None:
+        self.vacancies = _Vacancies(vacancies)
+
+    async def __aenter__(self) -> "_UnitOfWork":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+
+class _NotificationSpy:
+    def __init__(self) -> None:
+        self.sent: list[tuple[UUID, list[int]]] = []
+
+    async def dispatch_vacancy(self, vacancy_id: UUID, user_ids: list[int], **_: object) -> None:
+        self.sent.append((vacancy_id, user_ids))
+
+
+def test_queue_keeps_first_previous_and_waits_for_quiet_period() -> None:
+    clock = _Clock()
+    queue = ProfileChangeQueue(clock=clock)
+    first, second, third = _profile(["Go"]), _profile(["Python"]), _profile(["Python", "SQL"])
+
+    queue.notify(first, second)
+    clock.now = 30
+    queue.notify(second, third)
+    assert queue.pop_settled(quiet_seconds=60) == []
+
+    clock.now = 90
+    assert queue.pop_settled(quiet_seconds=60) == [ProfileChange(first, third)]
+    assert len(queue) == 0
+
+
+def test_queue_drops_edits_that_end_where_they_started() -> None:
+    queue = ProfileChangeQueue(clock=_Clock())
+    original, edited = _profile(["Go"]), _profile(["Python"])
+
+    queue.notify(original, edited)
+    queue.notify(edited, original)
+
+    assert queue.pop_settled(quiet_seconds=0) == []
+
+
+async def test_reverse_match_skips_vacancies_the_previous_profile_matched() -> None:
+    already_sent = _vacancy(["Go"])
+    new_by_skill = _vacancy(["Python", "SQL"])
+    new_by_salary = _vacancy(["Go", "DevOps", "SRE"], salary_amount=100_000)
+    rejected = _vacancy(["Python"], salary_amount=50_000)
+    notifications = _NotificationSpy()
+    service = ReverseMatcherService(
+        _UnitOfWork([rejected, new_by_salary, new_by_skill, already_sent]),  # type: ignore[arg-type]
+        notifications,  # type: ignore[arg-type]
+        window=timedelta(hours=72),
+        max_vacancies=20,
+    )
+    change = ProfileChange(
+        previous=_profile(["Go"], min_salary=150_000),
+        current=_profile(["Go", "Python"], min_salary=80_000),
+    )
+
+    sent_count = await service.match_profile(change)
+
+    assert sent_count == 2
+    assert notifications.sent == [(new_by_skill.id.value, [7]), (new_by_salary.id.value, [7])]
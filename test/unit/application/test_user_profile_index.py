@@ -0,0 +1,76 @@
+from collections.abc import AsyncIterator
+
+from app.application.services.user_profile_index import UserProfileIndex
+from app.domain.matching import MatchProfile
+from app.domain.shared import Skills, Specializations
+from app.domain.user.entities import User
+
+
+def _specs(*names: str) -> int:
+    return Specializations.from_strs(list(names)).to_mask()
+
+
+def _skills(*names: str) -> int:
+    return Skills.from_strs(list(names)).to_mask()
+
+
+def _profile(tg_id: int, specializations: int, skills: int) -> MatchProfile:
+    return MatchProfile(
+        tg_id=tg_id,
+        specializations_mask=specializations,
+        skills_mask=skills,
+        min_salary=None,
+        work_format=None,
+    )
+
+
+async def _stream(*profiles: MatchProfile) -> AsyncIterator[MatchProfile]:
+    for profile in profiles:
+        yield profile
+
+
+async def test_candidates_require_shared_specialization_and_skill() -> None:
+    index = UserProfileIndex()
+    await index.load(
+        _stream(
+            _profile(1, _specs("Backend"), _skills("Python", "SQL")),
+            _profile(2, _specs("Backend"), _skills("Go")),
+            _profile(3, _specs("Frontend"), _skills("Python")),
+        )
+    )
+
+    found = index.candidates(_specs("Backend", "QA"), _skills("Python"))
+
+    assert index.ready is True
+    assert [profile.tg_id for profile in found] == [1]
+    assert len(index.candidates(0, 0)) == 3
+
+
+async def test_sync_user_replaces_postings_and_drops_inactive_users() -> None:
+    index = UserProfileIndex()
+    user = User.create(tg_id=7, cv_specializations_raw=["Backend"], cv_skills_raw=["Python"])
+    index.sync_user(user)
+
+    user = User.create(tg_id=7, cv_specializations_raw=["Backend"], cv_skills_raw=["Go"])
+    index.sync_user(user)
+    assert index.candidates(_specs("Backend"), _skills("Python")) == []
+    assert [profile.tg_id for profile in index.candidates(_specs("Backend"), _skills("Go"))] == [7]
+
+    user.is_active = False
+    index.sync_user(user)
+    assert len(index) == 0
+
+
+async def test_writes_during_load_survive_the_snapshot_swap() -> None:
+    index = UserProfileIndex()
+
+    async def snapshot() -> AsyncIterator[MatchProfile]:
+        yield _profile(1, _specs("Backend"), _skills("Python"))
+        index.upsert(_profile(1, _specs("Backend"), _skills("Go")))
+        index.remove(2)
+        yield _profile(2, _specs("Backend"), _skills("Python"))
+
+    await index.load(snapshot())
+
+    assert len(index) == 1
+    assert [profile.tg_id for profile in index.candidates(_specs("Backend"), _skills("Go"))] == [1]
@@ -0,0 +1,130 @@
+from app.application.services.reverse_matcher_service import (
+    ProfileChangeQueue,
+    get_profile_change_queue,
+)
+from app.application.services.user_profile_index import UserProfileIndex
+from app.application.services.user_service import UserService
+from app.domain.matching import MatchProfile, ProfileUpdate
+from app.domain.shared import Salary, WorkFormat
+from app.domain.user.entities import User
+from app.domain.user.value_objects import FilterMode, UserId
+
+
+def _profile(tg_id: int, min_salary: int | None = None) -> MatchProfile:
+    return MatchProfile(
+        tg_id=tg_id,
+        specializations_mask=1,
+        skills_mask=1,
+        min_salary=min_salary,
+        work_format=None,
+    )
+
+
+class _UserRepositorySpy:
+    def __init__(self, existing: dict[int, bool]) -> None:
+        self.existing = existing
+        self.salary_calls: list[tuple[int, Salary | None, FilterMode]] = []
+
+    async def register(self, user: User) -> ProfileUpdate:
+        tg_id = user.tg_id.value
+        was_active = self.existing.get(tg_id)
+        self.existing[tg_id] = True
+        current = _profile(tg_id)
+        return ProfileUpdate(
+            previous=None if was_active is None else current,
+            current=current,
+            was_active=bool(was_active),
+            is_active=True,
+        )
+
+    async def update_salary_filter(
+        self,
+        tg_id: UserId,
+        salary: Salary | None,
+        mode: FilterMode,
+    ) -> ProfileUpdate | None:
+        self.salary_calls.append((tg_id.value, salary, mode))
+        if tg_id.value not in self.existing:
+            return None
+        return ProfileUpdate(
+            previous=_profile(tg_id.value),
+            current=_profile(tg_id.value, salary.amount if salary else None),
+            was_active=self.existing[tg_id.value],
+            is_active=self.existing[tg_id.value],
+        )
+
+    async def update_work_format_filter(
+        self,
+        tg_id: UserId,
+        work_format: WorkFormat | None,
+        mode: FilterMode,
+    ) -> ProfileUpdate | None:
+        self.work_format_call = (work_format, mode)
+        return None
+
+
+class _UnitOfWorkSpy:
+    def __init__(self, existing: dict[int, bool]) -> None:
+        self.users = _UserRepositorySpy(existing)
+
+    async def __aenter__(self) -> "_UnitOfWorkSpy":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+def _service(
+    existing: dict[int, bool],
+) -> tuple[UserService, _UnitOfWorkSpy, UserProfileIndex, ProfileChangeQueue]:
+    uow = _UnitOfWorkSpy(existing)
+    index = UserProfileIndex()
+    changes = ProfileChangeQueue(clock=lambda: 0.0)
+    service = UserService(uow, index, changes)  # type: ignore[arg-type]
+    return service, uow, index, changes
+
+
+async def test_register_user_indexes_new_and_reactivated_users_only() -> None:
+    service, _uow, index, _changes = _service({2: True, 3: False})
+
+    assert await service.register_user(1, "new") is True
+    assert await service.register_user(2, "active") is False
+    assert await service.register_user(3, "returning") is False
+
+    assert sorted(profile.tg_id for profile in index.candidates(0, 0)) == [1, 3]
+
+
+async def test_salary_filter_update_feeds_index_and_reverse_matching() -> None:
+    service, uow, index, changes = _service({1: True, 2: False})
+
+    assert await service.update_profile_salary_filter(1, 200_000, FilterMode.STRICT) is True
+    assert await service.update_profile_salary_filter(2, None, FilterMode.STRICT) is True
+    assert await service.update_profile_salary_filter(3, 100_000, FilterMode.STRICT) is False
+
+    assert [(tg_id, mode) for tg_id, _salary, mode in uow.users.salary_calls] == [
+        (1, FilterMode.STRICT),
+        (2, FilterMode.SOFT),
+        (3, FilterMode.STRICT),
+    ]
+    assert [profile.min_salary for profile in index.candidates(0, 0)] == [200_000]
+    assert [change.current.tg_id for change in changes.pop_settled(0)] == [1]
+
+
+async def test_work_format_filter_falls_back_to_soft_for_undefined_format() -> None:
+    service, uow, _index, _changes = _service({})
+
+    updated = await service.update_profile_work_format_filter(
+        1, WorkFormat.UNDEFINED, FilterMode.STRICT
+    )
+
+    assert updated is False
+    assert uow.users.work_format_call == (None, FilterMode.SOFT)
+
+
+async def test_empty_injected_change_queue_is_not_replaced_by_global_one() -> None:
+    service, _uow, _index, changes = _service({1: True})
+
+    await service.update_profile_salary_filter(1, 150_000, FilterMode.STRICT)
+
+    assert len(changes) == 1
+    assert len(get_profile_change_queue()) == 0
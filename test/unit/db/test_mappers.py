@@ -1,13 +1,27 @@
 from datetime import UTC, datetime
+from types import SimpleNamespace
 from uuid import uuid4
 
-from app.domain.shared import WorkFormat
+import pytest
+
+from app.domain.matching import MatchProfile
+from app.domain.shared import Skills, Specializations, WorkFormat
 from app.domain.user.entities import User
 from app.domain.user.value_objects import FilterMode
 from app.domain.vacancy.entities import Vacancy
-from app.infrastructure.db.mappers.user import user_from_model, user_to_model
-from app.infrastructure.db.mappers.vacancy import vacancy_from_model, vacancy_to_model
+from app.infrastructure.db.mappers.user import (
+    MATCH_PROFILE_COLUMNS,
+    match_profile_from_row,
+    user_from_model,
+    user_to_model,
+)
+from app.infrastructure.db.mappers.vacancy import (
+    vacancy_from_model,
+    vacancy_to_model,
+    vacancy_to_row,
+)
 from app.infrastructure.db.models import User as UserModel
+from app.infrastructure.db.models import Vacancy as VacancyModel
 
 
 def test_user_mapper_round_trip_preserves_skills() -> None:
@@ -25,6 +39,7 @@ def test_user_mapper_round_trip_preserves_skills() -> None:
     restored = user_from_model(model)
 
     assert sorted(model.cv_skills) == ["Python", "React"]
+    assert model.cv_skills_mask == user.cv_skills.to_mask()
     assert sorted(item.value for item in restored.cv_skills.items) == ["Python", "React"]
 
 
@@ -49,3 +64,55 @@ def test_user_mapper_normalizes_undefined_work_format_to_any() -> None:
     assert restored.filter_work_format_mode == FilterMode.SOFT
 
 
+@pytest.mark.parametrize(
+    ("salary_amount", "salary_currency", "salary_mode", "work_format", "work_format_mode"),
+    [
+        (150000, "RUB", FilterMode.STRICT, WorkFormat.REMOTE.value, FilterMode.STRICT),
+        (150000, "USD", FilterMode.STRICT, WorkFormat.UNDEFINED.value, FilterMode.STRICT),
+        (150000, None, FilterMode.SOFT, WorkFormat.HYBRID.value, FilterMode.SOFT),
+        (None, None, FilterMode.STRICT, None, FilterMode.STRICT),
+    ],
+)
+def test_match_profile_projection_agrees_with_full_user_mapping(
+    salary_amount: int | None,
+    salary_currency: str | None,
+    salary_mode: FilterMode,
+    work_format: str | None,
+    work_format_mode: FilterMode,
+) -> None:
+    model = UserModel(
+        tg_id=123,
+        username="alice",
+        cv_text="resume text",
+        cv_specializations=["Backend"],
+        cv_skills=["Python", "SQL"],
+        cv_specializations_mask=Specializations.from_strs(["Backend"]).to_mask(),
+        cv_skills_mask=Skills.from_strs(["Python", "SQL"]).to_mask(),
+        cv_salary_amount=salary_amount,
+        cv_salary_currency=salary_currency,
+        filter_salary_mode=salary_mode.value,
+        cv_work_format=work_format,
+        filter_work_format_mode=work_format_mode.value,
+        is_active=True,
+    )
+    row = SimpleNamespace(
+        **{column.key: getattr(model, column.key) for column in MATCH_PROFILE_COLUMNS}
+    )
+
+    projected = match_profile_from_row(row)  # type: ignore[arg-type]
+
+    assert projected == MatchProfile.from_user(user_from_model(model))
+
+
+def test_vacancy_row_covers_every_column() -> None:
+    vacancy = Vacancy.create(
+        vacancy_id=uuid4(),
+        text="Backend engineer",
+        specializations_raw=["Backend"],
+        skills_raw=["Python"],
+        mirror_chat_id=1,
+        mirror_message_id=2,
+        work_format=WorkFormat.REMOTE,
+    )
+
+    assert set(vacancy_to_row(vacancy)) == set(VacancyModel.__table__.columns.keys())
@@ -0,0 +1,36 @@
+import sqlite3
+
+from app.infrastructure.db.session import DatabaseWorkload, ObservedQueuePool, _instrument_pool
+
+
+class _ObservabilitySpy:
+    def __init__(self) -> None:
+        self.usage: list[tuple[str, int, int]] = []
+        self.waits: list[str] = []
+
+    def observe_db_pool_usage(self, workload: str, checked_out: int, overflow: int) -> None:
+        self.usage.append((workload, checked_out, overflow))
+
+    def observe_db_pool_wait(self, workload: str, seconds: float) -> None:
+        assert seconds >= 0
+        self.waits.append(workload)
+
+
+def test_instrumented_pool_reports_usage_overflow_and_wait() -> None:
+    pool = ObservedQueuePool(lambda: sqlite3.connect(":memory:"), pool_size=1, max_overflow=1)
+    observability = _ObservabilitySpy()
+    _instrument_pool(pool, DatabaseWorkload.MATCHING, observability)  # type: ignore[arg-type]
+
+    first = pool.connect()
+    second = pool.connect()
+    second.close()
+    first.close()
+    pool.dispose()
+
+    assert observability.usage == [
+        ("matching", 1, 0),
+        ("matching", 2, 1),
+        ("matching", 1, 0),
+        ("matching", 0, 0),
+    ]
+    assert observability.waits == ["matching", "matching"]
@@ -1,6 +1,15 @@
 import pytest
 
-from app.domain.shared import CurrencyType, Salary, Skills, SkillType, SpecializationType, Specializations
+from app.domain.shared import (
+    SKILL_BIT_ORDER,
+    SPECIALIZATION_BIT_ORDER,
+    CurrencyType,
+    Salary,
+    Skills,
+    SkillType,
+    Specializations,
+    SpecializationType,
+)
 
 
 def test_specializations_from_strs_valid() -> None:
@@ -24,6 +33,23 @@ def test_skills_from_strs_accepts_only_exact_enum_values() -> None:
     assert result.items == frozenset({SkillType.PYTHON, SkillType.REACT, SkillType.SQL})
 
 
+def test_bit_orders_cover_every_enum_member_once() -> None:
+    assert sorted(SPECIALIZATION_BIT_ORDER) == sorted(SpecializationType)
+    assert sorted(SKILL_BIT_ORDER) == sorted(SkillType)
+    assert len(SKILL_BIT_ORDER) <= 63
+
+
+def test_masks_round_trip_and_use_fixed_bit_positions() -> None:
+    skills = Skills.from_strs(["Python", "SQL", "Vue"])
+    specializations = Specializations.from_strs(["Backend", "Analytics"])
+
+    assert Skills.from_mask(skills.to_mask()) == skills
+    assert Specializations.from_mask(specializations.to_mask()) == specializations
+    assert Skills.from_strs(["Python"]).to_mask() == 1
+    assert specializations.to_mask() == 0b1000_0001
+    assert Skills.from_mask(0).items == frozenset()
+
+
 @pytest.mark.parametrize(
     ("amount", "currency_input", "expected_amount", "expected_currency"),
     [
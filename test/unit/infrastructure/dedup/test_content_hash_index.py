@@ -0,0 +1,77 @@
+from collections.abc import AsyncIterator
+
+from app.domain.vacancy.entities import Vacancy
+from app.infrastructure.dedup import BloomFilter, ContentHashIndex, DedupVerdict
+
+
+async def _iter_hashes(hashes: list[str]) -> AsyncIterator[str]:
+    for content_hash in hashes:
+        yield content_hash
+
+
+def _hash(text: str) -> str:
+    return Vacancy.compute_content_hash(text).value
+
+
+def test_bloom_filter_has_no_false_negatives() -> None:
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    keys = [_hash(f"vacancy {index}") for index in range(1000)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(bloom.might_contain(key) for key in keys)
+
+
+def test_bloom_filter_false_positive_rate_stays_near_target() -> None:
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for index in range(1000):
+        bloom.add(_hash(f"vacancy {index}"))
+
+    false_positives = sum(
+        bloom.might_contain(_hash(f"other message {index}")) for index in range(5000)
+    )
+
+    assert false_positives / 5000 < 0.03
+
+
+def test_cold_index_defers_to_database() -> None:
+    index = ContentHashIndex(capacity=100, error_rate=0.01, recent_size=10)
+
+    assert index.check(_hash("new vacancy")) == DedupVerdict.MAYBE
+
+
+async def test_warm_index_answers_new_and_possible_hits() -> None:
+    index = ContentHashIndex(capacity=100, error_rate=0.001, recent_size=10)
+    stored = _hash("stored vacancy")
+    await index.warm_up(_iter_hashes([stored]), expected_count=1)
+
+    assert index.check(_hash("fresh vacancy")) == DedupVerdict.NEW
+    assert index.check(stored) == DedupVerdict.MAYBE
+
+
+async def test_recent_hashes_are_answered_exactly_and_evicted_lru() -> None:
+    index = ContentHashIndex(capacity=100, error_rate=0.001, recent_size=2)
+    await index.warm_up(_iter_hashes([]), expected_count=0)
+    first, second, third = _hash("first"), _hash("second"), _hash("third")
+
+    index.add(first)
+    index.add(second)
+    assert index.check(first) == DedupVerdict.SEEN
+
+    index.add(third)
+
+    assert index.check(first) == DedupVerdict.SEEN
+    assert index.check(second) == DedupVerdict.MAYBE
+    assert index.check(third) == DedupVerdict.SEEN
+
+
+def test_reserved_hash_is_held_until_released() -> None:
+    index = ContentHashIndex(capacity=100, error_rate=0.001, recent_size=2)
+    content_hash = _hash("vacancy")
+
+    assert index.reserve(content_hash) is True
+    assert index.reserve(content_hash) is False
+
+    index.release(content_hash)
+
+    assert index.reserve(content_hash) is True
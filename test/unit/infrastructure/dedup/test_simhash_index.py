@@ -0,0 +1,67 @@
+from collections.abc import AsyncIterator
+
+from app.domain.vacancy.entities import Vacancy
+from app.infrastructure.db.mappers.vacancy import simhash_from_db, simhash_to_db
+from app.infrastructure.dedup import SimHashIndex
+
+_VACANCY_TEXT = (
+    "Senior Python developer wanted for a fintech team. Stack: FastAPI, PostgreSQL, "
+    "Redis, Kafka. Remote work, salary up to 6000 USD. Apply via https://jobs.example.com/a1"
+)
+
+
+async def _iter_fingerprints(values: list[int]) -> AsyncIterator[int]:
+    for value in values:
+        yield value
+
+
+def test_simhash_tolerates_link_and_emoji_edits() -> None:
+    original = Vacancy.compute_simhash(_VACANCY_TEXT)
+    edited = Vacancy.compute_simhash(
+        _VACANCY_TEXT.replace("https://jobs.example.com/a1", "https://t.me/other_channel") + " 🔥🔥"
+    )
+
+    assert original.distance(edited) <= 3
+
+
+def test_simhash_separates_different_vacancies() -> None:
+    python_vacancy = Vacancy.compute_simhash(_VACANCY_TEXT)
+    designer_vacancy = Vacancy.compute_simhash(
+        "Product designer in a small gamedev studio, Figma and prototyping, office in Belgrade"
+    )
+
+    assert python_vacancy.distance(designer_vacancy) > 3
+
+
+def test_index_finds_fingerprints_within_max_distance() -> None:
+    index = SimHashIndex(max_distance=3)
+    stored = Vacancy.compute_simhash(_VACANCY_TEXT).value
+    index.add(stored)
+
+    near = stored ^ 0b1 ^ (1 << 20) ^ (1 << 63)
+    far = stored ^ 0b1111
+
+    assert index.find_near(near) == (stored, 3)
+    assert index.find_near(far) is None
+
+
+async def test_index_warm_up_loads_fingerprints() -> None:
+    index = SimHashIndex(max_distance=2)
+    values = [
+        Vacancy.compute_simhash(f"vacancy number {n} in team {n * 7}").value for n in range(5)
+    ]
+
+    loaded = await index.warm_up(_iter_fingerprints(values))
+
+    assert loaded == 5
+    assert len(index) == 5
+    assert all(index.find_near(value) == (value, 0) for value in values)
+
+
+def test_simhash_roundtrips_through_signed_bigint() -> None:
+    fingerprint = Vacancy.compute_simhash(_VACANCY_TEXT)
+    high_bit = type(fingerprint)((1 << 63) | 5)
+
+    assert simhash_from_db(simhash_to_db(fingerprint)) == fingerprint.value
+    assert simhash_to_db(high_bit) < 0
+    assert simhash_from_db(simhash_to_db(high_bit)) == high_bit.value
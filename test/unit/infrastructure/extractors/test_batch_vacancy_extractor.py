@@ -0,0 +1,48 @@
+from pydantic_ai.exceptions import UnexpectedModelBehavior
+
+from app.application.dto import OutVacancyBatchItem, OutVacancyBatchParse, OutVacancyParse
+from app.infrastructure.extractors import GoogleVacancyLLMExtractor
+
+
+class _BatchExtractorStub(GoogleVacancyLLMExtractor):
+    def __init__(self, batch: OutVacancyBatchParse | None) -> None:
+        super().__init__()
+        self._batch = batch
+        self.single_calls: list[str] = []
+
+    async def parse_vacancy(self, text: str) -> OutVacancyParse:
+        self.single_calls.append(text)
+        return OutVacancyParse(is_vacancy=False)
+
+    async def _run_batch(self, texts: list[str]) -> OutVacancyBatchParse:
+        if self._batch is None:
+            raise UnexpectedModelBehavior("Exceeded maximum retries for output validation")
+        return self._batch
+
+
+async def test_batch_results_are_matched_by_id_and_gaps_fall_back() -> None:
+    extractor = _BatchExtractorStub(
+        OutVacancyBatchParse(
+            items=[
+                OutVacancyBatchItem(id=3, is_vacancy=True, skills=["Go"]),
+                OutVacancyBatchItem(id=1, is_vacancy=True, skills=["Python"]),
+                OutVacancyBatchItem(id=1, is_vacancy=False),
+                OutVacancyBatchItem(id=9, is_vacancy=True),
+            ]
+        )
+    )
+
+    results = await extractor.parse_vacancies(["python", "spam", "go"])
+
+    assert [result.is_vacancy for result in results] == [True, False, True]
+    assert [skill.value for skill in results[0].skills] == ["Python"]
+    assert extractor.single_calls == ["spam"]
+
+
+async def test_schema_error_falls_back_to_single_messages() -> None:
+    extractor = _BatchExtractorStub(None)
+
+    results = await extractor.parse_vacancies(["first", "second"])
+
+    assert len(results) == 2
+    assert extractor.single_calls == ["first", "second"]
@@ -0,0 +1,127 @@
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+from app.application.dto import OutVacancyParse
+from app.infrastructure.extractors import cached_vacancy_extractor
+from app.infrastructure.extractors.cached_vacancy_extractor import CachedVacancyLLMExtractor
+from app.infrastructure.observability import NoOpObservabilityService
+
+
+class _ExtractorSpy:
+    def __init__(self, result: OutVacancyParse) -> None:
+        self.result = result
+        self.calls = 0
+
+    async def parse_vacancy(self, text: str) -> OutVacancyParse:
+        self.calls += 1
+        return self.result
+
+
+class _CacheRepositoryFake:
+    def __init__(self, store: dict[tuple[str, str], dict[str, Any]]) -> None:
+        self._store = store
+
+    async def get(self, text_hash: str, extractor_version: str) -> dict[str, Any] | None:
+        return self._store.get((text_hash, extractor_version))
+
+    async def put(
+        self,
+        text_hash: str,
+        extractor_version: str,
+        result: dict[str, Any],
+        *,
+        is_vacancy: bool,
+        ttl: timedelta,
+    ) -> None:
+        self._store[(text_hash, extractor_version)] = result
+
+    async def get_verdicts(self, text_hashes: list[str], extractor_version: str) -> dict:
+        return {
+            text_hash: bool(self._store[(text_hash, extractor_version)]["is_vacancy"])
+            for text_hash in text_hashes
+            if (text_hash, extractor_version) in self._store
+        }
+
+    async def purge(self, max_entries: int) -> int:
+        return 0
+
+
+@pytest.fixture
+def cache_store(monkeypatch: pytest.MonkeyPatch) -> dict[tuple[str, str], dict[str, Any]]:
+    store: dict[tuple[str, str], dict[str, Any]] = {}
+
+    class _UnitOfWorkFake:
+        def __init__(self, _session_factory: object) -> None:
+            self.extraction_cache = _CacheRepositoryFake(store)
+
+        async def __aenter__(self) -> "_UnitOfWorkFake":
+            return self
+
+        async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+            return None
+
+    monkeypatch.setattr(cached_vacancy_extractor, "ExtractionCacheUnitOfWork", _UnitOfWorkFake)
+    return store
+
+
+class _BatchExtractorSpy(_ExtractorSpy):
+    def __init__(self, result: OutVacancyParse) -> None:
+        super().__init__(result)
+        self.batches: list[list[str]] = []
+
+    async def parse_vacancies(self, texts: list[str]) -> list[OutVacancyParse]:
+        self.batches.append(texts)
+        return [self.result for _ in texts]
+
+
+def _build(inner: _ExtractorSpy, version: str = "v1") -> CachedVacancyLLMExtractor:
+    return CachedVacancyLLMExtractor(
+        inner,
+        session_factory=None,  # type: ignore[arg-type]
+        observability=NoOpObservabilityService(),
+        version=version,
+        ttl=timedelta(days=1),
+        max_entries=100,
+        batch_size=2,
+    )
+
+
+async def test_negative_result_is_served_from_cache(cache_store: dict) -> None:
+    inner = _ExtractorSpy(OutVacancyParse(is_vacancy=False))
+    extractor = _build(inner)
+
+    first = await extractor.parse_vacancy("Buy crypto signals now!")
+    second = await extractor.parse_vacancy("  buy CRYPTO signals   now! ")
+
+    assert first.is_vacancy is False
+    assert second == first
+    assert inner.calls == 1
+
+
+async def test_version_change_bypasses_old_entries(cache_store: dict) -> None:
+    inner = _ExtractorSpy(
+        OutVacancyParse(is_vacancy=True, specializations=["Backend"], skills=["Python"])
+    )
+
+    await _build(inner, version="v1").parse_vacancy("Python backend developer")
+    cached = await _build(inner, version="v1").parse_vacancy("Python backend developer")
+    await _build(inner, version="v2").parse_vacancy("Python backend developer")
+
+    assert cached == inner.result
+    assert inner.calls == 2
+    assert len(cache_store) == 2
+
+
+async def test_prefetch_batches_uncached_texts_for_later_single_parses(cache_store: dict) -> None:
+    inner = _BatchExtractorSpy(OutVacancyParse(is_vacancy=False))
+    extractor = _build(inner)
+    await extractor.parse_vacancy("already cached")
+
+    await extractor.prefetch(["already cached", "one", "two", "three", "One"])
+    for text in ("one", "two", "three"):
+        await extractor.parse_vacancy(text)
+
+    assert inner.batches == [["one", "two"]]
+    assert inner.calls == 2
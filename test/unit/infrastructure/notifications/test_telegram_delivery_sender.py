@@ -0,0 +1,153 @@
+import asyncio
+from time import monotonic
+from uuid import uuid4
+
+from aiogram.exceptions import TelegramForbiddenError, TelegramRetryAfter
+from aiogram.methods import ForwardMessage, SendMessage
+
+from app.domain.delivery import Delivery, DeliveryPriority
+from app.infrastructure.notifications import TelegramDeliverySender, TelegramSendLimiter
+from app.infrastructure.notifications.telegram_delivery_sender import (
+    DIGEST_MAX_ITEMS,
+    mirror_post_url,
+)
+from app.infrastructure.observability import NoOpObservabilityService
+
+
+class _BotSpy:
+    def __init__(
+        self,
+        forbidden: set[int] | None = None,
+        flood_once: set[int] | None = None,
+        latency: float = 0.0,
+    ) -> None:
+        self._forbidden = forbidden or set()
+        self._flood_once = flood_once or set()
+        self._latency = latency
+        self.forwarded: list[int] = []
+        self.messages: list[tuple[int, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def forward_message(self, chat_id: int, from_chat_id: int, message_id: int) -> None:
+        method = ForwardMessage(chat_id=chat_id, from_chat_id=from_chat_id, message_id=message_id)
+        if chat_id in self._forbidden:
+            raise TelegramForbiddenError(method=method, message="bot was blocked by the user")
+        if chat_id in self._flood_once:
+            self._flood_once.discard(chat_id)
+            raise TelegramRetryAfter(method=method, message="Too Many Requests", retry_after=0)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self._latency)
+        self.in_flight -= 1
+        self.forwarded.append(chat_id)
+
+    async def send_message(self, chat_id: int, text: str, **kwargs: object) -> None:
+        if chat_id in self._forbidden:
+            method = SendMessage(chat_id=chat_id, text=text)
+            raise TelegramForbiddenError(method=method, message="bot was blocked by the user")
+        self.messages.append((chat_id, text))
+
+
+def _sender(
+    bot: _BotSpy,
+    *,
+    global_rate: float = 10_000,
+    concurrency: int = 16,
+) -> TelegramDeliverySender:
+    return TelegramDeliverySender(
+        bot,
+        NoOpObservabilityService(),
+        TelegramSendLimiter(global_rate=global_rate, per_chat_rate=1_000),
+        concurrency=concurrency,
+        max_flood_retries=1,
+    )
+
+
+def _deliveries(tg_ids: list[int]) -> list[Delivery]:
+    vacancy_id = uuid4()
+    return [
+        Delivery(
+            id=tg_id * 10,
+            vacancy_id=vacancy_id,
+            tg_id=tg_id,
+            mirror_chat_id=1,
+            mirror_message_id=10,
+            priority=DeliveryPriority.FRESH,
+            attempts=0,
+        )
+        for tg_id in tg_ids
+    ]
+
+
+async def test_send_reports_outcome_per_delivery() -> None:
+    bot = _BotSpy(forbidden={3})
+
+    report = await _sender(bot, concurrency=1).send(_deliveries([1, 2, 3]))
+
+    assert bot.forwarded == [1, 2]
+    assert report.sent == [10, 20]
+    assert report.forbidden == [30]
+    assert report.failed == {}
+
+
+async def test_send_runs_concurrently_within_the_limit() -> None:
+    bot = _BotSpy(latency=0.01)
+
+    report = await _sender(bot, concurrency=8).send(_deliveries(list(range(1, 41))))
+
+    assert sorted(bot.forwarded) == list(range(1, 41))
+    assert len(report.sent) == 40
+    assert bot.max_in_flight == 8
+
+
+async def test_send_is_paced_by_the_global_bucket() -> None:
+    bot = _BotSpy()
+    started_at = monotonic()
+
+    # The first 100 sends are the burst; the next 10 have to wait for refill.
+    await _sender(bot, global_rate=100).send(_deliveries(list(range(1, 111))))
+
+    assert len(bot.forwarded) == 110
+    assert monotonic() - started_at >= 0.09
+
+
+async def test_send_retries_after_flood_control() -> None:
+    bot = _BotSpy(flood_once={2})
+
+    report = await _sender(bot).send(_deliveries([1, 2]))
+
+    assert sorted(bot.forwarded) == [1, 2]
+    assert sorted(report.sent) == [10, 20]
+
+
+async def test_send_digests_sends_one_message_per_user() -> None:
+    bot = _BotSpy(forbidden={2})
+    deliveries = [
+        Delivery(
+            id=index,
+            vacancy_id=uuid4(),
+            tg_id=1 if index <= DIGEST_MAX_ITEMS + 1 else 2,
+            mirror_chat_id=-1001234567890,
+            mirror_message_id=100 + index,
+            priority=DeliveryPriority.FRESH,
+            attempts=0,
+            preview="Python <Backend>\nRemote",
+        )
+        for index in range(1, DIGEST_MAX_ITEMS + 4)
+    ]
+
+    report = await _sender(bot).send_digests(deliveries)
+
+    assert sorted(report.sent) == list(range(1, DIGEST_MAX_ITEMS + 2))
+    assert sorted(report.forbidden) == [DIGEST_MAX_ITEMS + 2, DIGEST_MAX_ITEMS + 3]
+    assert [chat_id for chat_id, _ in bot.messages] == [1, 1]
+    assert bot.forwarded == []
+    text = next(text for _, text in bot.messages if "https://t.me/c/1234567890/101" in text)
+    assert "Python &lt;Backend&gt;" in text
+    assert "Remote" not in text
+
+
+def test_mirror_post_url_prefers_public_username() -> None:
+    assert mirror_post_url(-1001234567890, 5, "jobs_mirror") == "https://t.me/jobs_mirror/5"
+    assert mirror_post_url(-1001234567890, 5) == "https://t.me/c/1234567890/5"
@@ -0,0 +1,104 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from app.application.dto import OutVacancyParse
+from app.infrastructure.extractors import PreClassifiedVacancyLLMExtractor
+from app.infrastructure.preclassifier import (
+    HashedLogisticRegression,
+    VacancyPreClassifier,
+    rule_rejection,
+)
+
+_VACANCY = (
+    "Ищем Python-разработчика в команду платежей. Требования: FastAPI, PostgreSQL. "
+    "Зарплата от 250 000 руб, удаленка. Подписывайтесь на канал с вакансиями!"
+)
+
+
+@dataclass
+class _ExtractorSpy:
+    result: OutVacancyParse
+    calls: int = 0
+
+    async def parse_vacancy(self, text: str) -> OutVacancyParse:
+        self.calls += 1
+        return self.result
+
+
+@dataclass
+class _ObservabilitySpy:
+    decisions: list[tuple[str, str, str]] = field(default_factory=list)
+
+    def observe_preclassifier_decision(self, verdict: str, reason: str, agreement: str) -> None:
+        self.decisions.append((verdict, reason, agreement))
+
+
+def test_rules_reject_clear_negatives_only() -> None:
+    assert rule_rejection(_VACANCY) is None
+    assert rule_rejection("Всем доброе утро и хороших выходных!") == "no_hiring_signal"
+    assert rule_rejection("#резюме Backend developer, мой опыт 5 лет, ищу работу") == "self_promo"
+    assert rule_rejection("Курс со скидкой: станьте QA за 3 месяца, промокод JOB") == (
+        "advertisement"
+    )
+    assert rule_rejection("#вакансия Go\n#вакансия Java\n#вакансия Python") == "digest"
+    assert (
+        rule_rejection("#вакансия #vacancy #job #python\nИщем Python разработчика в команду")
+        is None
+    )
+
+
+def test_hashed_logistic_regression_learns_and_roundtrips(tmp_path: Path) -> None:
+    samples = [
+        (f"Ищем {role} в команду, зарплата и требования внутри", True)
+        for role in ("python разработчика", "go разработчика", "аналитика", "тестировщика")
+    ] + [
+        (f"Мой опыт {years} лет, стек python, ищу интересные проекты", False)
+        for years in (1, 2, 3, 4)
+    ]
+    model = HashedLogisticRegression.train(samples, n_features=2**12, epochs=20)
+    path = tmp_path / "model.json"
+    model.save(path)
+    loaded = HashedLogisticRegression.load(path)
+
+    positive = loaded.predict_proba("Ищем java разработчика в команду, зарплата высокая")
+    negative = loaded.predict_proba("Мой опыт 6 лет, ищу интересные проекты")
+
+    assert positive > 0.5 > negative
+    assert loaded.predict_proba(samples[0][0]) == model.predict_proba(samples[0][0])
+
+
+async def test_enforce_mode_skips_llm_for_rejected_text() -> None:
+    inner = _ExtractorSpy(OutVacancyParse(is_vacancy=True))
+    observability = _ObservabilitySpy()
+    extractor = PreClassifiedVacancyLLMExtractor(
+        inner,
+        VacancyPreClassifier(),
+        observability,  # type: ignore[arg-type]
+        mode="enforce",
+    )
+
+    result = await extractor.parse_vacancy("Всем доброе утро!")
+
+    assert result.is_vacancy is False
+    assert inner.calls == 0
+    assert observability.decisions == [("reject", "no_hiring_signal", "unknown")]
+
+
+async def test_shadow_mode_always_calls_llm_and_records_agreement() -> None:
+    inner = _ExtractorSpy(OutVacancyParse(is_vacancy=False))
+    observability = _ObservabilitySpy()
+    extractor = PreClassifiedVacancyLLMExtractor(
+        inner,
+        VacancyPreClassifier(),
+        observability,  # type: ignore[arg-type]
+        mode="shadow",
+    )
+
+    await extractor.parse_vacancy("Всем доброе утро!")
+    await extractor.parse_vacancy(_VACANCY)
+
+    assert inner.calls == 2
+    assert observability.decisions == [
+        ("reject", "no_hiring_signal", "agree"),
+        ("pass", "rules", "false_pass"),
+    ]
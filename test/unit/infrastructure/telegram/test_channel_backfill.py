@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+
+from telethon.tl.types import InputPeerChannel
+
+from app.telegram.scrapper.backfill import BackfillPlan, ChannelBackfiller
+
+
+@dataclass
+class _FakeMessage:
+    id: int
+    text: str
+
+
+class _FakeTelegramClient:
+    def __init__(self, messages: list[_FakeMessage]) -> None:
+        self._messages = messages
+
+    async def get_input_entity(self, channel):
+        return InputPeerChannel(channel_id=100, access_hash=0)
+
+    async def iter_messages(self, entity, limit, min_id=0, reverse=False):
+        if reverse:
+            selected = [message for message in self._messages if message.id > min_id][:limit]
+        else:
+            selected = list(reversed(self._messages))[:limit]
+        for message in selected:
+            yield message
+
+
+def _build_backfiller(
+    client: _FakeTelegramClient,
+    sink_calls: list[tuple[int, int, str]],
+    max_messages: int = 100,
+) -> ChannelBackfiller:
+    async def read_cursor(_: int) -> int | None:
+        return None
+
+    async def sink(chat_id: int, message_id: int, text: str) -> None:
+        sink_calls.append((chat_id, message_id, text))
+
+    return ChannelBackfiller(
+        client,  # type: ignore[arg-type]
+        read_cursor=read_cursor,
+        sink=sink,
+        queue_load=lambda: 0.0,
+        batch_size=2,
+        batch_delay_seconds=0,
+        max_messages_per_channel=max_messages,
+    )
+
+
+async def test_backfill_walks_from_cursor_in_batches_and_skips_empty_text() -> None:
+    messages = [_FakeMessage(id=index, text=f"message {index}") for index in range(1, 7)]
+    messages[4] = _FakeMessage(id=5, text="")
+    sink_calls: list[tuple[int, int, str]] = []
+    backfiller = _build_backfiller(_FakeTelegramClient(messages), sink_calls)
+
+    await backfiller.run([BackfillPlan(channel="@jobs", entity=object(), chat_id=-100, cursor=2)])
+
+    assert [message_id for _, message_id, _ in sink_calls] == [3, 4, 6]
+
+
+async def test_backfill_without_cursor_takes_only_latest_batch() -> None:
+    messages = [_FakeMessage(id=index, text=f"message {index}") for index in range(1, 7)]
+    sink_calls: list[tuple[int, int, str]] = []
+    backfiller = _build_backfiller(_FakeTelegramClient(messages), sink_calls)
+
+    await backfiller.run(
+        [BackfillPlan(channel="@jobs", entity=object(), chat_id=-100, cursor=None)]
+    )
+
+    assert [message_id for _, message_id, _ in sink_calls] == [5, 6]
+
+
+async def test_backfill_respects_per_channel_limit() -> None:
+    messages = [_FakeMessage(id=index, text=f"message {index}") for index in range(1, 11)]
+    sink_calls: list[tuple[int, int, str]] = []
+    backfiller = _build_backfiller(_FakeTelegramClient(messages), sink_calls, max_messages=3)
+
+    await backfiller.run([BackfillPlan(channel="@jobs", entity=object(), chat_id=-100, cursor=0)])
+
+    assert [message_id for _, message_id, _ in sink_calls] == [1, 2, 3]
+
+
+async def test_interrupted_backfill_resumes_after_live_messages_arrived() -> None:
+    messages = [_FakeMessage(id=index, text=f"message {index}") for index in range(1, 11)]
+    client = _FakeTelegramClient(messages)
+    cursors: dict[int, int] = {}
+    recorded: set[int] = set()
+
+    def build(max_messages: int) -> ChannelBackfiller:
+        async def read_cursor(chat_id: int) -> int | None:
+            return cursors.get(chat_id, 2)
+
+        async def sink(chat_id: int, message_id: int, text: str) -> None:
+            recorded.add(message_id)
+            cursors[chat_id] = max(cursors.get(chat_id, 0), message_id)
+
+        return ChannelBackfiller(
+            client,  # type: ignore[arg-type]
+            read_cursor=read_cursor,
+            sink=sink,
+            queue_load=lambda: 0.0,
+            batch_size=2,
+            batch_delay_seconds=0,
+            max_messages_per_channel=max_messages,
+        )
+
+    def live(backfiller: ChannelBackfiller, chat_id: int, message_id: int) -> None:
+        recorded.add(message_id)
+        if backfiller.is_caught_up(chat_id):
+            cursors[chat_id] = max(cursors.get(chat_id, 0), message_id)
+
+    # Stops after 3..6 of the 3..10 gap, like a run interrupted midway.
+    first = build(max_messages=4)
+    plans = await first.prepare(["@jobs"])
+    chat_id = plans[0].chat_id
+    await first.run(plans)
+    messages.append(_FakeMessage(id=11, text="message 11"))
+    live(first, chat_id, 11)
+
+    assert cursors[chat_id] == 6
+
+    second = build(max_messages=100)
+    await second.run(await second.prepare(["@jobs"]))
+    messages.append(_FakeMessage(id=12, text="message 12"))
+    live(second, chat_id, 12)
+
+    assert recorded == set(range(3, 13))
+    assert cursors[chat_id] == 12
@@ -0,0 +1,38 @@
+from app.core.config import config
+from app.infrastructure.observability import NoOpObservabilityService
+from app.telegram.notifier.worker import DeliveryWorker
+
+
+class _FlakyDigestWorker(DeliveryWorker):
+    def __init__(self) -> None:
+        self.slot = 0
+        self.digest_passes = 0
+        self.iterations = 0
+        super().__init__(None, None, NoOpObservabilityService())  # type: ignore[arg-type]
+
+    def _current_digest_slot(self) -> int:  # type: ignore[override]
+        return self.slot
+
+    async def run_once(self) -> int:
+        self.iterations += 1
+        if self.iterations > 5:
+            self.stop()
+        # A full batch keeps the loop from sleeping between iterations.
+        return config.DELIVERY_BATCH_SIZE
+
+    async def run_digests(self) -> int:
+        self.digest_passes += 1
+        if self.digest_passes == 1:
+            raise RuntimeError("database unavailable")
+        self.stop()
+        return 0
+
+
+async def test_failed_digest_pass_is_retried_within_the_same_slot() -> None:
+    worker = _FlakyDigestWorker()
+    worker.slot += 1
+
+    await worker.start()
+
+    assert worker.digest_passes == 2
+    assert worker._digest_slot == worker.slot
@@ -0,0 +1,71 @@
+import asyncio
+
+from app.infrastructure.observability import NoOpObservabilityService
+from app.telegram.scrapper.ingest_queue import IngestQueue
+
+
+async def test_ingest_queue_processes_items_with_bounded_concurrency() -> None:
+    in_flight = 0
+    peak = 0
+    processed: list[int] = []
+
+    async def handler(item: int) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        processed.append(item)
+        in_flight -= 1
+
+    queue: IngestQueue[int] = IngestQueue(
+        handler,
+        NoOpObservabilityService(),
+        workers=2,
+        maxsize=10,
+    )
+    queue.start()
+    for item in range(6):
+        await queue.submit(item)
+    await queue.drain(timeout=5)
+
+    assert sorted(processed) == list(range(6))
+    assert peak == 2
+    assert queue.is_running is False
+
+
+async def test_ingest_queue_survives_handler_errors() -> None:
+    processed: list[int] = []
+
+    async def handler(item: int) -> None:
+        if item == 0:
+            raise RuntimeError("boom")
+        processed.append(item)
+
+    queue: IngestQueue[int] = IngestQueue(
+        handler,
+        NoOpObservabilityService(),
+        workers=1,
+        maxsize=10,
+    )
+    queue.start()
+    await queue.submit(0)
+    await queue.submit(1)
+    await queue.drain(timeout=5)
+
+    assert processed == [1]
+
+
+async def test_ingest_queue_rejects_items_after_drain() -> None:
+    async def handler(_: int) -> None:
+        return None
+
+    queue: IngestQueue[int] = IngestQueue(
+        handler,
+        NoOpObservabilityService(),
+        workers=1,
+        maxsize=1,
+    )
+    queue.start()
+    await queue.drain(timeout=1)
+
+    assert await queue.submit(1) is False
@@ -8,7 +8,7 @@ from fastapi.testclient import TestClient
 from app.core.config import config
 from app.domain.shared import WorkFormat
 from app.domain.user.entities import User
-from app.domain.user.value_objects import FilterMode
+from app.domain.user.value_objects import DeliveryMode, FilterMode
 from app.telegram.miniapp.app import build_miniapp_app
 from app.telegram.miniapp.deps import get_user_service
 
@@ -19,6 +19,7 @@ class FakeUserService:
         self.specialty_result = True
         self.work_format_result = True
         self.salary_result = True
+        self.delivery_mode_result = True
         self.calls: list[tuple[str, dict[str, object]]] = []
 
     async def get_user_by_tg_id(self, tg_id: int) -> User | None:
@@ -79,6 +80,12 @@ class FakeUserService:
         )
         return self.salary_result
 
+    async def update_delivery_mode(self, tg_id: int, delivery_mode: DeliveryMode) -> bool:
+        self.calls.append(
+            ("update_delivery_mode", {"tg_id": tg_id, "delivery_mode": delivery_mode})
+        )
+        return self.delivery_mode_result
+
 
 def test_specialty_page_renders_domain_options() -> None:
     with TestClient(build_miniapp_app()) as client:
@@ -250,6 +257,34 @@ def test_save_salary_updates_salary_filter() -> None:
     )
 
 
+def test_read_delivery_returns_current_mode() -> None:
+    with make_client(FakeUserService(build_user(delivery_mode=DeliveryMode.DIGEST))) as (
+        client,
+        _service,
+    ):
+        response = client.get("/miniapp/api/delivery", headers=auth_headers())
+
+    assert response.status_code == 200
+    assert response.json() == {"delivery_mode": "DIGEST"}
+
+
+def test_save_delivery_updates_delivery_mode() -> None:
+    with make_client(FakeUserService(build_user())) as (client, service):
+        response = client.post(
+            "/miniapp/api/delivery",
+            json={
+                "init_data": build_init_data(),
+                "delivery_mode": "DIGEST",
+            },
+        )
+
+    assert response.status_code == 200
+    assert service.calls[-1] == (
+        "update_delivery_mode",
+        {"tg_id": 123, "delivery_mode": DeliveryMode.DIGEST},
+    )
+
+
 def test_read_specialty_requires_valid_init_data() -> None:
     with make_client(FakeUserService(build_user())) as (client, _service):
         response = client.get("/miniapp/api/specialty")
@@ -0,0 +1,267 @@
+from dataclasses import replace
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.application.dto import OutVacancyParse
+from app.application.services.ingest_outbox_service import IngestOutboxService
+from app.domain.ingest.entities import IngestJob, IngestJobStatus
+from app.domain.shared import SkillType, SpecializationType
+from app.domain.vacancy.entities import Vacancy
+from app.domain.vacancy.value_objects import VacancyId
+from app.infrastructure.observability import NoOpObservabilityService
+from app.telegram.scrapper import handlers
+from app.telegram.scrapper.handlers import TelegramScraper
+
+_VACANCY_TEXT = "Python backend developer, FastAPI and PostgreSQL, remote"
+
+
+class _MirrorClientSpy:
+    def __init__(self) -> None:
+        self.forwarded: list[int] = []
+        self.deleted: list[int] = []
+
+    async def forward_messages(self, entity: int, message_id: int, from_peer: int) -> object:
+        self.forwarded.append(message_id)
+        return SimpleNamespace(chat_id=entity, id=1000 + len(self.forwarded))
+
+    async def delete_messages(self, entity: int, message_ids: list[int]) -> None:
+        self.deleted.extend(message_ids)
+
+
+class _ExtractorStub:
+    def __init__(self, result: OutVacancyParse) -> None:
+        self._result = result
+
+    async def parse_vacancy(self, text: str) -> OutVacancyParse:
+        return self._result
+
+
+class _VacancyRepositoryStub:
+    def __init__(self, insert_results: list[VacancyId | None | Exception]) -> None:
+        self._insert_results = insert_results
+
+    async def exists_by_content_hash(self, content_hash: object) -> bool:
+        return False
+
+    async def insert_if_absent(self, vacancy: Vacancy) -> VacancyId | None:
+        result = self._insert_results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class _VacancyUnitOfWorkStub:
+    def __init__(self, vacancies: _VacancyRepositoryStub) -> None:
+        self.vacancies = vacancies
+
+    async def __aenter__(self) -> "_VacancyUnitOfWorkStub":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+class _IngestJobRepositorySpy:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.mirrors: dict[int, tuple[int, int]] = {}
+
+    async def set_mirror(
+        self, job_id: int, leased_attempts: int, mirror_chat_id: int, mirror_message_id: int
+    ) -> bool:
+        self.mirrors[job_id] = (mirror_chat_id, mirror_message_id)
+        return True
+
+    async def mark_done(self, job_id: int, leased_attempts: int) -> bool:
+        self.calls.append("done")
+        return True
+
+    async def mark_retry(
+        self, job_id: int, leased_attempts: int, error: str, next_attempt_at: datetime
+    ) -> bool:
+        self.calls.append("retry")
+        return True
+
+    async def mark_dead(self, job_id: int, leased_attempts: int, error: str) -> bool:
+        self.calls.append("dead")
+        return True
+
+    async def defer(
+        self, job_id: int, leased_attempts: int, reason: str, next_attempt_at: datetime
+    ) -> bool:
+        self.calls.append("defer")
+        return True
+
+
+class _IngestUnitOfWorkSpy:
+    def __init__(self) -> None:
+        self.ingest_jobs = _IngestJobRepositorySpy()
+
+    async def __aenter__(self) -> "_IngestUnitOfWorkSpy":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+class _MatcherStub:
+    def __init__(self, *args: object) -> None:
+        pass
+
+    async def match_vacancy(self, vacancy_id: VacancyId) -> None:
+        return None
+
+
+def _parse_result(*, is_vacancy: bool = True) -> OutVacancyParse:
+    return OutVacancyParse(
+        is_vacancy=is_vacancy,
+        specializations=[SpecializationType.BACKEND] if is_vacancy else [],
+        skills=[SkillType.PYTHON] if is_vacancy else [],
+    )
+
+
+def _build_job(text: str = _VACANCY_TEXT) -> IngestJob:
+    now = datetime.now(UTC)
+    return IngestJob(
+        id=7,
+        chat_id=-100,
+        message_id=42,
+        text=text,
+        status=IngestJobStatus.PROCESSING,
+        attempts=0,
+        next_attempt_at=now,
+        created_at=now,
+    )
+
+
+class _Pipeline:
+    def __init__(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        *,
+        parse_result: OutVacancyParse,
+        insert_results: list[VacancyId | None | Exception],
+    ) -> None:
+        self.client = _MirrorClientSpy()
+        self.ingest_uow = _IngestUnitOfWorkSpy()
+        vacancies = _VacancyRepositoryStub(insert_results)
+        monkeypatch.setattr(
+            handlers, "VacancyUnitOfWork", lambda session_factory: _VacancyUnitOfWorkStub(vacancies)
+        )
+        monkeypatch.setattr(handlers, "MatcherService", _MatcherStub)
+        self.scraper = TelegramScraper(
+            self.client,  # type: ignore[arg-type]
+            None,  # type: ignore[arg-type]
+            _ExtractorStub(parse_result),
+            NoOpObservabilityService(),
+        )
+        monkeypatch.setattr(self.scraper, "_outbox", self._outbox)
+        monkeypatch.setattr(self.scraper, "_delivery_outbox", lambda: None)
+
+    def _outbox(self) -> IngestOutboxService:
+        return IngestOutboxService(
+            self.ingest_uow,  # type: ignore[arg-type]
+            lease_seconds=60,
+            max_attempts=5,
+        )
+
+    async def warm_up(self) -> None:
+        async def _no_hashes():  # type: ignore[no-untyped-def]
+            return
+            yield
+
+        await self.scraper._content_hashes.warm_up(_no_hashes(), expected_count=0)
+
+    def releases(self, job: IngestJob) -> IngestJob:
+        """Return the job as `lease_due` would hand it back for the next attempt."""
+        mirror = self.ingest_uow.ingest_jobs.mirrors.get(job.id)
+        if mirror is None:
+            return replace(job, attempts=job.attempts + 1)
+        return replace(
+            job,
+            attempts=job.attempts + 1,
+            mirror_chat_id=mirror[0],
+            mirror_message_id=mirror[1],
+        )
+
+
+async def test_rejected_text_is_never_mirrored(monkeypatch: pytest.MonkeyPatch) -> None:
+    pipeline = _Pipeline(
+        monkeypatch, parse_result=_parse_result(is_vacancy=False), insert_results=[]
+    )
+    await pipeline.warm_up()
+
+    await pipeline.scraper._process_job(_build_job())
+
+    assert pipeline.client.forwarded == []
+    assert pipeline.ingest_uow.ingest_jobs.calls == ["done"]
+
+
+async def test_duplicate_text_is_never_mirrored(monkeypatch: pytest.MonkeyPatch) -> None:
+    pipeline = _Pipeline(monkeypatch, parse_result=_parse_result(), insert_results=[])
+    await pipeline.warm_up()
+    pipeline.scraper._content_hashes.add(Vacancy.compute_content_hash(_VACANCY_TEXT).value)
+
+    await pipeline.scraper._process_job(_build_job())
+
+    assert pipeline.client.forwarded == []
+    assert pipeline.ingest_uow.ingest_jobs.calls == ["done"]
+
+
+async def test_near_duplicate_text_is_never_mirrored(monkeypatch: pytest.MonkeyPatch) -> None:
+    pipeline = _Pipeline(monkeypatch, parse_result=_parse_result(), insert_results=[])
+    await pipeline.warm_up()
+    assert pipeline.scraper._simhashes is not None
+    pipeline.scraper._simhashes.add(Vacancy.compute_simhash(_VACANCY_TEXT).value)
+
+    await pipeline.scraper._process_job(_build_job())
+
+    assert pipeline.client.forwarded == []
+    assert pipeline.ingest_uow.ingest_jobs.calls == ["done"]
+
+
+async def test_text_in_flight_elsewhere_is_deferred_unmirrored(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pipeline = _Pipeline(monkeypatch, parse_result=_parse_result(), insert_results=[])
+    await pipeline.warm_up()
+    pipeline.scraper._content_hashes.reserve(Vacancy.compute_content_hash(_VACANCY_TEXT).value)
+
+    await pipeline.scraper._process_job(_build_job())
+
+    assert pipeline.client.forwarded == []
+    assert pipeline.ingest_uow.ingest_jobs.calls == ["defer"]
+
+
+async def test_retry_after_failed_save_reuses_the_mirror_post(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pipeline = _Pipeline(
+        monkeypatch,
+        parse_result=_parse_result(),
+        insert_results=[RuntimeError("database unavailable"), VacancyId(uuid4())],
+    )
+    await pipeline.warm_up()
+    job = _build_job()
+
+    await pipeline.scraper._process_job(job)
+    await pipeline.scraper._process_job(pipeline.releases(job))
+
+    assert pipeline.client.forwarded == [job.message_id]
+    assert pipeline.client.deleted == []
+    assert pipeline.ingest_uow.ingest_jobs.calls == ["retry", "done"]
+
+
+async def test_mirror_post_of_a_duplicate_found_on_save_is_deleted(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pipeline = _Pipeline(monkeypatch, parse_result=_parse_result(), insert_results=[None])
+    await pipeline.warm_up()
+
+    await pipeline.scraper._process_job(_build_job())
+
+    assert pipeline.client.deleted == [1001]
+    assert pipeline.ingest_uow.ingest_jobs.calls == ["done"]
@@ -0,0 +1,99 @@
+import httpx
+import pytest
+
+from app.infrastructure.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from app.infrastructure.llm_runtime import _call_with_breaker
+from app.infrastructure.observability import NoOpObservabilityService
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: _Clock) -> CircuitBreaker:
+    return CircuitBreaker(
+        "gemini",
+        NoOpObservabilityService(),
+        failure_threshold=3,
+        recovery_timeout=30,
+        clock=clock,
+    )
+
+
+def test_circuit_opens_after_consecutive_failures_and_fails_fast() -> None:
+    clock = _Clock()
+    breaker = _breaker(clock)
+
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    clock.now = 10
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_call()
+    assert exc_info.value.retry_in == 20
+
+
+def test_success_resets_failure_streak() -> None:
+    breaker = _breaker(_Clock())
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_allows_single_probe_and_closes_on_success() -> None:
+    clock = _Clock()
+    breaker = _breaker(clock)
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now = 31
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    breaker.before_call()
+
+
+def test_failed_probe_reopens_circuit() -> None:
+    clock = _Clock()
+    breaker = _breaker(clock)
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now = 31
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    clock.now = 40
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+async def test_transport_errors_open_the_circuit() -> None:
+    breaker = _breaker(_Clock())
+
+    async def unreachable() -> None:
+        raise httpx.ConnectError("Name or service not known")
+
+    for _ in range(3):
+        breaker.before_call()
+        with pytest.raises(httpx.ConnectError):
+            await _call_with_breaker(breaker, unreachable)
+
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
@@ -0,0 +1,102 @@
+import asyncio
+from time import monotonic
+
+import pytest
+from pydantic_ai.exceptions import ModelHTTPError
+
+from app.infrastructure.llm_runtime import _retry_after_seconds
+from app.infrastructure.llm_scheduler import LLMPriority, LLMQueueTimeoutError, LLMScheduler
+from app.infrastructure.observability import NoOpObservabilityService
+from app.infrastructure.rate_limit import TokenBucket
+
+
+def _scheduler(max_concurrency: int, reserved: int = 1) -> LLMScheduler:
+    return LLMScheduler(
+        NoOpObservabilityService(),
+        max_concurrency=max_concurrency,
+        requests_per_minute=60_000,
+        tokens_per_minute=100_000_000,
+        interactive_reserved_slots=reserved,
+    )
+
+
+def test_token_bucket_refills_over_time() -> None:
+    now = 0.0
+    bucket = TokenBucket(rate=2, capacity=4, clock=lambda: now)
+
+    assert bucket.try_consume(4) is True
+    assert bucket.try_consume(1) is False
+    assert bucket.wait_time(1) == 0.5
+
+    now = 1.0
+    assert bucket.available == 2
+    bucket.adjust(3)
+    assert bucket.wait_time(1) == 1.0
+
+
+async def test_interactive_calls_jump_the_background_queue() -> None:
+    scheduler = _scheduler(max_concurrency=1)
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def call(name: str, priority: LLMPriority) -> None:
+        async with scheduler.slot(priority, estimated_tokens=100):
+            order.append(name)
+            if name == "first":
+                await release.wait()
+
+    first = asyncio.create_task(call("first", LLMPriority.BACKGROUND))
+    await asyncio.sleep(0)
+    background = asyncio.create_task(call("background", LLMPriority.BACKGROUND))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(call("interactive", LLMPriority.INTERACTIVE))
+    await asyncio.sleep(0)
+    assert scheduler.queued == 2
+
+    release.set()
+    await asyncio.gather(first, background, interactive)
+
+    assert order == ["first", "interactive", "background"]
+
+
+async def test_background_calls_leave_a_slot_for_interactive() -> None:
+    scheduler = _scheduler(max_concurrency=2, reserved=1)
+
+    async with scheduler.slot(LLMPriority.BACKGROUND, estimated_tokens=100):
+        with pytest.raises(LLMQueueTimeoutError):
+            async with scheduler.slot(
+                LLMPriority.BACKGROUND,
+                estimated_tokens=100,
+                deadline=monotonic() + 0.05,
+            ):
+                pass
+        async with scheduler.slot(LLMPriority.INTERACTIVE, estimated_tokens=100):
+            assert scheduler.in_flight == 2
+
+    assert scheduler.queued == 0
+    assert scheduler.in_flight == 0
+
+
+async def test_throttle_delays_admission() -> None:
+    scheduler = _scheduler(max_concurrency=2)
+    scheduler.throttle("vacancy_parse", 0.1)
+    started = monotonic()
+
+    async with scheduler.slot(LLMPriority.INTERACTIVE, estimated_tokens=100):
+        waited = monotonic() - started
+
+    assert waited >= 0.09
+
+
+def test_retry_after_is_read_from_gemini_error_body() -> None:
+    body = {
+        "error": {
+            "code": 429,
+            "details": [
+                {"@type": "type.googleapis.com/google.rpc.RetryInfo", "retryDelay": "17s"},
+            ],
+        }
+    }
+
+    assert _retry_after_seconds(ModelHTTPError(429, "gemini", body)) == 17.0
+    assert _retry_after_seconds(ModelHTTPError(503, "gemini", "overloaded")) is None